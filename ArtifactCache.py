@@ -0,0 +1,313 @@
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import is_dataclass, asdict
+from enum import Enum
+from hashlib import sha256
+from pathlib import Path
+from shutil import copyfile
+from time import time, sleep
+from numpy import ndarray
+
+"""
+Content-addressed cache of artifacts of all stages (geometry, mesh, case files).
+An entry is found by the hash of the canonical parameters of the stage and maps roles
+(e.g. "fmd", "msh.h5") to stored files, which are named by the hash of their content.
+"""
+
+
+ARTIFACT_CACHE = Path(__file__).resolve().parent / "artifact_cache"
+CACHE_VERSION = 1
+
+
+def file_checksum(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute SHA-256 of a file.
+
+    Args:
+        path (Path): the file
+        chunk_size (int): number of bytes read at once
+    Return:
+        str: hex digest
+    """
+    digest = sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def checksum_path(path: Path) -> Path:
+    """
+    Get path of the checksum file of an artifact.
+
+    Args:
+        path (Path): the artifact
+    Return:
+        Path: the checksum file, e.g. model.fmd.sha256
+    """
+    return path.with_name(path.name + ".sha256")
+
+
+def write_checksum(path: Path, checksum: str | None = None):
+    """
+    Write the checksum file of an artifact, it marks the artifact as complete.
+
+    Args:
+        path (Path): the artifact
+        checksum (str | None): SHA-256 of the artifact if already known
+    """
+    checksum = checksum if checksum is not None else file_checksum(path)
+    checksum_file = checksum_path(path)
+    checksum_file.unlink(missing_ok=True)
+    checksum_file.write_text(f"{checksum}  {path.name}\n")
+
+
+def canonical(value):
+    """
+    Convert parameters to a JSON-serializable form which does not depend on the object identity,
+    e.g. dataclasses to dicts, quantities to (magnitude, units) and arrays to lists.
+
+    Args:
+        value: parameters
+    Return:
+        the canonical form
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return canonical(asdict(value))
+    if isinstance(value, dict):
+        return {str(key): canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, ndarray):
+        return value.tolist()
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Path):
+        return value.as_posix()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "magnitude") and hasattr(value, "units"):
+        return [canonical(value.magnitude), str(value.units)]
+    if hasattr(value, "value"):
+        return canonical(value.value)  # Distance, Angle
+    if hasattr(value, "__dict__"):
+        return canonical(vars(value))
+    return repr(value)
+
+
+class ArtifactCache:
+    """
+    ArtifactCache is a class for content-addressed storage of stage artifacts.
+    Identical files are stored once, entries are evicted in least recently used order
+    when the stored files exceed max_bytes. Entries are kept in an index file.
+    """
+    def __init__(self, directory: Path = ARTIFACT_CACHE, max_bytes: int = 20 * 1024 ** 3):
+        """
+        ArtifactCache class constructor.
+
+        Args:
+            directory (Path): directory of the cache
+            max_bytes (int): maximum size of stored files
+        """
+        if not max_bytes > 0:
+            raise ValueError(f"\'max_bytes\' parameter should be positive, got {max_bytes}")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(stage: str, params: dict) -> str:
+        """
+        Hash the canonical parameters of a stage.
+
+        Args:
+            stage (str): stage name, e.g. "geometry", "mesh" or "case"
+            params (dict): all parameters which change the artifacts, e.g. hash of the input artifact
+        Return:
+            str: the key
+        """
+        content = {"stage": stage, "version": CACHE_VERSION, "params": canonical(params)}
+        return sha256(json.dumps(content, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def __object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    @contextmanager
+    def __locked(self, timeout: float = 60.0):
+        """
+        Hold the lock of the index, so concurrent jobs do not overwrite each other's entries.
+        A lock older than the timeout is considered stale and removed.
+
+        """
+        lock = self.directory / "index.lock"
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time() - lock.stat().st_mtime > timeout:
+                        lock.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass
+                sleep(0.05)
+        try:
+            yield
+        finally:
+            lock.unlink(missing_ok=True)
+
+    def __read_index(self) -> dict:
+        if not self._index_path.is_file():
+            return dict()
+        return json.loads(self._index_path.read_text())
+
+    def __write_index(self, index: dict):
+        tmp = self._index_path.with_name(f".index.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, indent=1))
+        os.replace(tmp, self._index_path)
+
+    def __entry(self, key: str) -> dict | None:
+        """
+        Get an entry with all its files stored and mark it as recently used.
+
+        """
+        with self.__locked():
+            index = self.__read_index()
+            entry = index.get(key)
+            if entry is None or not all(self.__object_path(digest).is_file() for digest in entry["files"].values()):
+                self.misses += 1
+                return None
+
+            entry["last_used"] = time()
+            self.__write_index(index)
+
+        self.hits += 1
+        return entry
+
+    def get(self, key: str) -> dict[str, Path] | None:
+        """
+        Get stored files of an entry and mark it as recently used.
+
+        Args:
+            key (str): the key
+        Return:
+            dict[str, Path] | None: stored file of every role (read only), None on a miss
+        """
+        entry = self.__entry(key)
+        if entry is None:
+            return None
+        return {role: self.__object_path(digest) for role, digest in entry["files"].items()}
+
+    def fetch(self, key: str, roles: tuple[str, ...], directory: Path) -> dict[str, Path] | None:
+        """
+        Copy stored files of an entry to a directory under their original names, with checksum files.
+
+        Args:
+            key (str): the key
+            roles (tuple[str, ...]): needed roles
+            directory (Path): destination directory
+        Return:
+            dict[str, Path] | None: copied file of every role, None if any role is missing
+        """
+        entry = self.__entry(key)
+        if entry is None or not all(role in entry["files"] for role in roles):
+            return None
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        copied = dict()
+        for role in roles:
+            digest = entry["files"][role]
+            destination = directory / entry["names"][role]
+            tmp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+            copyfile(self.__object_path(digest), tmp)
+            os.replace(tmp, destination)
+            write_checksum(destination, digest)
+            copied[role] = destination
+        return copied
+
+    def put(self, key: str, files: dict[str, Path]):
+        """
+        Store files under an entry, files of other roles already stored under the entry are kept.
+
+        Args:
+            key (str): the key
+            files (dict[str, Path]): file of every role
+        """
+        digests = {role: file_checksum(path) for role, path in files.items()}
+        staged = dict()
+        for role, path in files.items():
+            digest = digests[role]
+            target = self.__object_path(digest)
+            if not target.is_file() and digest not in staged:
+                # identical content is stored once, copied outside the lock (eviction skips hidden files)
+                target.parent.mkdir(exist_ok=True)
+                staged[digest] = target.with_name(f".{digest}.{os.getpid()}.tmp")
+                copyfile(path, staged[digest])
+
+        with self.__locked():
+            # objects are published under the lock, eviction in another process can not remove them before
+            # the index refers to them
+            for role, path in files.items():
+                digest = digests[role]
+                target = self.__object_path(digest)
+                tmp = staged.pop(digest, None)
+                if tmp is None and not target.is_file():
+                    # removed by eviction since the check above
+                    target.parent.mkdir(exist_ok=True)
+                    tmp = target.with_name(f".{digest}.{os.getpid()}.tmp")
+                    copyfile(path, tmp)
+                if tmp is not None:
+                    os.replace(tmp, target)
+
+            index = self.__read_index()
+            entry = index.setdefault(key, {"files": dict(), "names": dict()})
+            entry["files"].update(digests)
+            entry["names"].update({role: Path(path).name for role, path in files.items()})
+            entry["last_used"] = time()
+            self.__evict(index, protected=key)
+            self.__write_index(index)
+
+    def __evict(self, index: dict, protected: str):
+        """
+        Remove least recently used entries until stored files fit in max_bytes,
+        then remove files which no entry refers to.
+
+        """
+        def size(digests: set[str]) -> int:
+            paths = [self.__object_path(digest) for digest in digests]
+            return sum(path.stat().st_size for path in paths if path.is_file())
+
+        referenced = {digest for entry in index.values() for digest in entry["files"].values()}
+        total = size(referenced)
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == protected:
+                continue
+            entry = index.pop(key)
+            still_referenced = {digest for other in index.values() for digest in other["files"].values()}
+            total -= size(set(entry["files"].values()) - still_referenced)
+
+        referenced = {digest for entry in index.values() for digest in entry["files"].values()}
+        for path in (self.directory / "objects").glob("*/*"):
+            if path.name not in referenced and not path.name.startswith("."):
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """
+        Remove all entries and stored files.
+
+        """
+        with self.__locked():
+            self.__write_index(dict())
+            self.__evict(dict(), protected="")
@@ -1,12 +1,18 @@
 from ansys.fluent.core import launch_fluent, FluentMode, Dimension, Precision, Solver
-from Fluent.misc.PATHS import MESH_3D, WORK_DIR
+from Fluent.misc.PATHS import MESH_2D, MESH_3D, WORK_DIR
+from ArtifactCache import ArtifactCache, file_checksum
 
 
 class Session:
     """
     This class is used to manage the Fluent session.
     """
-    def __init__(self, processor_count: int = 2):
+    def __init__(self,
+                 processor_count: int = 2,
+                 mesh_file_name: str = "wind_turbine.msh.h5",
+                 cache: ArtifactCache | None = None,
+                 setup: dict | None = None,
+                 model_type: str = "3D"):
         """
         Session class constructor.
 
@@ -14,9 +20,25 @@ class Session:
             processor_count (int): Number of processors. The default is None, in which case 1 processor is used.
                                    In job scheduler environments the total number of allocated cores is clamped
                                    to value of processor_count.
+            mesh_file_name (str): name of the mesh file in Mesh/results/mesh_2d or Mesh/results/mesh_3d
+            cache (ArtifactCache | None): artifact cache, a case with the same mesh and setup is read instead of the mesh
+            setup (dict | None): all setup params of the case, required with the cache
+            model_type (str): 2D or 3D, a 2D mesh is solved in 2D mode
         """
+        if cache is not None and setup is None:
+            raise ValueError("'setup' parameter is required with the cache")
+        if model_type.upper() not in ("2D", "3D"):
+            raise ValueError(f"\'model_type\' parameter should be 2D or 3D, got {model_type}")
+
+        self._model_type = model_type.upper()
+        self._mesh_path = (MESH_3D if self._model_type == "3D" else MESH_2D) / mesh_file_name
+        self._cache = cache
+        self._case_key = ArtifactCache.key("case", {"mesh": file_checksum(self._mesh_path), "setup": setup}) \
+            if cache is not None else None
+        self._case_restored = False
+
         # initialize solver session
-        self._session: Solver = self.__session(processor_count=processor_count)
+        self._session: Solver = self.__session(processor_count=processor_count, model_type=self._model_type)
         print("Successfully launched")
 
         # initialize workflow and task
@@ -36,8 +58,28 @@ class Session:
         """
         return self._session
 
+    @property
+    def case_restored(self) -> bool:
+        """
+        Check whether a set up case was read from the cache, so the setup can be skipped.
+
+        Return:
+            bool: True if the case was read from the cache
+        """
+        return self._case_restored
+
+    @property
+    def model_type(self) -> str:
+        """
+        Get model type.
+
+        Return:
+            str: 2D or 3D
+        """
+        return self._model_type
+
     @staticmethod
-    def __session(processor_count: int = 2) -> Solver:
+    def __session(processor_count: int = 2, model_type: str = "3D") -> Solver:
         """
         Run the Solver session with given parameters.
 
@@ -49,7 +91,7 @@ class Session:
             mode=FluentMode.SOLVER,
             precision=Precision.DOUBLE,
             processor_count=processor_count,
-            dimension=Dimension.THREE,
+            dimension=Dimension.THREE if model_type == "3D" else Dimension.TWO,
             cwd=str(WORK_DIR),
             py=True,
             ui_mode="gui"
@@ -78,13 +120,34 @@ class Session:
 
     def __import_mesh(self):
         """
-        Import mesh.h5 file.
+        Import mesh.h5 file, or the set up case if it is cached.
         """
+        if self._cache is not None:
+            restored = self._cache.fetch(self._case_key, ("cas.h5",), WORK_DIR)
+            if restored is not None:
+                print("Reading cached .cas.h5 file...")
+                self._session.settings.file.read_case(file_name=str(restored["cas.h5"]))
+                self._case_restored = True
+                print("Read success")
+                return
+
         print("Reading .msh.h5 file...")
-        file_path = str(MESH_3D / "wind_turbine.msh.h5")
-        self._session.settings.file.read_mesh(file_name=file_path)
+        self._session.settings.file.read_mesh(file_name=str(self._mesh_path))
         print("Read success")
 
+    def save_case(self, file_name: str):
+        """
+        Write the set up case into the work directory, and into the cache if it is used.
+
+        Args:
+            file_name (str): raw file name (without extension)
+        """
+        path = WORK_DIR / f"{file_name}.cas.h5"
+        print("Writing .cas.h5 file...")
+        self._session.settings.file.write_case(file_name=str(path))
+        if self._cache is not None:
+            self._cache.put(self._case_key, {"cas.h5": path})
+
     def exit(self):
         """
         Exit the Fluent session.
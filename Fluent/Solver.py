@@ -1,4 +1,5 @@
 from Fluent.Session import Session
+from ArtifactCache import ArtifactCache
 
 
 class SolverMode(Session):
@@ -8,7 +9,10 @@ class SolverMode(Session):
     def __init__(self,
                  processor_count: int = 2,
                  inlet_velocity: float = 10.0,
-                 rpm: float = 10.0):
+                 rpm: float = 10.0,
+                 cache: ArtifactCache | None = None,
+                 model_type: str = "3D",
+                 n_sectors: int = 1):
         """
         Solver class constructor.
 
@@ -18,9 +22,20 @@ class SolverMode(Session):
                                    to value of processor_count.
             inlet_velocity (float): the inlet velocity in m/s
             rpm (float): rotate per minute
+            cache (ArtifactCache | None): artifact cache of set up cases
+            model_type (str): 2D or 3D
+            n_sectors (int): number of airfoils of a sector model (one blade passage with periodic sides),
+                             1 for the full rotor. Torque and power are scaled to the full rotor
         """
-        # initialize session class
-        Session.__init__(self, processor_count=processor_count)
+        if not (isinstance(n_sectors, int) and n_sectors > 0):
+            raise ValueError(f"\'n_sectors\' parameter should be positive int, got {n_sectors}")
+
+        # initialize session class, the setup is the same for the same inlet velocity and rpm
+        setup = {"inlet_velocity": inlet_velocity, "rpm": rpm, "viscous": "k-omega sst", "model_type": model_type,
+                 "n_sectors": n_sectors}
+        Session.__init__(self, processor_count=processor_count, cache=cache, setup=setup, model_type=model_type)
+
+        self._n_sectors = n_sectors
 
         # set inlet velocity and rpm
         self._inlet_velocity = inlet_velocity  # m/s
@@ -58,7 +73,12 @@ class SolverMode(Session):
     def define_boundary_condition(self):
         """
         Define boundary conditions (inlet, outlet, symmetry, wall and interface) with some default parameters.
+        A sector model gets farfield, symmetry, wall and periodic boundary conditions instead.
         """
+        if self._n_sectors > 1:
+            self.__define_sector_boundary_condition()
+            return
+
         # inlet boundary condition
         self.setup.boundary_conditions.set_zone_type(zone_list=["inlet"], new_type="velocity-inlet")
         inlet = self.setup.boundary_conditions.velocity_inlet["inlet"]
@@ -76,18 +96,122 @@ class SolverMode(Session):
         outlet.turbulence.backflow_turbulent_intensity.set_state(0.05)
         outlet.turbulence.backflow_turbulent_viscosity_ratio.set_state(10)
 
-        # symmetry boundary condition
-        self.setup.boundary_conditions.set_zone_type(
-            zone_list=["symmetry_symmetry_symmetry", "symmetry_symmetry_symmetry_7", "symmetry_symmetry_symmetry_8"],
-            new_type="symmetry"
-        )
+        # symmetry boundary condition on all cap zones of the extruded model (a 2D model has none)
+        if self.model_type == "3D":
+            symmetry = [name for name in self.setup.boundary_conditions.wall.get_object_names()
+                        if name.startswith("symmetry")]
+            self.setup.boundary_conditions.set_zone_type(zone_list=symmetry, new_type="symmetry")
 
         # wall boundary condition
         self.setup.boundary_conditions.set_zone_type(zone_list=["wall"], new_type="wall")
 
         # interface boundary condition
-        self.setup.mesh_interfaces.interface.create(name="interface_1", zone1="wall_12", zone2="wall_10")
-        self.setup.mesh_interfaces.interface.create(name="interface_2", zone1="interface-10", zone2="wall_11")
+        self.__create_interfaces()
+
+    def __create_interfaces(self, periodic_repeats: bool = False):
+        """
+        Create the mesh interfaces between the ring and the other regions on its outer and inner circle.
+        Zones are found by name, their ids change with the mesh.
+
+        Args:
+            periodic_repeats (bool): whether the interfaces repeat periodically, for a sector model
+        """
+        for i, side in enumerate(("outer", "inner"), start=1):
+            zones = self.__interface_zones(side)
+            if zones is None:
+                print(f"No {side} interface zones, the regions are conformal")
+                continue
+            if periodic_repeats:
+                self.setup.mesh_interfaces.interface.create(name=f"interface_{i}", zone1=zones[0], zone2=zones[1],
+                                                            periodic_repeats=True)
+            else:
+                self.setup.mesh_interfaces.interface.create(name=f"interface_{i}", zone1=zones[0], zone2=zones[1])
+
+    def __interface_zones(self, side: str, ring_name: str = "fluid-2") -> tuple[str, str] | None:
+        """
+        Find the zones of the interface between the ring and the other region on one circle,
+        named interface-<side>-<region> by Meshing.create_interface_zones.
+
+        Args:
+            side (str): outer or inner circle of the ring
+            ring_name (str): name of the ring region
+        Return:
+            tuple[str, str] | None: zone of the ring and zone of the other region, None if there are no zones
+
+        Raise:
+            ValueError: the circle has not exactly one zone of the ring and one of the other region
+        """
+        walls = self.setup.boundary_conditions.wall.get_object_names()
+        zones = [name for name in walls if f"interface-{side}-" in name]
+        if not zones:
+            return None
+
+        ring = [name for name in zones if f"interface-{side}-{ring_name}" in name]
+        other = [name for name in zones if name not in ring]
+        if len(ring) != 1 or len(other) != 1:
+            raise ValueError(f"{side} interface should have one zone of {ring_name} and one of the other region, "
+                             f"got {zones}")
+        return ring[0], other[0]
+
+    def __define_sector_boundary_condition(self):
+        """
+        Define boundary conditions of a sector model (rotor-alone, in still air):
+        farfield as pressure outlet, symmetry on caps (3D), wall, interfaces of the ring
+        and rotational periodic sides.
+        """
+        # farfield boundary condition
+        self.setup.boundary_conditions.set_zone_type(zone_list=["farfield"], new_type="pressure-outlet")
+        farfield = self.setup.boundary_conditions.pressure_outlet["farfield"]
+        farfield.momentum.backflow_reference_frame.set_state("Absolute")
+        farfield.momentum.gauge_pressure.set_state(0.0)
+        farfield.momentum.backflow_dir_spec_method.set_state("Normal to Boundary")
+        farfield.turbulence.backflow_turbulent_intensity.set_state(0.05)
+        farfield.turbulence.backflow_turbulent_viscosity_ratio.set_state(10)
+
+        # symmetry boundary condition on all cap zones
+        if self.model_type == "3D":
+            symmetry = [name for name in self.setup.boundary_conditions.wall.get_object_names()
+                        if name.startswith("symmetry")]
+            self.setup.boundary_conditions.set_zone_type(zone_list=symmetry, new_type="symmetry")
+
+        # wall boundary condition
+        self.setup.boundary_conditions.set_zone_type(zone_list=["wall"], new_type="wall")
+
+        # interfaces between the ring sector and the outer and inner sectors, repeated as the sides are periodic
+        self.__create_interfaces(periodic_repeats=True)
+
+        # periodic boundary condition of every region, rotation about the Z axis by 360 / n_sectors degrees
+        for periodic_zone_name, shadow_zone_name in self.__periodic_pairs():
+            self.session.settings.mesh.modify_zones.make_periodic(
+                periodic_zone_name=periodic_zone_name,
+                shadow_zone_name=shadow_zone_name,
+                rotate_periodic=True,
+                create_periodic=True,
+                auto_translation=True
+            )
+
+    def __periodic_pairs(self) -> list[tuple[str, str]]:
+        """
+        Pair periodic-1 and periodic-2 zones of the same region.
+        Every region exports its own periodic zones with a suffix, e.g. periodic-1_3 of fluid-2.
+        Zones are paired by the same suffix, otherwise in the order of names.
+
+        Return:
+            list[tuple[str, str]]: periodic and shadow zone names
+
+        Raise:
+            ValueError: the numbers of periodic-1 and periodic-2 zones differ
+        """
+        walls = self.setup.boundary_conditions.wall.get_object_names()
+        periodic = sorted(name for name in walls if "periodic-1" in name)
+        shadow = sorted(name for name in walls if "periodic-2" in name)
+        if len(periodic) != len(shadow) or not periodic:
+            raise ValueError(f"periodic zones should be in pairs, got {periodic} and {shadow}")
+
+        by_suffix = {name.replace("periodic-2", "periodic-1"): name for name in shadow}
+        if all(name in by_suffix for name in periodic):
+            return [(name, by_suffix[name]) for name in periodic]
+        return list(zip(periodic, shadow))
 
     def create_named_expressions(self):
         """
@@ -96,6 +220,7 @@ class SolverMode(Session):
         - inlet velocity
         - outlet pressure
         - TSR
+        - torque (of the full rotor)
         - power
         - efficiency
         """
@@ -122,10 +247,15 @@ class SolverMode(Session):
         tsr = self.setup.named_expressions["TSR"]
         tsr.definition.set_state("rpm*1[m]/velocity_inlet*1[rad^-1]")
 
+        # Torque named expression, a sector model has 1 / n_sectors of the blades
+        self.setup.named_expressions.create("Torque")
+        torque = self.setup.named_expressions["Torque"]
+        torque.definition.set_state(f"{self._n_sectors}*total_moment")
+
         # Power named expression
         self.setup.named_expressions.create("Power")
         power = self.setup.named_expressions["Power"]
-        power.definition.set_state("rpm*total_moment")
+        power.definition.set_state("rpm*Torque")
 
         # Efficiency named expression
         self.setup.named_expressions.create("Efficiency")
@@ -146,7 +276,7 @@ class SolverMode(Session):
         # mass-balance report def and plot
         report_definition.flux.create("mass-balance")
         mass_balance = report_definition.flux["mass-balance"]
-        mass_balance.boundaries.set_state(("inlet", "outlet"))
+        mass_balance.boundaries.set_state(("inlet", "outlet") if self._n_sectors == 1 else ("farfield",))
         mass_balance.create_report_plot.set_state("mass-balance-rplot")
 
         # total_moment report def and plot
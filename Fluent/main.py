@@ -1,30 +1,38 @@
 from Solver import SolverMode
+from ArtifactCache import ArtifactCache
 from time import sleep
 
-# --- Run the Fluent session in solver mode --- #
+# --- Run the Fluent session in solver mode (reads a cached case with the same mesh and setup) --- #
 solver = SolverMode(
     processor_count=2,
     inlet_velocity=12,  # m/s
-    rpm=10  # rev/min
+    rpm=10,  # rev/min
+    cache=ArtifactCache(),
+    model_type="3D",  # 2D for fast screening runs, reads the mesh from Mesh/results/mesh_2d
+    n_sectors=1  # number of airfoils of a sector model (Geometry sector_mode), 1 for the full rotor
 )
 
-# --- Set general settings --- #
-solver.set_general_settings()
+if not solver.case_restored:
+    # --- Set general settings --- #
+    solver.set_general_settings()
 
-# --- Select the SST k-omega model --- #
-solver.select_model()
+    # --- Select the SST k-omega model --- #
+    solver.select_model()
 
-# --- Define boundary conditions (inlet, outlet, symmetry, wall and interface) --- #
-solver.define_boundary_condition()
+    # --- Define boundary conditions (inlet, outlet, symmetry, wall and interface) --- #
+    solver.define_boundary_condition()
 
-# --- Create named expressions (inlet_velocity, outlet_pressure, rpm, power, efficiency, TSR) --- #
-solver.create_named_expressions()
+    # --- Create named expressions (inlet_velocity, outlet_pressure, rpm, power, efficiency, TSR) --- #
+    solver.create_named_expressions()
 
-# --- Create reports and plots (mass_balance, total_moment, power, efficiency) --- #
-solver.create_report_def_and_plots()
+    # --- Create reports and plots (mass_balance, total_moment, power, efficiency) --- #
+    solver.create_report_def_and_plots()
 
-# --- Create cell zone condition (rotation of the ring and inner circle) --- #
-solver.define_cell_zone_conditions()
+    # --- Create cell zone condition (rotation of the ring and inner circle) --- #
+    solver.define_cell_zone_conditions()
+
+    # --- Write the set up case --- #
+    solver.save_case("wind_turbine")
 
 # --- Run initializer --- #
 solver.initialize(init_iter=10)
@@ -5,6 +5,7 @@ FLUENT = Path(__file__).resolve().parent.parent
 
 MESH = FLUENT.parent / "Mesh"
 
+MESH_2D = MESH / 'results' / 'mesh_2d'
 MESH_3D = MESH / 'results' / 'mesh_3d'
 
 WORK_DIR = FLUENT / "work_directory"
@@ -1,21 +1,33 @@
 from ansys.geometry.core.math import Point2D
-from numpy import sin, cos, arctan, pi
+from numpy import ndarray, array, asarray, float64
+from Geometry.misc.naca import SPACINGS, stations, thickness_distribution, naca4_surfaces, closed_contour
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.misc.resampling import ResamplingReport, adaptive_indices, segment_deviation
+from Geometry.misc.section import SectionProperties, section_properties
 
 
 class Airfoil:
     """
     Airfoil class description.
     """
-    def __init__(self, number: str | int, n_points: str | int = 200):
+    def __init__(self,
+                 number: str | int,
+                 n_points: str | int = 200,
+                 spacing: str = "cosine",
+                 cache: AirfoilCache | None = None):
         self.__validate_number(number)
         self.__validate_n_points(n_points)
+        self.__validate_spacing(spacing)
         self.number = int(number)
         self.n_points = int(n_points)
+        self.spacing = spacing
+        self.cache = cache
 
         self.m, self.p, self.t = None, None, None
         self.__calculate_naca_digits()
 
-        self._points = []
+        self._coordinates: ndarray | None = None
+        self._points: list[Point2D] | None = None
 
     @staticmethod
     def __validate_number(number):
@@ -51,6 +63,20 @@ class Airfoil:
         if not int(n_points) > 0:
             raise ValueError(f"\'n_points\' parameter should be positive, got {n_points}")
 
+    @staticmethod
+    def __validate_spacing(spacing):
+        """
+        Validate "spacing" parameter.
+
+        Args:
+            spacing (str): spacing law of the chord stations
+
+        Raise:
+            ValueError: spacing is not supported
+        """
+        if spacing not in SPACINGS:
+            raise ValueError(f"\'spacing\' parameter should be one of {list(SPACINGS)}, got {spacing}")
+
     def __calculate_naca_digits(self):
         """
         Calculate NACA 4-digits parameters.
@@ -59,67 +85,119 @@ class Airfoil:
         self.p = self.number // 100 % 10 * 0.1
         self.t = self.number % 100 * 0.01
 
-    def generate_points(self) -> list[Point2D]:
-        """
-            Generate a NACA 4-digits airfoil.
-
-            Return:
-                list[Point2D]: List of points that define the airfoil
-            """
-        for i in range(self.n_points):
-
-            # Make it an exponential distribution so the points are more concentrated
-            # near the leading edge
-            x = (1 - cos(i / (self.n_points - 1) * pi)) / 2
-
-            # Check if it is a symmetric airfoil
-            if self.p == 0 and self.m == 0:
-                # Camber line is zero in this case
-                yc = 0
-                dyc_dx = 0
-            else:
-                # Compute the camber line
-                if x < self.p:
-                    yc = self.m / self.p ** 2 * (2 * self.p * x - x ** 2)
-                    dyc_dx = 2 * self.m / self.p ** 2 * (self.p - x)
-                else:
-                    yc = self.m / (1 - self.p) ** 2 * ((1 - 2 * self.p) + 2 * self.p * x - x ** 2)
-                    dyc_dx = 2 * self.m / (1 - self.p) ** 2 * (self.p - x)
-
-            # Compute the thickness
-            yt = 5 * self.t * (0.2969 * x ** 0.5
-                               - 0.1260 * x
-                               - 0.3516 * x ** 2
-                               + 0.2843 * x ** 3
-                               - 0.1015 * x ** 4)
-
-            # Compute the angle
-            theta = arctan(dyc_dx)
-
-            # Compute the points (upper and lower side of the airfoil)
-            xu = x - yt * sin(theta)
-            yu = yc + yt * cos(theta)
-            xl = x + yt * sin(theta)
-            yl = yc - yt * cos(theta)
-
-            # Append the points
-            self._points.append(Point2D([xu, yu]))
-            self._points.insert(0, Point2D([xl, yl]))
-
-            # Remove the first point since it is repeated
-            if i == 0:
-                self._points.pop(0)
-        self._points.append(self._points[0])
-        return self._points
+    def generate_points(self) -> ndarray:
+        """
+        Generate a NACA 4-digits airfoil.
+        All stations are computed at once, calling it again simply regenerates the same contour.
+        If a cache is set, points are taken from it when available.
+
+        Return:
+            ndarray: (2 * n_points - 1, 2) array of points, from the lower trailing edge,
+                     through the leading edge, to the upper trailing edge
+        """
+        key = AirfoilCache.key(self.number, self.n_points, self.spacing)
+        coordinates = self.cache.get(key) if self.cache is not None else None
+
+        if coordinates is None:
+            x = stations(self.n_points, self.spacing)
+            yt = thickness_distribution(x, self.t)
+            upper, lower = naca4_surfaces(x, yt, self.m, self.p)
+            coordinates = closed_contour(upper, lower)
+
+            if self.cache is not None:
+                self.cache.put(key, coordinates)
+
+        self.coordinates = coordinates
+        return self._coordinates
+
+    def generate_adaptive_points(self, tolerance: float, n_reference: int = 2000) -> ResamplingReport:
+        """
+        Generate a NACA 4-digits airfoil with the fewest points placed by local curvature.
+        The polyline stays within tolerance from a dense reference contour.
+
+        Args:
+            tolerance (float): maximum deviation from the airfoil, relative to the chord
+            n_reference (int): number of stations of the dense reference contour
+        Return:
+            ResamplingReport: achieved number of points and maximum deviation
+        """
+        if not tolerance > 0:
+            raise ValueError(f"\'tolerance\' parameter should be positive, got {tolerance}")
+
+        # dense reference contour
+        self.coordinates = Airfoil(f"{self.number:04d}", n_reference, "cosine", self.cache).generate_points()
+        return self.resample_adaptive(tolerance)
+
+    def resample_adaptive(self, tolerance: float) -> ResamplingReport:
+        """
+        Keep the fewest of the current points placed by local curvature, e.g. of points generated by AirfoilFamily.
+        The polyline stays within tolerance from the current contour, which should be dense.
+
+        Args:
+            tolerance (float): maximum deviation from the current contour, relative to the chord
+        Return:
+            ResamplingReport: achieved number of points and maximum deviation
+        """
+        if not tolerance > 0:
+            raise ValueError(f"\'tolerance\' parameter should be positive, got {tolerance}")
+        if self._coordinates is None:
+            self.generate_points()
+
+        # the leading edge is always kept
+        reference = self._coordinates
+        indices = adaptive_indices(reference, tolerance, keep=[(len(reference) - 1) // 2])
+
+        self.coordinates = reference[indices]
+        return ResamplingReport(
+            n_points=len(indices),
+            max_deviation=float(segment_deviation(reference, indices).max()),
+            tolerance=tolerance
+        )
+
+    def section_properties(self) -> SectionProperties:
+        """
+        Compute section properties (area, centroid, second moments and chord line) from the points.
+        Points are generated if they were not generated yet.
+
+        Return:
+            SectionProperties: section properties of the airfoil
+        """
+        if self._coordinates is None:
+            self.generate_points()
+        return section_properties(self._coordinates)
+
+    @property
+    def coordinates(self) -> ndarray | None:
+        """
+        Return points that define the airfoil as an array.
+
+        Return:
+            ndarray | None: (n, 2) array of points, None if points were not generated
+        """
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: ndarray):
+        """
+        Set new points as an array.
+
+        Args:
+            coordinates (ndarray): (n, 2) array of new points
+        """
+        self._coordinates = asarray(coordinates, dtype=float64)
+        self._points = None
 
     @property
     def points(self) -> list[Point2D]:
         """
         Return List of points that define the airfoil.
+        Points are created from coordinates on first access.
 
-        Args:
+        Return:
             list[Point2D]: List of points that define the airfoil
         """
+        if self._points is None:
+            self._points = [] if self._coordinates is None else [Point2D(xy) for xy in self._coordinates.tolist()]
         return self._points
 
     @points.setter
@@ -130,4 +208,5 @@ class Airfoil:
         Args:
             points (list[Point2D]): list of new points to set
         """
+        self._coordinates = array([[point.x.m, point.y.m] for point in points], dtype=float64).reshape(-1, 2)
         self._points = points
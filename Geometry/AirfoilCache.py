@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from pathlib import Path
+from os import replace, getpid
+from numpy import ndarray, load, savez
+from Geometry.misc.PATHS import AIRFOIL_CACHE
+
+
+class AirfoilCache:
+    """
+    AirfoilCache is a two-level cache of generated airfoil points.
+    The first level is an in-process LRU limited by memory, the second one is an .npz store on disk.
+    """
+    def __init__(self, max_bytes: int = 64 * 2 ** 20, directory: Path | None = AIRFOIL_CACHE):
+        """
+        AirfoilCache class constructor.
+
+        Args:
+            max_bytes (int): memory limit of the in-process level
+            directory (Path | None): directory of the on-disk level, None disables it
+        """
+        self.__validate_max_bytes(max_bytes)
+        self.max_bytes = max_bytes
+        self.directory = directory
+
+        self._memory: OrderedDict[tuple[int, int, str], ndarray] = OrderedDict()
+        self._n_bytes = 0
+
+        # counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def __validate_max_bytes(max_bytes):
+        """
+        Validate "max_bytes" parameter.
+
+        Raise:
+            ValueError: max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError(f"\'max_bytes\' parameter should not be negative, got {max_bytes}")
+
+    @staticmethod
+    def key(number: int, n_points: int, spacing: str) -> tuple[int, int, str]:
+        """
+        Build a cache key.
+
+        Args:
+            number (int): NACA 4-digit code
+            n_points (int): number of stations
+            spacing (str): spacing law of the stations
+        Return:
+            tuple[int, int, str]: the key
+        """
+        return int(number), int(n_points), spacing
+
+    def __file(self, key: tuple[int, int, str]) -> Path:
+        """
+        Get the path of a key in the on-disk level.
+        """
+        number, n_points, spacing = key
+        return self.directory / f"naca{number:04d}_{n_points}_{spacing}.npz"
+
+    def get(self, key: tuple[int, int, str]) -> ndarray | None:
+        """
+        Get points from the cache.
+
+        Args:
+            key (tuple[int, int, str]): key created by AirfoilCache.key
+        Return:
+            ndarray | None: read-only array of points, None if not cached
+        """
+        # in-process level
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return self._memory[key]
+
+        # on-disk level
+        if self.directory is not None and self.__file(key).is_file():
+            with load(self.__file(key)) as data:
+                coordinates = data["coordinates"]
+            self.__remember(key, coordinates)
+            self.disk_hits += 1
+            return coordinates
+
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple[int, int, str], coordinates: ndarray):
+        """
+        Put points into both levels of the cache.
+
+        Args:
+            key (tuple[int, int, str]): key created by AirfoilCache.key
+            coordinates (ndarray): array of points
+        """
+        coordinates = coordinates.copy()
+        self.__remember(key, coordinates)
+
+        if self.directory is not None:
+            # write to a temporary file first, so other workers never read a partial file
+            path = self.__file(key)
+            tmp_path = path.with_suffix(f".{getpid()}.tmp.npz")
+            savez(tmp_path, coordinates=coordinates)
+            replace(tmp_path, path)
+
+    def __remember(self, key: tuple[int, int, str], coordinates: ndarray):
+        """
+        Put points into the in-process level and evict the least recently used ones above the memory limit.
+        """
+        coordinates.setflags(write=False)
+
+        if key in self._memory:
+            self._n_bytes -= self._memory.pop(key).nbytes
+        self._memory[key] = coordinates
+        self._n_bytes += coordinates.nbytes
+
+        while self._n_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._n_bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def clear(self, disk: bool = False):
+        """
+        Clear the cache.
+
+        Args:
+            disk (bool): whether to remove the on-disk level as well
+        """
+        self._memory.clear()
+        self._n_bytes = 0
+
+        if disk and self.directory is not None:
+            for path in self.directory.glob("naca*.npz"):
+                path.unlink()
+
+    @property
+    def n_bytes(self) -> int:
+        """
+        Get memory used by the in-process level.
+
+        Return:
+            int: number of bytes
+        """
+        return self._n_bytes
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Return:
+            dict[str, int]: hits, misses and evictions
+        """
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._memory),
+            "bytes": self._n_bytes,
+        }
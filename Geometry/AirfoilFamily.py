@@ -0,0 +1,103 @@
+from numpy import ndarray, array, unique
+from Geometry.Airfoil import Airfoil
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.misc.resampling import ResamplingReport
+from Geometry.misc.naca import cosine_stations, thickness_distribution, naca4_surfaces, closed_contour
+
+
+class AirfoilFamily:
+    """
+    AirfoilFamily is a class for generating many NACA 4-digit airfoils in a single array operation.
+    If a cache is set, cached codes are taken from it and only the others are generated.
+    """
+    def __init__(self,
+                 numbers: list[str | int] | ndarray,
+                 n_points: str | int = 200,
+                 cache: AirfoilCache | None = None):
+        # numpy scalars are not accepted by Airfoil validation
+        numbers = numbers.tolist() if isinstance(numbers, ndarray) else numbers
+
+        # Airfoil validates every code and computes its NACA digits
+        self._airfoils = [Airfoil(number, n_points, cache=cache) for number in numbers]
+        self.numbers = [airfoil.number for airfoil in self._airfoils]
+        self.n_points = int(n_points)
+        self.cache = cache
+
+        self._coordinates: ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._airfoils)
+
+    def generate_points(self) -> ndarray:
+        """
+        Generate all airfoils of the family.
+        Chord stations and thickness polynomial are shared by all codes, repeated codes are computed once.
+
+        Return:
+            ndarray: (n_codes, 2 * n_points - 1, 2) array of points, ordered as in Airfoil.generate_points
+        """
+        # compute every distinct code only once
+        codes, inverse = unique(self.numbers, return_inverse=True)
+        keys = [AirfoilCache.key(code, self.n_points, "cosine") for code in codes]
+        contours = [self.cache.get(key) if self.cache is not None else None for key in keys]
+
+        missing = [i for i, contour in enumerate(contours) if contour is None]
+        if missing:
+            first = [self.numbers.index(codes[i]) for i in missing]
+            m = array([self._airfoils[i].m for i in first])[:, None]
+            p = array([self._airfoils[i].p for i in first])[:, None]
+            t = array([self._airfoils[i].t for i in first])[:, None]
+
+            # thickness is linear in t, so the polynomial is evaluated once for unit thickness
+            x = cosine_stations(self.n_points)
+            yt = t * thickness_distribution(x, 1.0)
+
+            upper, lower = naca4_surfaces(x, yt, m, p)
+            for i, contour in zip(missing, closed_contour(upper, lower)):
+                contours[i] = contour
+                if self.cache is not None:
+                    self.cache.put(keys[i], contour)
+
+        self._coordinates = array(contours)[inverse.reshape(-1)]
+
+        return self._coordinates
+
+    @property
+    def coordinates(self) -> ndarray | None:
+        """
+        Return points of all airfoils.
+
+        Return:
+            ndarray | None: (n_codes, n, 2) array of points, None if points were not generated
+        """
+        return self._coordinates
+
+    def airfoil(self, index: int) -> Airfoil:
+        """
+        Get a single airfoil of the family with its points set.
+
+        Args:
+            index (int): index of the code in the family
+        Return:
+            Airfoil: the airfoil
+        """
+        if self._coordinates is None:
+            self.generate_points()
+
+        foil = Airfoil(f"{self.numbers[index]:04d}", self.n_points, cache=self.cache)
+        foil.coordinates = self._coordinates[index].copy()
+        return foil
+
+    def adaptive_airfoil(self, index: int, tolerance: float) -> tuple[Airfoil, ResamplingReport]:
+        """
+        Get a single airfoil of the family with the fewest of its points placed by local curvature.
+        The family points are the reference contour, so the family should be dense, e.g. n_points=2000.
+
+        Args:
+            index (int): index of the code in the family
+            tolerance (float): maximum deviation from the family contour, relative to the chord
+        Return:
+            tuple[Airfoil, ResamplingReport]: the airfoil and its achieved number of points and maximum deviation
+        """
+        foil = self.airfoil(index)
+        return foil, foil.resample_adaptive(tolerance)
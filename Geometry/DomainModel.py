@@ -0,0 +1,345 @@
+from dataclasses import dataclass, field
+from math import inf
+from numpy import ndarray, array, arange, pi, hypot, deg2rad, broadcast_arrays, minimum, full
+from Geometry.Airfoil import Airfoil
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.misc.points import airfoil_placement_matrix
+from Geometry.misc.transforms import apply
+from Geometry.misc.polygons import polygon_distances
+from Geometry.misc.resampling import adaptive_indices
+
+
+@dataclass
+class DomainReport:
+    valid: bool
+    issues: list[str] = field(default_factory=list)
+    min_blade_gap: float = inf
+    min_ring_clearance: float = inf
+
+
+def prism_height(n_layers: int, first_height: float, growth_rate: float) -> float:
+    """
+    Compute total height of prism layers, e.g. from Mesh PrismParams.
+
+    Args:
+        n_layers (int): number of layers
+        first_height (float): first layer height
+        growth_rate (float): growth rate
+    Return:
+        float: total height of all layers
+    """
+    if growth_rate == 1:
+        return n_layers * first_height
+    return first_height * (growth_rate ** n_layers - 1) / (growth_rate - 1)
+
+
+def mesh_min_gap(n_layers: int,
+                 first_height: float,
+                 growth_rate: float,
+                 min_size: float,
+                 mesh_units_per_meter: float = 1000.0) -> float:
+    """
+    Compute the minimum gap the meshing sizes need: prism layers on both walls and one cell between them.
+
+    Args:
+        n_layers (int): number of prism layers, e.g. from Mesh PrismParams
+        first_height (float): first layer height in mesh units
+        growth_rate (float): growth rate of prism layers
+        min_size (float): minimum cell size in the ring in mesh units, e.g. the curvature sizing minimum
+        mesh_units_per_meter (float): mesh units in a meter, Prime sizes are in millimeters
+    Return:
+        float: the gap in meters (model units)
+    """
+    return (2 * prism_height(n_layers, first_height, growth_rate) + min_size) / mesh_units_per_meter
+
+
+def env_box(scale_factor: float) -> tuple[float, float, float, float]:
+    """
+    Get the main fluid box, as built by SketchController.add_env.
+
+    Args:
+        scale_factor (float): global scale factor of SketchController
+    Return:
+        tuple[float, float, float, float]: x min, x max, y min, y max
+    """
+    return -scale_factor, 2 * scale_factor, -scale_factor, scale_factor
+
+
+def boi_box(scale_factor: float) -> tuple[float, float, float, float]:
+    """
+    Get the body of influence box, as built by SketchController.add_boi.
+
+    Args:
+        scale_factor (float): global scale factor of SketchController
+    Return:
+        tuple[float, float, float, float]: x min, x max, y min, y max
+    """
+    scale_factor = scale_factor / 3
+    return -scale_factor, 3 * scale_factor, -scale_factor, scale_factor
+
+
+def place_blades(profile: ndarray,
+                 n_airfoils: int,
+                 radius: float | ndarray,
+                 angle_of_attack_deg: float | ndarray,
+                 center: tuple[float, float] = (0.0, 0.0)) -> ndarray:
+    """
+    Place blades of many layouts at once, as built by SketchController.add_airfoils_by_sketch.
+
+    Args:
+        profile (ndarray): (n, 2) array of points of the base airfoil
+        n_airfoils (int): number of blades
+        radius (float | ndarray): radius of the circle on which blades are placed, of every layout
+        angle_of_attack_deg (float | ndarray): angle of attack (degrees), of every layout
+        center (tuple[float, float]): center of the rotor
+    Return:
+        ndarray: (n_layouts, n_airfoils, n, 2) array of points
+    """
+    radius, angle_of_attack_deg = (array(value, dtype=float).reshape(-1, 1)
+                                   for value in broadcast_arrays(radius, angle_of_attack_deg))
+    angles_rad = 2 * pi * arange(n_airfoils) / n_airfoils
+    matrices = airfoil_placement_matrix(*center, radius, angles_rad, deg2rad(angle_of_attack_deg))
+    return apply(matrices, profile)
+
+
+class DomainModel:
+    """
+    DomainModel is a pure NumPy representation of the 2D layout built in Geometry/main.py
+    (env box, ring, inner circle, body of influence and blades).
+    It is used to check parameters before the modeler is launched.
+    All lengths are floats in the model units, angles are in degrees.
+    """
+    def __init__(self,
+                 radius: float,
+                 spread: float,
+                 n_airfoils: int,
+                 angle_of_attack_deg: float,
+                 naca_code: str | int = "0012",
+                 coordinates: ndarray | None = None,
+                 center: tuple[float, float] = (0.0, 0.0),
+                 scale_factor: float = 12,
+                 tolerance: float = 1e-4,
+                 cache: AirfoilCache | None = None):
+        """
+        DomainModel class constructor.
+
+        Args:
+            radius (float): radius of the circle on which blades are placed
+            spread (float): spread of the ring
+            n_airfoils (int): number of blades
+            angle_of_attack_deg (float): angle of attack (degrees)
+            naca_code (str | int): NACA 4-digit code of the blades, used if coordinates are not given
+            coordinates (ndarray | None): (n, 2) array of points of the base airfoil in model units
+            center (tuple[float, float]): center of the rotor
+            scale_factor (float): global scale factor of SketchController
+            tolerance (float): deviation of the checked blade contour from the airfoil, checks are exact up to it
+            cache (AirfoilCache | None): cache of generated airfoil points, used if coordinates are not given
+        """
+        if not n_airfoils > 0:
+            raise ValueError(f"\'n_airfoils\' parameter should be positive, got {n_airfoils}")
+
+        self.radius = float(radius)
+        self.spread = float(spread)
+        self.n_airfoils = int(n_airfoils)
+        self.angle_of_attack_deg = float(angle_of_attack_deg)
+        self.center = (float(center[0]), float(center[1]))
+        self.scale_factor = float(scale_factor)
+
+        # checks run on a curvature-adaptive subset of points, it is much smaller than the airfoil contour
+        profile = Airfoil(naca_code, cache=cache).generate_points() if coordinates is None else coordinates
+        self._profile = profile[adaptive_indices(profile, tolerance)]
+
+    @property
+    def ring_radii(self) -> tuple[float, float]:
+        """
+        Get inner and outer radius of the ring.
+
+        Return:
+            tuple[float, float]: inner and outer radius
+        """
+        return self.radius - self.spread / 2.0, self.radius + self.spread / 2.0
+
+    @property
+    def env_box(self) -> tuple[float, float, float, float]:
+        """
+        Get the main fluid box, as built by SketchController.add_env.
+
+        Return:
+            tuple[float, float, float, float]: x min, x max, y min, y max
+        """
+        return env_box(self.scale_factor)
+
+    @property
+    def boi_box(self) -> tuple[float, float, float, float]:
+        """
+        Get the body of influence box, as built by SketchController.add_boi.
+        Its left edge is an arc around the center, bulging out of the box.
+
+        Return:
+            tuple[float, float, float, float]: x min, x max, y min, y max
+        """
+        return boi_box(self.scale_factor)
+
+    @property
+    def blades(self) -> ndarray:
+        """
+        Get points of all placed blades, as built by SketchController.add_airfoils_by_sketch.
+
+        Return:
+            ndarray: (n_airfoils, n_points, 2) array of points
+        """
+        return place_blades(self._profile, self.n_airfoils, self.radius, self.angle_of_attack_deg, self.center)[0]
+
+    def check(self, min_gap: float = 0.0) -> DomainReport:
+        """
+        Check the layout: blade overlap, blades crossing the ring and gaps smaller than min_gap.
+
+        Args:
+            min_gap (float): minimum gap between blades and between blades and ring boundaries,
+                             e.g. from mesh_min_gap
+        Return:
+            DomainReport: the report
+        """
+        return check_layouts(self._profile, self.n_airfoils, self.radius, self.spread, self.angle_of_attack_deg,
+                             self.center, self.scale_factor, min_gap)[0]
+
+    def validate(self, min_gap: float = 0.0) -> DomainReport:
+        """
+        Check the layout and raise on any issue.
+
+        Args:
+            min_gap (float): minimum gap between blades and between blades and ring boundaries
+        Return:
+            DomainReport: the report of a valid layout
+
+        Raise:
+            ValueError: layout is not valid
+        """
+        report = self.check(min_gap)
+        if not report.valid:
+            raise ValueError("Invalid geometry parameters: " + "; ".join(report.issues))
+        return report
+
+
+def check_layouts(profile: ndarray,
+                  n_airfoils: int,
+                  radius: float | ndarray,
+                  spread: float | ndarray,
+                  angle_of_attack_deg: float | ndarray,
+                  center: tuple[float, float] = (0.0, 0.0),
+                  scale_factor: float = 12,
+                  min_gap: float = 0.0) -> list[DomainReport]:
+    """
+    Check layouts of one airfoil and number of blades for arrays of radius, spread and angle of attack at once.
+    Blades are rotated copies of each other, so the gaps to the first blade give all blade gaps.
+
+    Args:
+        profile (ndarray): (n, 2) array of points of the base airfoil in model units
+        n_airfoils (int): number of blades
+        radius (float | ndarray): radius of the circle on which blades are placed, of every layout
+        spread (float | ndarray): spread of the ring, of every layout
+        angle_of_attack_deg (float | ndarray): angle of attack (degrees), of every layout
+        center (tuple[float, float]): center of the rotor
+        scale_factor (float): global scale factor of SketchController
+        min_gap (float): minimum gap between blades and between blades and ring boundaries
+    Return:
+        list[DomainReport]: report of every layout
+    """
+    if not n_airfoils > 0:
+        raise ValueError(f"\'n_airfoils\' parameter should be positive, got {n_airfoils}")
+
+    radius, spread, angle_of_attack_deg = (
+        array(value, dtype=float).reshape(-1) for value in broadcast_arrays(radius, spread, angle_of_attack_deg)
+    )
+    cx, cy = center
+    inner, outer = radius - spread / 2.0, radius + spread / 2.0
+
+    # ring inside env box and body of influence
+    x_min, x_max, y_min, y_max = env_box(scale_factor)
+    box_clearance = min(cx - x_min, x_max - cx, cy - y_min, y_max - cy) - outer
+    _, x_max, y_min, y_max = boi_box(scale_factor)
+    boi_clearance = min(x_max - cx, cy - y_min, y_max - cy) - outer
+
+    # blades inside the ring, (layouts, blades, points, 2) array
+    blades = place_blades(profile, n_airfoils, radius, angle_of_attack_deg, center)
+    distances = hypot(blades[..., 0] - cx, blades[..., 1] - cy)
+    ring_clearance = minimum(distances.min(axis=(1, 2)) - inner, outer - distances.max(axis=(1, 2)))
+
+    # blades to blades, the first blade to the nearer half of the others
+    blade_gap = full(len(radius), inf)
+    for i in range(1, n_airfoils // 2 + 1):
+        blade_gap = minimum(blade_gap, polygon_distances(blades[:, 0], blades[:, i]))
+
+    reports = []
+    for k in range(len(radius)):
+        report = DomainReport(valid=True, min_blade_gap=float(blade_gap[k]),
+                              min_ring_clearance=float(ring_clearance[k]))
+
+        # ring itself
+        if not spread[k] > 0:
+            report.issues.append(f"spread should be positive, got {spread[k]}")
+        if not inner[k] > 0:
+            report.issues.append(f"inner radius of the ring should be positive, got {inner[k]}")
+
+        if not box_clearance[k] > min_gap:
+            report.issues.append(f"ring does not fit in the env box, clearance {box_clearance[k]:.4g}")
+        if not boi_clearance[k] > min_gap:
+            report.issues.append(f"ring does not fit in the body of influence, clearance {boi_clearance[k]:.4g}")
+
+        if report.min_ring_clearance <= 0:
+            report.issues.append(f"blades cross the ring boundary by {-report.min_ring_clearance:.4g}")
+        elif report.min_ring_clearance < min_gap:
+            report.issues.append(f"blade to ring gap {report.min_ring_clearance:.4g} is below {min_gap:.4g}")
+
+        if report.min_blade_gap <= 0:
+            report.issues.append("blades overlap")
+        elif report.min_blade_gap < min_gap:
+            report.issues.append(f"blade to blade gap {report.min_blade_gap:.4g} is below {min_gap:.4g}")
+
+        report.valid = not report.issues
+        reports.append(report)
+    return reports
+
+
+def check_designs(designs: list[dict],
+                  min_gap: float = 0.0,
+                  cache: AirfoilCache | None = None) -> list[DomainReport]:
+    """
+    Check many designs, e.g. a sweep grid, without launching the modeler.
+    Designs with the same airfoil and number of blades are checked at once by check_layouts.
+
+    Args:
+        designs (list[dict]): DomainModel keyword arguments of every design
+        min_gap (float): minimum gap between blades and between blades and ring boundaries
+        cache (AirfoilCache | None): cache of generated airfoil points
+    Return:
+        list[DomainReport]: report of every design
+    """
+    # designs with the same airfoil share the checked profile
+    profiles: dict[tuple, ndarray] = {}
+    groups: dict[tuple, list[int]] = {}
+    for i, design in enumerate(designs):
+        coordinates = design.get("coordinates")
+        tolerance = design.get("tolerance", 1e-4)
+        airfoil = (str(design.get("naca_code", "0012")) if coordinates is None else id(coordinates), tolerance)
+        if airfoil not in profiles:
+            if coordinates is None:
+                coordinates = Airfoil(airfoil[0], cache=cache).generate_points()
+            profiles[airfoil] = coordinates[adaptive_indices(coordinates, tolerance)]
+
+        center = tuple(float(c) for c in design.get("center", (0.0, 0.0)))
+        layout = (airfoil, int(design["n_airfoils"]), center, float(design.get("scale_factor", 12)))
+        groups.setdefault(layout, []).append(i)
+
+    reports: list[DomainReport | None] = [None] * len(designs)
+    for (airfoil, n_airfoils, center, scale_factor), indices in groups.items():
+        group_reports = check_layouts(
+            profiles[airfoil], n_airfoils,
+            [designs[i]["radius"] for i in indices],
+            [designs[i]["spread"] for i in indices],
+            [designs[i]["angle_of_attack_deg"] for i in indices],
+            center, scale_factor, min_gap
+        )
+        for i, report in zip(indices, group_reports):
+            reports[i] = report
+    return reports
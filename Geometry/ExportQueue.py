@@ -0,0 +1,198 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Callable
+from ansys.geometry.core.designer import Design
+from Geometry.ModelerPool import ModelerPool
+from ArtifactCache import file_checksum, checksum_path, write_checksum
+
+
+# export method of Design for every file extension
+EXPORT_FORMATS = {
+    "fmd": "export_to_fmd",
+    "dsco": "export_to_disco",
+    "scdocx": "export_to_scdocx",
+    "pmdb": "export_to_pmdb",
+    "step": "export_to_step",
+    "iges": "export_to_iges",
+    "x_t": "export_to_parasolid_text",
+    "x_b": "export_to_parasolid_bin",
+}
+
+
+def is_complete(path: Path) -> bool:
+    """
+    Check whether an artifact was completely written: its checksum file exists and matches.
+
+    Args:
+        path (Path): the artifact
+    Return:
+        bool: True if the artifact is complete
+    """
+    path = Path(path)
+    checksum_file = checksum_path(path)
+    if not path.is_file() or not checksum_file.is_file():
+        return False
+    return checksum_file.read_text().split()[0] == file_checksum(path)
+
+
+class ExportQueue:
+    """
+    ExportQueue is a class for exporting designs in a background thread.
+    Every export writes a checksum file next to the artifact when it is complete,
+    so downstream stages can tell a complete artifact from a partial one.
+    With a modeler pool, designs can be exported from their snapshots by other modelers,
+    so the design can be changed while it is exported.
+    """
+    def __init__(self, max_workers: int = 1, pool: ModelerPool | None = None):
+        """
+        ExportQueue class constructor.
+
+        Args:
+            max_workers (int): number of exports running at once,
+                               exports of one modeler are serialized by the modeler anyway
+            pool (ModelerPool | None): pool of modelers opening the snapshots, see submit_snapshot
+        """
+        if not max_workers > 0:
+            raise ValueError(f"\'max_workers\' parameter should be positive, got {max_workers}")
+
+        self.pool = pool
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="export")
+        self._pending: list[Future] = []
+
+    @staticmethod
+    def __validate_formats(formats: tuple[str, ...]):
+        """
+        Validate formats parameter.
+
+        Raise:
+            ValueError: format is not supported
+        """
+        for file_format in formats:
+            if file_format not in EXPORT_FORMATS:
+                raise ValueError(f"format should be one of {tuple(EXPORT_FORMATS)}, got {file_format}")
+
+    @staticmethod
+    def __export(design: Design,
+                 location: Path,
+                 file_format: str,
+                 on_complete: Callable[[str, Path], None] | None) -> Path:
+        """
+        Export a design to one format and write its checksum file.
+
+        Return:
+            Path: the exported file
+        """
+        print(f"Exporting to {file_format}...")
+        path = getattr(design, EXPORT_FORMATS[file_format])(location)
+
+        # the checksum file is written last, it marks the artifact as complete
+        write_checksum(path)
+        if on_complete is not None:
+            on_complete(file_format, path)
+
+        print(f"File exported to: {path}")
+        return path
+
+    def __export_snapshot(self,
+                          snapshot: Path,
+                          location: Path,
+                          formats: tuple[str, ...],
+                          on_complete: Callable[[str, Path], None] | None,
+                          futures: dict[str, Future]):
+        """
+        Open a snapshot of a design in a modeler of the pool and export it to every format.
+        The snapshot is deleted afterwards.
+
+        """
+        try:
+            with self.pool.modeler() as modeler:
+                design = modeler.open_file(snapshot)
+                for file_format in formats:
+                    futures[file_format].set_result(self.__export(design, location, file_format, on_complete))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            rmtree(snapshot.parent, ignore_errors=True)
+
+    def submit(self,
+               design: Design,
+               location: Path,
+               formats: tuple[str, ...],
+               on_complete: Callable[[str, Path], None] | None = None) -> dict[str, Future]:
+        """
+        Queue exports of a design, in the given order of formats.
+
+        Args:
+            design (Design): the design, it should not be changed or closed until the exports are done
+            location (Path): directory of exported files
+            formats (tuple[str, ...]): file extensions, see EXPORT_FORMATS
+            on_complete (Callable[[str, Path], None] | None): called with the format and the path
+                                                             of every complete file, in the export thread
+        Return:
+            dict[str, Future]: future of the exported file path for every format
+        """
+        self.__validate_formats(formats)
+
+        futures = {file_format: self._executor.submit(self.__export, design, location, file_format, on_complete)
+                   for file_format in formats}
+        self._pending = [future for future in self._pending if not future.done()] + list(futures.values())
+        return futures
+
+    def submit_snapshot(self,
+                        design: Design,
+                        location: Path,
+                        formats: tuple[str, ...],
+                        on_complete: Callable[[str, Path], None] | None = None) -> dict[str, Future]:
+        """
+        Write a snapshot of a design in the native format now and queue its exports by a modeler of the pool.
+        The design can be changed or closed as soon as this method returns.
+
+        Args:
+            design (Design): the design
+            location (Path): directory of exported files
+            formats (tuple[str, ...]): file extensions, see EXPORT_FORMATS
+            on_complete (Callable[[str, Path], None] | None): called with the format and the path
+                                                             of every complete file, in the export thread
+        Return:
+            dict[str, Future]: future of the exported file path for every format
+
+        Raise:
+            ValueError: the queue has no modeler pool
+        """
+        self.__validate_formats(formats)
+        if self.pool is None:
+            raise ValueError("snapshots are exported by modelers of a pool, the queue has no pool")
+
+        # the snapshot keeps the design name, so the exported files are named as the design
+        snapshot = Path(design.export_to_scdocx(Path(mkdtemp(prefix="snapshot_"))))
+
+        futures = {file_format: Future() for file_format in formats}
+        self._executor.submit(self.__export_snapshot, snapshot, location, formats, on_complete, futures)
+        self._pending = [future for future in self._pending if not future.done()] + list(futures.values())
+        return futures
+
+    def wait(self, futures: list[Future] | None = None):
+        """
+        Wait for exports to finish.
+
+        Args:
+            futures (list[Future] | None): exports to wait for, None for all queued exports
+
+        Raise:
+            Exception: the first error of a failed export
+        """
+        futures = self._pending if futures is None else futures
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def shutdown(self):
+        """
+        Wait for all exports and stop the background thread.
+
+        """
+        self._executor.shutdown(wait=True)
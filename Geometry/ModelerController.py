@@ -1,27 +1,92 @@
+from dataclasses import dataclass, field
+from math import radians, cos, sin, pi
+from time import perf_counter
+from pathlib import Path
 from ansys.geometry.core import launch_modeler
 from Geometry.SketchController import SketchController
+from Geometry.ModelerPool import ModelerPool
+from Geometry.ExportQueue import ExportQueue
+from ArtifactCache import ArtifactCache
+from concurrent.futures import Future
 from Geometry.misc.PATHS import RESULTS
 from ansys.geometry.core.designer.component import Component
 from ansys.geometry.core.designer import Body, Design, SharedTopologyType
 from ansys.geometry.core.sketch import Sketch
-from ansys.geometry.core.misc import Distance, Angle
+from ansys.geometry.core.misc import UNITS, Distance, Angle
 from ansys.geometry.core.designer.face import Face
 from ansys.geometry.core.designer.edge import Edge
 from Geometry.misc.PATHS import AIRFOIL_MODEL_2D, AIRFOIL_MODEL_3D
 from ansys.geometry.core.math import Point2D, Point3D, UnitVector3D, Vector3D
+from numpy import array
 from numpy.linalg import norm
+from Geometry.misc.section import SectionProperties
+from Geometry.TopologySnapshot import TopologySnapshot, SelectionRule
 from ansys.geometry.core.tools.prepare_tools import PrepareTools
 
 
+@dataclass
+class BladeLayout:
+    """
+    Record of how blade bodies were placed on the circle, used to update them in place.
+    """
+    component_name: str
+    center: Point3D
+    radius: Distance
+    angle_of_attack_deg: Angle
+    n_airfoils: int
+    pitch_sign: int = 1  # sign of the pitch rotation, -1 for airfoils loaded from file
+    blades: list[Body] = field(default_factory=list)  # blade i is placed at angle i * 360 / n_airfoils
+
+
+@dataclass
+class ReplicationReport:
+    """
+    Timing of blade replication in ModelerController.load_airfoils.
+    """
+    method: str  # "pattern" or "copy"
+    n_airfoils: int
+    elapsed: float  # seconds
+    per_blade: list[float] = field(default_factory=list)  # seconds per added blade, empty for the pattern
+
+    def __str__(self) -> str:
+        if not self.per_blade:
+            return f"Replicated {self.n_airfoils} blades by {self.method} in {self.elapsed:.2f} s"
+        mean = sum(self.per_blade) / len(self.per_blade)
+        return (f"Replicated {self.n_airfoils} blades by {self.method} in {self.elapsed:.2f} s "
+                f"({mean:.3f} s per blade)")
+
+
 class ModelerController:
     """
     ModelerController is a class for create, run and save modeler environment (Discovery).
 
     """
 
-    def __init__(self, design_name: str, model_type: str, launch_airfoil_from_file: bool):
+    def __init__(self,
+                 design_name: str,
+                 model_type: str,
+                 launch_airfoil_from_file: bool,
+                 pool: ModelerPool | None = None,
+                 incremental: bool = False):
+        """
+        ModelerController class constructor.
+
+        Args:
+            design_name (str): name of the design
+            model_type (str): 2D or 3D
+            launch_airfoil_from_file (bool): whether airfoils are loaded from file
+            pool (ModelerPool | None): pool to lease the modeler from, a new modeler is launched if None
+            incremental (bool): whether to keep blade bodies after the ring subtraction,
+                                so the layout can be changed with update_layout
+        """
         self.__validate_model_type(model_type)
-        self.modeler = launch_modeler(mode="Discovery", **{"timeout": 500})
+
+        # lease a running modeler from the pool or launch a new one
+        self._pool = pool
+        if pool is not None:
+            self.modeler = pool.lease()
+        else:
+            self.modeler = launch_modeler(mode="Discovery", **{"timeout": 500})
         print(self.modeler)
 
         self._design_name = design_name
@@ -32,6 +97,16 @@ class ModelerController:
         self._components: dict[str, Component] = dict()
         self._sketches: dict[str, list[Sketch]] = dict()
 
+        # how bodies and named selections were derived, used by update_layout
+        self._incremental = incremental
+        self._layout: BladeLayout | None = None
+        self._sources: dict[str, list[tuple[str, Sketch]]] = dict()
+        self._selections: dict[str, str] = dict()
+        self._rules: dict[str, SelectionRule] = dict()
+        self._shared_by_construction = False
+        self._sector: tuple[int, Distance, tuple[str, ...]] | None = None  # n_sectors, outer radius, regions
+        self._exports: list[Future] = []
+
         self._distance = Distance(1) if self._model_type == "3D" else Distance(0)
 
     @staticmethod
@@ -64,6 +139,16 @@ class ModelerController:
         """
         return self._components
 
+    @property
+    def layout(self) -> BladeLayout | None:
+        """
+        Get the record of the blade layout.
+
+        Returns:
+            BladeLayout | None: the record, None if blades were not placed yet
+        """
+        return self._layout
+
     @property
     def sketches(self) -> dict[str, list[Sketch]]:
         """
@@ -107,16 +192,17 @@ class ModelerController:
         component = self._design.add_component(component_name)
 
         # extrude sketches
-        sketches = []
+        sources = []
         for sketch_controller in sketch_controllers:
             name, sketch = sketch_controller.get()
             self.__extrude(component, name, sketch)
 
-            sketches.append(sketch)
+            sources.append((name, sketch))
 
         # append components and sketches to dictionaries
         self._components[component_name] = component
-        self._sketches[component_name] = sketches
+        self._sketches[component_name] = [sketch for _, sketch in sources]
+        self._sources[component_name] = sources
 
     def add_named_selection(self,
                             component_name: str,
@@ -131,24 +217,195 @@ class ModelerController:
         # get component and add named selection to main design
         component = self._components[component_name]
         self._design.create_named_selection(named_selection_name, bodies=component.bodies)
+        self._selections[component_name] = named_selection_name
 
-    def add_symmetry_named_selection(self):
+    def add_fluid_domain(self,
+                         center: Point2D,
+                         radius: Distance,
+                         spread: Distance,
+                         main_fluid_name: str,
+                         ring_name: str,
+                         inner_circle_name: str):
         """
-        Add symmetry named selection into your model.
+        Create the outer region, the ring and the inner disk as non-overlapping bodies with coincident edges,
+        each in its own component with a named selection of the same name.
+        Topology is shared by the design property instead of the share_topology operation,
+        so the only boolean left is the blade cut in add_wall.
 
+        Args:
+            center (Point2D): the center of circles
+            radius (Distance): radius of center circle of the ring
+            spread (Distance): spread of the ring
+            main_fluid_name (str): name of the outer region
+            ring_name (str): name of the ring
+            inner_circle_name (str): name of the inner disk
+        """
+        regions = SketchController.fluid_regions(center, radius, spread, main_fluid_name, ring_name, inner_circle_name)
+        for name, sketch_controller in regions.items():
+            self.add_component(name, sketch_controller)
+            self.add_named_selection(name, name)
+
+        self._design.set_shared_topology(SharedTopologyType.SHARETYPE_SHARE)
+        self._shared_by_construction = True
+
+    def add_sector_domain(self,
+                          center: Point2D,
+                          radius: Distance,
+                          spread: Distance,
+                          n_sectors: int,
+                          outer_radius: Distance,
+                          main_fluid_name: str,
+                          ring_name: str,
+                          inner_circle_name: str):
+        """
+        Create one blade passage of a rotor-alone domain: sectors of the outer region, the ring and the inner disk
+        with coincident edges, each in its own component with a named selection of the same name.
+        Only the first blade (at zero angle) should be added, the sector spans 360 / n_sectors degrees around it.
+        Topology is shared by the design property, as in add_fluid_domain.
+
+        Args:
+            center (Point2D): the center of circles
+            radius (Distance): radius of center circle of the ring
+            spread (Distance): spread of the ring
+            n_sectors (int): number of blade passages, i.e. number of airfoils of the full rotor
+            outer_radius (Distance): radius of the outer boundary
+            main_fluid_name (str): name of the outer region
+            ring_name (str): name of the ring
+            inner_circle_name (str): name of the inner disk
+        """
+        regions = SketchController.sector_regions(center, radius, spread, n_sectors, outer_radius,
+                                                  main_fluid_name, ring_name, inner_circle_name)
+        for name, sketch_controller in regions.items():
+            self.add_component(name, sketch_controller)
+            self.add_named_selection(name, name)
+
+        self._design.set_shared_topology(SharedTopologyType.SHARETYPE_SHARE)
+        self._shared_by_construction = True
+        self._sector = (n_sectors, outer_radius, tuple(regions))
+
+    def sector_rules(self) -> list[SelectionRule]:
+        """
+        Get rules of periodic-1 and periodic-2 (sides of the sector) and (3D only) symmetry named selections
+        of the sector domain.
+
+        Return:
+            list[SelectionRule]: the rules
+        """
+        if self._sector is None:
+            raise ValueError("Sector domain is not created, use add_sector_domain first.")
+
+        n_sectors, _, regions = self._sector
+        rules = [
+            SelectionRule("periodic-1", components=regions, ray_deg=-180.0 / n_sectors),
+            SelectionRule("periodic-2", components=regions, ray_deg=180.0 / n_sectors)
+        ]
+        if self._model_type == "3D":
+            rules.append(SelectionRule("symmetry", exclude_bodies=("boi", "NACA"), normals=((0, 0, 1), (0, 0, -1))))
+        return rules
+
+    def add_sector_boundaries(self, main_component_name: str):
         """
-        symmetry_faces = []
+        Create named selections of the sector domain from one snapshot: periodic-1 and periodic-2,
+        farfield (the outer arc) and (3D only) symmetry. Replaces inlet, outlet and symmetry of the full domain.
+
+        Args:
+            main_component_name (str): name of main fluid component
+        """
+        rules = self.sector_rules()
+        _, outer_radius, _ = self._sector
+        farfield_rule = SelectionRule("farfield", components=(main_component_name,), min_reach=outer_radius.value.m)
+        snapshot = self.take_snapshot(rules + [farfield_rule])
+        self.create_named_selections(rules, snapshot)
+
+        # the outer arc: elements of the main fluid reaching the outer radius, except sides and caps
+        farfield = snapshot.mask(farfield_rule)
+        for rule in rules:
+            farfield &= ~snapshot.mask(rule)
+
+        key = "faces" if self._model_type == "3D" else "edges"
+        self._design.create_named_selection("farfield", **{key: [snapshot.entities[i] for i in farfield.nonzero()[0]]})
+
+    def take_snapshot(self,
+                      rules: list[SelectionRule],
+                      component_names: list[str] | None = None) -> TopologySnapshot:
+        """
+        Query faces (3D) or edges (2D) of all bodies once and keep them locally.
+
+        Args:
+            rules (list[SelectionRule]): rules which will be evaluated, only properties they need are queried
+            component_names (list[str] | None): components to snapshot, None for all components
+        Return:
+            TopologySnapshot: the snapshot
+        """
+        # blades kept in incremental mode are not a part of the fluid
+        skipped = self._layout.component_name if self._incremental and self._layout is not None else None
+
+        bodies, names = [], []
         for component in self._design.components:
-            for body in component.bodies:
-                if body.name not in ('boi', 'NACA'):
-                    for face in body.faces:
-                        try:
-                            if face.normal().z in (-1, 1) or face.normal().y in (-1, 1):
-                                symmetry_faces.append(face)
-                        except Exception as e:
-                            pass
+            if component_names is None and component.name == skipped:
+                continue
+            if component_names is None or component.name in component_names:
+                bodies.extend(component.bodies)
+                names.extend([component.name] * len(component.bodies))
+
+        return TopologySnapshot(bodies, names, self._model_type, rules)
+
+    @staticmethod
+    def __symmetry_rule() -> SelectionRule:
+        """
+        Get rule of symmetry named selection: faces normal to Z or Y axis, except body of influence and NACA.
 
-        self._design.create_named_selection('symmetry', faces=symmetry_faces)
+        Returns:
+            SelectionRule: the rule
+        """
+        return SelectionRule("symmetry", exclude_bodies=("boi", "NACA"),
+                             normals=((0, 0, 1), (0, 0, -1), (0, 1, 0), (0, -1, 0)))
+
+    def boundary_rules(self, main_component_name: str) -> list[SelectionRule]:
+        """
+        Get rules of inlet, outlet and (3D only) symmetry named selections.
+
+        Args:
+            main_component_name (str): name of main fluid component
+        Return:
+            list[SelectionRule]: the rules
+        """
+        if self._model_type == "3D":
+            rules = [
+                SelectionRule("inlet", components=(main_component_name,), normals=((-1, 0, 0),)),
+                SelectionRule("outlet", components=(main_component_name,), normals=((1, 0, 0),)),
+                self.__symmetry_rule()
+            ]
+        else:
+            rules = [
+                SelectionRule("inlet", components=(main_component_name,), x_side=-1),
+                SelectionRule("outlet", components=(main_component_name,), x_side=1)
+            ]
+        return rules
+
+    def create_named_selections(self,
+                                rules: list[SelectionRule],
+                                snapshot: TopologySnapshot | None = None):
+        """
+        Create named selections of all rules from a single snapshot.
+
+        Args:
+            rules (list[SelectionRule]): rules of named selections
+            snapshot (TopologySnapshot | None): snapshot to classify, a new one is taken if not given
+        """
+        snapshot = snapshot if snapshot is not None else self.take_snapshot(rules)
+        key = "faces" if self._model_type == "3D" else "edges"
+
+        for rule in rules:
+            self._design.create_named_selection(rule.name, **{key: snapshot.select(rule)})
+            self._rules[rule.name] = rule
+
+    def add_symmetry_named_selection(self):
+        """
+        Add symmetry named selection into your model.
+
+        """
+        self.create_named_selections([self.__symmetry_rule()])
 
     def add_inlet_and_outlet(self,
                              main_component_name: str):
@@ -158,36 +415,8 @@ class ModelerController:
         Args:
             main_component_name (str): name of main fluid component
         """
-        # get the main fluid component and body
-        env_component = self._components[main_component_name]
-        env_body = env_component.bodies[0]
-
-        # get all faces of edges (elements) basing on Geometry type
-        env_: list[Face | Edge] = env_body.faces if self._model_type == "3D" else env_body.edges
-
-        inlet_: dict[str, list[Face | Edge]] = dict([])
-        outlet_: dict[str, list[Face | Edge]] = dict([])
-        # get inlet and outlet elements based on x coordinate
-        if self._model_type == "3D":
-            inlet_["faces"] = []
-            outlet_["faces"] = []
-            for element in env_:
-                if element.normal() == UnitVector3D([-1, 0, 0]):
-                    inlet_["faces"].append(element)
-                elif element.normal() == UnitVector3D([1, 0, 0]):
-                    outlet_["faces"].append(element)
-        else:
-            inlet_['edges'] = []
-            outlet_["edges"] = []
-            for element in env_:
-                if element.start.x < 0 and element.end.x < 0:
-                    inlet_["edges"].append(element)
-                elif element.start.x > 0 and element.end.x > 0:
-                    outlet_["edges"].append(element)
-
-        # create named selections of inlet and outlet elements
-        self._design.create_named_selection("inlet", **inlet_)
-        self._design.create_named_selection("outlet", **outlet_)
+        rules = [rule for rule in self.boundary_rules(main_component_name) if rule.name in ("inlet", "outlet")]
+        self.create_named_selections(rules, self.take_snapshot(rules, [main_component_name]))
 
     def add_wall(self,
                  naca_name: str,
@@ -195,6 +424,7 @@ class ModelerController:
         """
         This method subtracts NACA airfoil from ring and
         creates named selection 'wall' from the created faces or edges.
+        In incremental mode the airfoil bodies are kept.
 
         """
         # get airfoil and naca component
@@ -209,7 +439,7 @@ class ModelerController:
         ring_element_id = [element.id for element in ring_elements_old]
 
         # subtract airfoil from ring
-        ring_body.subtract(airfoil_component.bodies, keep_other=False)
+        ring_body.subtract(airfoil_component.bodies, keep_other=self._incremental)
 
         # get new ring elements
         ring_elements_new = ring_body.faces if self._model_type == "3D" else ring_body.edges
@@ -228,10 +458,16 @@ class ModelerController:
                       center: Point2D | Point3D,
                       radius: Distance,
                       angle_of_attack_deg: Angle,
-                      n_airfoils: int):
+                      n_airfoils: int,
+                      section: SectionProperties | None = None,
+                      pattern: bool = True) -> ReplicationReport:
         """
         This method allows you to read your own NACA profile from file (a path is defined in mis/PATHS.py file).
         This method also place your airfoil Geometry into the circe of given radius.
+        If section properties of the airfoil are given, its centroid is used as the center of the airfoil,
+        otherwise the center is found from vertices of the body.
+        Blades are replicated by a single circular pattern if the backend supports it (25R2),
+        otherwise (and in incremental mode, where blades have to be ordered) by copy and rotation of every blade.
 
         Args:
             file_name (str): file name of your Geometry
@@ -239,6 +475,11 @@ class ModelerController:
             radius (Distance): the radius of the circle
             angle_of_attack_deg (Angle): angle of attack
             n_airfoils (int): the number of airfoils to place of the circle
+            section (SectionProperties | None): section properties of the airfoil in the file units,
+                                                e.g. Airfoil(6412).section_properties() for unit chord NACA 6412
+            pattern (bool): whether to try the circular pattern
+        Returns:
+            ReplicationReport: timing of the blade replication
         """
         # validate file name
         if not ("." in file_name):
@@ -264,14 +505,18 @@ class ModelerController:
 
         # get your geometry as a body and scale
         airfoil = component.bodies[0]
-        airfoil.scale(10) if self._model_type == "3D" else airfoil.scale(100)
+        scale = 10 if self._model_type == "3D" else 100
+        airfoil.scale(scale)
 
         if self._model_type == "3D":
             airfoil_vertices_z = [vertex.z.m for vertex in airfoil.vertices]
             self._distance = Distance(max(airfoil_vertices_z) - min(airfoil_vertices_z))
 
         # find the geometric center of your Geometry and translate it to the coordinate system center
-        airfoil_center = self.__find_center_of_airfoil(airfoil)
+        if section is not None:
+            airfoil_center = Point3D([*(section.centroid * scale), 0])
+        else:
+            airfoil_center = self.__find_center_of_airfoil(airfoil)
         unit_vector = UnitVector3D(-1 * airfoil_center.position)
         unit_vector = UnitVector3D([unit_vector.x, unit_vector.y, 0])
         distance = norm(airfoil_center.position) / 2.0
@@ -287,16 +532,249 @@ class ModelerController:
             radius
         )
 
-        # add copies of your Geometry to the circle
-        for i in range(n_airfoils):
-            if i == 0:
-                airfoil_copy = airfoil
-                airfoil_copy.set_name = f"Airfoil_{i}"
-            else:
+        # add copies of your Geometry to the circle, all at once if possible
+        airfoil.set_name = "Airfoil_0"
+        start = perf_counter()
+        patterned = False
+        if pattern and not self._incremental and n_airfoils > 1:
+            patterned, airfoil = self.__circular_pattern(component, airfoil, center, n_airfoils)
+        if patterned:
+            # one command for all blades, there is no time per blade
+            report = ReplicationReport("pattern", n_airfoils, perf_counter() - start)
+        else:
+            per_blade = []
+            for i in range(1, n_airfoils):
+                blade_start = perf_counter()
                 airfoil_copy = airfoil.copy(component, f"Airfoil_{i}")
+                airfoil_copy.rotate(center, UnitVector3D([0, 0, 1]), Angle(i * 360.0 / n_airfoils))
+                per_blade.append(perf_counter() - blade_start)
+            report = ReplicationReport("copy", n_airfoils, perf_counter() - start, per_blade)
+        print(report)
+
+        # record the layout, the pitch is applied clockwise
+        self.record_layout("NACA", center, radius, Angle(-1 * angle_of_attack_deg.value), n_airfoils, pitch_sign=-1)
+        return report
+
+    def __circular_pattern(self,
+                           component: Component,
+                           airfoil: Body,
+                           center: Point3D,
+                           n_airfoils: int) -> tuple[bool, Body]:
+        """
+        Replicate the airfoil around the center with one circular pattern command (available in 25R2).
+        The pattern axis is a vertical edge of a temporary box with a corner in the center.
+        The pattern may add the new faces to the airfoil body itself, so an untouched copy is kept
+        to restore the airfoil on a failure.
+
+        Args:
+            component (Component): the airfoil component
+            airfoil (Body): the placed airfoil
+            center (Point3D): the center of the circle
+            n_airfoils (int): number of airfoils, including the given one
+        Returns:
+            tuple[bool, Body]: True if every new airfoil is a separate body and the given one is unchanged,
+                               otherwise the design is left with the placed airfoil only; and the placed airfoil
+        """
+        n_faces = len(airfoil.faces)
+        units = center.x.units
+        temporary = self._design.add_component("pattern_temporary")
+        backup = None
+        try:
+            backup = airfoil.copy(temporary, airfoil.name)
+
+            # temporary body with an edge on the axis
+            sketch = Sketch()
+            sketch.box(Point2D([center.x.m + 0.5, center.y.m + 0.5], units), Distance(1, units), Distance(1, units))
+            axis_body = temporary.extrude_sketch("pattern_axis", sketch, Distance(1, units))
+            axis_edge = [edge for edge in axis_body.edges
+                         if norm(array(edge.start)[:2] - array(center)[:2]) < 1e-9
+                         and norm(array(edge.end)[:2] - array(center)[:2]) < 1e-9][0]
+
+            success = self.modeler.geometry_commands.create_circular_pattern(
+                airfoil.faces, axis_edge, n_airfoils, 2 * pi  # full circle, in server units (radians)
+            )
+        except Exception as e:
+            print(f"Circular pattern not available: {e}")
+            success = False
+
+        # the airfoil unchanged and all new airfoils as separate bodies
+        unchanged = len(airfoil.faces) == n_faces
+        others = [body for body in component.bodies if body.id != airfoil.id]
+        if success and unchanged and sum(len(body.faces) for body in others) == (n_airfoils - 1) * n_faces:
+            self._design.delete_component(temporary)
+            return True, airfoil
+
+        for body in others:
+            component.delete_body(body)
+        if not unchanged and backup is not None:
+            print("Circular pattern changed the airfoil body, restoring it.")
+            component.delete_body(airfoil)
+            airfoil = backup.copy(component, backup.name)
+        self._design.delete_component(temporary)
+        return False, airfoil
+
+    def record_layout(self,
+                      component_name: str,
+                      center: Point2D | Point3D,
+                      radius: Distance,
+                      angle_of_attack_deg: Angle,
+                      n_airfoils: int,
+                      pitch_sign: int = 1):
+        """
+        Record how blades of a component were placed, e.g. after adding SketchController.add_airfoils_by_sketch.
+        Bodies of the component are taken as blades in the order of placement.
+
+        Args:
+            component_name (str): name of the blade component
+            center (Point2D | Point3D): the center of the circle
+            radius (Distance): the radius of the circle
+            angle_of_attack_deg (Angle): angle of attack
+            n_airfoils (int): the number of airfoils on the circle
+            pitch_sign (int): 1 if the pitch is applied counterclockwise, -1 otherwise
+        """
+        center = Point3D([center.x.m, center.y.m, 0], center.x.units) if type(center) == Point2D else center
+        blades = list(self._components[component_name].bodies)
+        self._layout = BladeLayout(component_name, center, radius, angle_of_attack_deg, n_airfoils, pitch_sign, blades)
+
+    def __blade_pivot(self, angle_deg: float) -> Point3D:
+        """
+        Get the point of the circle at given angle, the pitch axis of the blade placed there.
+
+        Args:
+            angle_deg (float): angle on the circle (degrees)
+        Returns:
+            Point3D: the point
+        """
+        layout = self._layout
+        units = layout.center.x.units
+        r = layout.radius.value.to(units).m
+        return Point3D([layout.center.x.m + r * cos(radians(angle_deg)),
+                        layout.center.y.m + r * sin(radians(angle_deg)), 0], units)
+
+    def __rebuild_component(self,
+                            component_name: str,
+                            sketch_controllers: list[SketchController] | SketchController | None = None):
+        """
+        Replace bodies of a component by bodies of new sketches, or of its recorded sketches,
+        and recreate its named selection.
+
+        Args:
+            component_name (str): name of the component
+            sketch_controllers (list[SketchController] | SketchController | None): new sketches,
+                                                                                   None to use the recorded ones
+        """
+        component = self._components[component_name]
+        for body in component.bodies:
+            component.delete_body(body)
+
+        # extrude sketches
+        if sketch_controllers is None:
+            sources = self._sources[component_name]
+        else:
+            sketch_controllers = [sketch_controllers] if type(sketch_controllers) == SketchController \
+                else sketch_controllers
+            sources = [sketch_controller.get() for sketch_controller in sketch_controllers]
+        for name, sketch in sources:
+            self.__extrude(component, name, sketch)
+
+        self._sketches[component_name] = [sketch for _, sketch in sources]
+        self._sources[component_name] = sources
+
+        # recreate named selection of the component
+        if component_name in self._selections:
+            self._design.delete_named_selection(self._selections[component_name])
+            self.add_named_selection(component_name, self._selections[component_name])
 
-            angle = Angle(i * 360.0 / n_airfoils)
-            airfoil_copy.rotate(center, UnitVector3D([0, 0, 1]), angle)
+    def update_layout(self,
+                      ring_name: str,
+                      radius: Distance | None = None,
+                      angle_of_attack_deg: Angle | None = None,
+                      n_airfoils: int | None = None,
+                      sketch_controllers: dict[str, list[SketchController] | SketchController] | None = None):
+        """
+        Change the blade layout of an incremental design without rebuilding it.
+        Existing blades are rotated about their pitch axis, translated along the radius
+        and rotated to new positions on the circle, missing blades are copied and extra ones deleted.
+        Then the ring is rebuilt, the subtraction, named selections and shared topology are redone.
+
+        Args:
+            ring_name (str): name of the ring component
+            radius (Distance | None): new radius of the circle, None to keep it
+            angle_of_attack_deg (Angle | None): new angle of attack, None to keep it
+            n_airfoils (int | None): new number of airfoils, None to keep it
+            sketch_controllers (dict[str, list[SketchController] | SketchController] | None): new sketches
+                of components which depend on the layout, e.g. the ring, the inner circle and the env
+                for a new radius or spread. The ring is rebuilt from its recorded sketches if not given.
+
+        Raise:
+            ValueError: the design is not incremental or the layout was not recorded
+        """
+        if not self._incremental or self._layout is None:
+            raise ValueError("update_layout requires an incremental design with a recorded blade layout")
+        if n_airfoils is not None and not n_airfoils > 0:
+            raise ValueError(f"\'n_airfoils\' parameter should be positive, got {n_airfoils}")
+
+        # the design must not change while it is exported
+        self.wait_for_exports()
+
+        layout = self._layout
+        component = self._components[layout.component_name]
+        axis = UnitVector3D([0, 0, 1])
+        n_old = layout.n_airfoils
+        n_new = n_old if n_airfoils is None else n_airfoils
+
+        for blade in layout.blades:
+            blade.set_suppressed(False)  # available in 25R2
+
+        # delete extra blades first, so they are not moved
+        for blade in layout.blades[n_new:]:
+            component.delete_body(blade)
+        layout.blades = layout.blades[:n_new]
+
+        # pitch about the axis of every blade
+        if angle_of_attack_deg is not None:
+            delta = Angle(layout.pitch_sign * (angle_of_attack_deg.value - layout.angle_of_attack_deg.value))
+            for i, blade in enumerate(layout.blades):
+                blade.rotate(self.__blade_pivot(i * 360.0 / n_old), axis, delta)
+            layout.angle_of_attack_deg = angle_of_attack_deg
+
+        # translate along the radius
+        if radius is not None:
+            delta = (radius.value - layout.radius.value).to(layout.center.x.units).m
+            for i, blade in enumerate(layout.blades):
+                angle = radians(i * 360.0 / n_old)
+                direction = UnitVector3D([cos(angle), sin(angle), 0]) if delta > 0 \
+                    else UnitVector3D([-cos(angle), -sin(angle), 0])
+                blade.translate(direction, Distance(abs(delta), layout.center.x.units))
+            layout.radius = radius
+
+        # move kept blades to their new position and add copies of the first one
+        if n_new != n_old:
+            for i, blade in enumerate(layout.blades):
+                blade.rotate(layout.center, axis, Angle(i * 360.0 / n_new - i * 360.0 / n_old, UNITS.degree))
+            for i in range(n_old, n_new):
+                blade = layout.blades[0].copy(component, f"Airfoil_{i}")
+                blade.rotate(layout.center, axis, Angle(i * 360.0 / n_new, UNITS.degree))
+                layout.blades.append(blade)
+            layout.n_airfoils = n_new
+
+        # rebuild layout dependent components, the ring always has holes of the old blades
+        sketch_controllers = dict(sketch_controllers) if sketch_controllers is not None else dict()
+        sketch_controllers.setdefault(ring_name, None)
+        for component_name, sketches in sketch_controllers.items():
+            self.__rebuild_component(component_name, sketches)
+
+        # redo the subtraction and all rule based named selections
+        if "wall" in [named_selection.name for named_selection in self._design.named_selections]:
+            self._design.delete_named_selection("wall")
+        self.add_wall(layout.component_name, ring_name)
+
+        for name in self._rules:
+            self._design.delete_named_selection(name)
+        self.create_named_selections(list(self._rules.values()))
+
+        self.delete_unnecessary_components()
+        self.share_topology()
 
     @staticmethod
     def __find_center_of_airfoil(airfoil: Body) -> Point3D:
@@ -313,19 +791,20 @@ class ModelerController:
         # Get the list of Vertex (Point3D)
         airfoil_vertices = airfoil.vertices
 
-        # calculate sum of all vertices as leading vectors
-        sum_ = Point3D([0, 0, 0])
-        for vertex in airfoil_vertices:
-            sum_ += vertex
-
-        # divide by number of vertices and return results
-        return sum_ / len(airfoil_vertices)
+        # average all vertices at once, as an array in base units
+        mean = array(airfoil_vertices, dtype=float).mean(axis=0)
+        return Point3D(mean, airfoil_vertices[0].base_unit)
 
     def share_topology(self):
         """
         Share topology between fluid bodies.
+        Skipped if the fluid domain was created by add_fluid_domain.
 
         """
+        if self._shared_by_construction:
+            print("Topology is shared by construction, skipping share_topology.")
+            return
+
         components = [comp for comp in self._design.components if comp.name in ('fluid-1', 'fluid-2', 'fluid-3')]
         bodies = []
         for comp in components:
@@ -340,33 +819,113 @@ class ModelerController:
         """
         self._design.plot()
 
-    def save(self, file_name: str):
+    @staticmethod
+    def restore(cache: ArtifactCache,
+                key: str,
+                file_name: str,
+                formats: tuple[str, ...] = ("fmd", "dsco")) -> dict[str, Path] | None:
+        """
+        Restore saved files of a design from the artifact cache, e.g. before the modeler is launched.
+
+        Args:
+            cache (ArtifactCache): the cache
+            key (str): key of the design parameters, see ArtifactCache.key
+            file_name (str): name of your file, as in save
+            formats (tuple[str, ...]): file formats needed
+        Returns:
+            dict[str, Path] | None: restored file of every format, None on a cache miss
+        """
+        restored = cache.fetch(key, formats, RESULTS / file_name)
+        if restored is not None:
+            print(f"Files restored from cache to: {RESULTS / file_name}")
+        return restored
+
+    def save(self,
+             file_name: str,
+             formats: tuple[str, ...] = ("fmd", "dsco"),
+             queue: ExportQueue | None = None,
+             cache: ArtifactCache | None = None,
+             key: str | None = None) -> dict[str, Future]:
         """
         Save your project.
+        With an export queue the files are written in the background. If the queue has a modeler pool,
+        they are exported from a snapshot of the design by another modeler and the design can be changed
+        or closed right away, wait for them with the queue. Otherwise the design must not be changed
+        until they are done: update_layout and close wait for them.
+        With an artifact cache the files are restored on a hit instead of exported, otherwise stored after export.
 
         Args:
             file_name (str): name of your file
-        """
-        print("Exporting to disco...")
-        self._design.export_to_fmd(RESULTS / file_name)
+            formats (tuple[str, ...]): file formats to export, in order, only fmd is needed by Mesh
+            queue (ExportQueue | None): queue to export in the background, None to export now
+            cache (ArtifactCache | None): the artifact cache
+            key (str | None): key of the design parameters, required with the cache
+        Returns:
+            dict[str, Future]: future of the exported file path for every format
+        """
+        if cache is not None:
+            if key is None:
+                raise ValueError("'key' parameter is required with the cache")
+
+            restored = self.restore(cache, key, file_name, formats)
+            if restored is not None:
+                futures = {file_format: Future() for file_format in formats}
+                for file_format, future in futures.items():
+                    future.set_result(restored[file_format])
+                return futures
+
+        def on_complete(file_format: str, path: Path):
+            cache.put(key, {file_format: path})
+
+        on_complete = on_complete if cache is not None else None
+        if queue is None:
+            queue = ExportQueue()
+            futures = queue.submit(self._design, RESULTS / file_name, formats, on_complete)
+            queue.shutdown()
+        elif queue.pool is not None:
+            # exported by another modeler, the design does not wait for it
+            return queue.submit_snapshot(self._design, RESULTS / file_name, formats, on_complete)
+        else:
+            futures = queue.submit(self._design, RESULTS / file_name, formats, on_complete)
 
-        print("Exporting to fmd...")
-        self._design.export_to_disco(RESULTS / file_name)
+        self._exports.extend(futures.values())
+        return futures
 
-        print(f"Files exported to: {RESULTS / file_name}")
+    def wait_for_exports(self):
+        """
+        Wait for all exports of the design.
+
+        Raise:
+            Exception: the first error of a failed export
+        """
+        exports, self._exports = self._exports, []
+        for future in exports:
+            future.result()
 
     def close(self):
         """
         Close environment.
+        A modeler leased from a pool is returned to it instead.
 
         """
-        self.modeler.close()
+        try:
+            self.wait_for_exports()
+        finally:
+            if self._pool is not None:
+                self._pool.release(self.modeler)
+            else:
+                self.modeler.close()
 
     def delete_unnecessary_components(self):
         """
         Delete unnecessary components from design, like NACA profiles.
+        In incremental mode blades are suppressed instead, so they can be moved later.
 
         """
         for comp in self._design.components:
             if comp.name not in ("fluid-1", "fluid-2", "fluid-3", "boi"):
-                self._design.delete_component(component=comp)
+                if self._incremental and self._layout is not None and comp.name == self._layout.component_name:
+                    for body in comp.bodies:
+                        body.set_suppressed(True)  # available in 25R2
+                else:
+                    self._design.delete_component(component=comp)
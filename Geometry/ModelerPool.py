@@ -0,0 +1,189 @@
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from ansys.geometry.core import launch_modeler, Modeler
+
+
+class ModelerPool:
+    """
+    ModelerPool is a class for keeping Discovery modelers alive between designs.
+    A design leases a modeler instead of launching a new one and returns it afterwards.
+    """
+    def __init__(self, size: int = 1, max_designs: int = 20, hidden: bool = True, warm: bool = True):
+        """
+        ModelerPool class constructor.
+
+        Args:
+            size (int): number of modelers kept alive
+            max_designs (int): number of designs after which a modeler is relaunched to bound memory growth
+            hidden (bool): whether to launch Discovery without GUI
+            warm (bool): whether to launch all modelers now, otherwise they are launched on first lease
+        """
+        self.__validate_positive(size, "size")
+        self.__validate_positive(max_designs, "max_designs")
+
+        self.size = size
+        self.max_designs = max_designs
+        self.hidden = hidden
+
+        self._idle: deque[Modeler] = deque()
+        self._leased: dict[int, Modeler] = dict()
+        self._n_designs: dict[int, int] = dict()
+        self._n_launched = 0
+        self._condition = Condition()
+
+        if warm:
+            try:
+                for _ in range(size):
+                    self._n_launched += 1
+                    self._idle.append(self.__launch())
+            except Exception:
+                self._n_launched -= 1
+                self.close()
+                raise
+
+    @staticmethod
+    def __validate_positive(value: int, name: str):
+        """
+        Validate positive integer parameter.
+
+        Raise:
+            ValueError: value is not positive
+        """
+        if not value > 0:
+            raise ValueError(f"\'{name}\' parameter should be positive, got {value}")
+
+    def __launch(self) -> Modeler:
+        """
+        Launch a new modeler.
+
+        Return:
+            Modeler: the modeler
+        """
+        modeler = launch_modeler(mode="Discovery", **{"timeout": 500, "hidden": self.hidden})
+        print(modeler)
+
+        with self._condition:
+            self._n_designs[id(modeler)] = 0
+        return modeler
+
+    @staticmethod
+    def __close(modeler: Modeler):
+        """
+        Close a modeler, errors are only reported.
+        """
+        try:
+            modeler.close()
+        except Exception as e:
+            print(f"Modeler could not be closed: {e}")
+
+    def __recycle(self, modeler: Modeler) -> Modeler:
+        """
+        Close a modeler and launch a new one in its place.
+        """
+        with self._condition:
+            self._n_designs.pop(id(modeler), None)
+        self.__close(modeler)
+
+        return self.__launch()
+
+    def __discard(self, modeler: Modeler | None):
+        """
+        Close a modeler which failed to be leased and free its slot.
+        """
+        if modeler is not None:
+            self.__close(modeler)
+        with self._condition:
+            if modeler is not None:
+                self._n_designs.pop(id(modeler), None)
+            self._n_launched -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def __is_healthy(modeler: Modeler) -> bool:
+        """
+        Check whether the modeler still responds.
+        """
+        try:
+            return modeler.client.healthy
+        except Exception:
+            return False
+
+    def lease(self) -> Modeler:
+        """
+        Lease a modeler with a clean workspace.
+        Blocks until a modeler is free if all of them are leased.
+
+        Return:
+            Modeler: the modeler
+        """
+        # launch lazily up to the pool size
+        with self._condition:
+            while not self._idle and self._n_launched >= self.size:
+                self._condition.wait()
+            if self._idle:
+                modeler = self._idle.pop()
+            else:
+                modeler = None
+                self._n_launched += 1
+
+        try:
+            modeler = self.__launch() if modeler is None else modeler
+
+            # health check and recycle policy
+            if not self.__is_healthy(modeler) or self._n_designs[id(modeler)] >= self.max_designs:
+                modeler = self.__recycle(modeler)
+
+            # reset the workspace
+            design = modeler.get_active_design(sync_with_backend=False)
+            if design is not None:
+                design.close()
+        except Exception:
+            # the modeler slot is free again
+            self.__discard(modeler)
+            raise
+
+        with self._condition:
+            self._n_designs[id(modeler)] += 1
+            self._leased[id(modeler)] = modeler
+        return modeler
+
+    def release(self, modeler: Modeler):
+        """
+        Return a leased modeler to the pool.
+
+        Args:
+            modeler (Modeler): the leased modeler
+        """
+        with self._condition:
+            self._leased.pop(id(modeler), None)
+            self._idle.append(modeler)
+            self._condition.notify()
+
+    @contextmanager
+    def modeler(self):
+        """
+        Lease a modeler for the duration of a with block.
+
+        """
+        modeler = self.lease()
+        try:
+            yield modeler
+        finally:
+            self.release(modeler)
+
+    def close(self):
+        """
+        Close all modelers, the leased ones as well.
+
+        """
+        with self._condition:
+            modelers = [*self._idle, *self._leased.values()]
+            self._idle.clear()
+            self._leased.clear()
+            self._n_designs.clear()
+            self._n_launched -= len(modelers)
+            self._condition.notify_all()
+
+        for modeler in modelers:
+            self.__close(modeler)
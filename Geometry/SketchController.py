@@ -1,8 +1,12 @@
 from ansys.geometry.core.sketch import Sketch
 from ansys.geometry.core.math import Point2D
 from ansys.geometry.core.misc import Distance, Angle
-from numpy import array
+from math import radians, cos, sin, sqrt
+from numpy import array, ndarray
 from Geometry.misc.points import *
+from Geometry.misc.arc_spline import fit_arc_spline
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.AirfoilFamily import AirfoilFamily
 
 
 class SketchController:
@@ -73,12 +77,41 @@ class SketchController:
             self.sketch.segment(points[i], points[i + 1])
         self.sketch.segment(points[-1], points[0])
 
+    def add_arc_spline(self, coordinates: ndarray, tolerance: float) -> int:
+        """
+        Add a closed contour to the sketch as a chain of fitted arcs instead of a segment per point.
+        Arcs are fitted locally, only their end and middle points are sent to the sketch.
+
+        Args:
+            coordinates (ndarray): (n, 2) array of contour points, not closed
+            tolerance (float): maximum distance between the points and the arcs
+        Return:
+            int: number of created arcs
+        """
+        arcs = fit_arc_spline(coordinates, tolerance)
+
+        # connect the fitted arcs, collinear parts are added as a line
+        for start, middle, end in arcs:
+            if middle is None:
+                self.sketch.segment(Point2D(coordinates[start]), Point2D(coordinates[end]))
+            else:
+                self.sketch.arc_from_three_points(
+                    Point2D(coordinates[start]), Point2D(coordinates[middle]), Point2D(coordinates[end])
+                )
+        self.sketch.segment(Point2D(coordinates[-1]), Point2D(coordinates[0]))
+
+        return len(arcs)
+
     @staticmethod
     def add_airfoils_by_sketch(naca_code: str | int,
                                n_airfoils: int,
                                center: Point2D,
                                radius: Distance,
-                               angle_of_attack_deg: Angle):
+                               angle_of_attack_deg: Angle,
+                               tolerance: float | None = None,
+                               spline_tolerance: float | None = None,
+                               pivot_at_centroid: bool = False,
+                               cache: AirfoilCache | None = None):
         """
         Create airfoil by points and add to a circle.
 
@@ -88,25 +121,170 @@ class SketchController:
             center (Point2D): the center of circle
             radius (Distance): radius of circle
             angle_of_attack_deg (Angle): angle of attack
+            tolerance (float | None): chord-relative deviation for curvature-adaptive points,
+                                      None for default cosine-spaced points
+            spline_tolerance (float | None): chord-relative deviation of fitted arcs,
+                                             None to connect the points with segments
+            pivot_at_centroid (bool): whether to pitch the airfoil around its centroid instead of mid-chord
+            cache (AirfoilCache | None): cache of generated airfoil points, shared by designs of a sweep
 
         Returns:
         """
-        # generate NACA points and place airfoil Geometry onto the circle
+        # generate NACA points once for all blades, adaptive points are picked from a dense family contour
+        family = AirfoilFamily([naca_code], 200 if tolerance is None else 2000, cache)
+        if tolerance is None:
+            base_foil = family.airfoil(0)
+        else:
+            base_foil, report = family.adaptive_airfoil(0, tolerance)
+            print(f"Adaptive airfoil: {report.n_points} points, max deviation {report.max_deviation:.2e}")
+
+        # pitch axis from the exact section centroid
+        pivot = Point2D(base_foil.section_properties().centroid) if pivot_at_centroid else None
+
+        # place all airfoils onto the circle at once
+        blades = rotor_layout(base_foil.coordinates, n_airfoils, center, radius, angle_of_attack_deg, pivot)
+
         airfoil_sketches = []
-        for i in range(n_airfoils):
+        for i, blade in enumerate(blades):
             sketch = SketchController(f"NACA_airfoil_{i + 1}")
 
-            angle = Angle(360.0 * i / n_airfoils)
-            foil = Airfoil(naca_code)
-            foil.generate_points()
-            placed_foil = translate_airfoil_on_circle(foil, center, radius, angle, angle_of_attack_deg)
-            sketch.add_points(placed_foil.points)
+            if spline_tolerance is None:
+                sketch.add_points([Point2D(xy) for xy in blade.tolist()])
+            else:
+                # placement does not scale the airfoil, so the tolerance stays chord-relative
+                sketch.add_arc_spline(blade, spline_tolerance)
 
             airfoil_sketches.append(sketch)
 
         # return results
         return airfoil_sketches
 
+    @staticmethod
+    def fluid_regions(center: Point2D,
+                      radius: Distance,
+                      spread: Distance,
+                      main_fluid_name: str,
+                      ring_name: str,
+                      inner_circle_name: str) -> dict[str, "SketchController"]:
+        """
+        Create sketches of the outer region (box with a hole), the ring and the inner disk.
+        The regions do not overlap and their circles are created from the same radii,
+        so neighbouring regions have coincident edges.
+
+        Args:
+            center (Point2D): the center of circles
+            radius (Distance): radius of center circle of the ring
+            spread (Distance): spread of the ring
+            main_fluid_name (str): name of the outer region
+            ring_name (str): name of the ring
+            inner_circle_name (str): name of the inner disk
+        Returns:
+            dict[str, SketchController]: sketch of every region by name, the ring first
+        """
+        inner_radius = Distance(radius.value - spread.value / 2.0)
+        outer_radius = Distance(radius.value + spread.value / 2.0)
+
+        ring_sketch = SketchController(ring_name)
+        ring_sketch.add_circle_using_arc(center, outer_radius)
+        ring_sketch.add_circle_using_arc(center, inner_radius)
+
+        inner_circle_sketch = SketchController(inner_circle_name)
+        inner_circle_sketch.add_circle_using_arc(center, inner_radius)
+
+        env_sketch = SketchController(main_fluid_name)
+        env_sketch.add_env(center, outer_radius)
+
+        return {ring_name: ring_sketch, inner_circle_name: inner_circle_sketch, main_fluid_name: env_sketch}
+
+    @staticmethod
+    def sector_regions(center: Point2D,
+                       radius: Distance,
+                       spread: Distance,
+                       n_sectors: int,
+                       outer_radius: Distance,
+                       main_fluid_name: str,
+                       ring_name: str,
+                       inner_circle_name: str) -> dict[str, "SketchController"]:
+        """
+        Create sketches of one blade passage of a rotor-alone domain: sectors of the outer region (up to outer_radius),
+        the ring and the inner disk. The sector spans 360 / n_sectors degrees around the first blade (at zero angle),
+        from -180 / n_sectors to 180 / n_sectors degrees, so its sides are rotational-periodic.
+
+        Args:
+            center (Point2D): the center of circles
+            radius (Distance): radius of center circle of the ring
+            spread (Distance): spread of the ring
+            n_sectors (int): number of blade passages, i.e. number of airfoils of the full rotor
+            outer_radius (Distance): radius of the outer boundary
+            main_fluid_name (str): name of the outer region
+            ring_name (str): name of the ring
+            inner_circle_name (str): name of the inner disk
+        Returns:
+            dict[str, SketchController]: sketch of every region by name, the ring first
+        """
+        if not (isinstance(n_sectors, int) and n_sectors > 1):
+            raise ValueError(f"\'n_sectors\' parameter should be int greater than 1, got {n_sectors}")
+
+        inner_radius = Distance(radius.value - spread.value / 2.0)
+        ring_radius = Distance(radius.value + spread.value / 2.0)
+
+        # the outer boundary is told from the ring boundary by the bounding box of its faces
+        if not outer_radius.value.m > sqrt(2) * ring_radius.value.m:
+            raise ValueError(f"\'outer_radius\' parameter should be greater than {sqrt(2) * ring_radius.value.m:.3f}, "
+                             f"got {outer_radius.value.m}")
+
+        start_angle = Angle(-180.0 / n_sectors)
+        sector_angle = Angle(360.0 / n_sectors)
+
+        ring_sketch = SketchController(ring_name)
+        ring_sketch.add_sector(center, inner_radius, ring_radius, start_angle, sector_angle)
+
+        inner_circle_sketch = SketchController(inner_circle_name)
+        inner_circle_sketch.add_sector(center, None, inner_radius, start_angle, sector_angle)
+
+        env_sketch = SketchController(main_fluid_name)
+        env_sketch.add_sector(center, ring_radius, outer_radius, start_angle, sector_angle)
+
+        return {ring_name: ring_sketch, inner_circle_name: inner_circle_sketch, main_fluid_name: env_sketch}
+
+    def add_sector(self,
+                   center: Point2D,
+                   inner_radius: Distance | None,
+                   outer_radius: Distance,
+                   start_angle: Angle,
+                   sector_angle: Angle):
+        """
+        Add an annular sector (or a circular sector if inner_radius is None) to the sketch.
+
+        Args:
+            center (Point2D): center of circles
+            inner_radius (Distance | None): inner radius, None for a sector with the vertex in the center
+            outer_radius (Distance): outer radius
+            start_angle (Angle): angle of the first side (degrees)
+            sector_angle (Angle): angle between the sides (degrees), counterclockwise
+        """
+        start = radians(start_angle.value.m)
+        end = radians(start_angle.value.m + sector_angle.value.m)
+
+        def point(r: float, angle: float) -> Point2D:
+            return Point2D([center.x.m + r * cos(angle), center.y.m + r * sin(angle)])
+
+        outer_start, outer_end = point(outer_radius.value.m, start), point(outer_radius.value.m, end)
+        if inner_radius is None:
+            (
+                self.sketch.segment(center, outer_start)
+                .arc_to_point(outer_end, center)
+                .segment_to_point(center)
+            )
+        else:
+            inner_start, inner_end = point(inner_radius.value.m, start), point(inner_radius.value.m, end)
+            (
+                self.sketch.segment(inner_start, outer_start)
+                .arc_to_point(outer_end, center)
+                .segment_to_point(inner_end)
+                .arc_to_point(inner_start, center, clockwise=True)
+            )
+
     def add_env(self,
                 center: Point2D,
                 radius: Distance):
@@ -0,0 +1,387 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from itertools import product
+from multiprocessing.util import Finalize
+from time import perf_counter
+from Geometry.SketchController import SketchController
+from Geometry.ModelerController import ModelerController
+from Geometry.ModelerPool import ModelerPool
+from Geometry.ExportQueue import ExportQueue
+from Geometry.DomainModel import check_designs, mesh_min_gap
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.misc.PATHS import AIRFOIL_MODEL_2D, AIRFOIL_MODEL_3D
+from ArtifactCache import ArtifactCache, file_checksum
+from Mesh.default_params.PrismParams import PrismParams
+from Mesh.default_params.SizingParams import CurvatureSizingParams
+from ansys.geometry.core.math import Point2D
+from ansys.geometry.core.misc import UNITS, Distance, Angle
+from ansys.geometry.core.misc.measurements import DEFAULT_UNITS
+
+"""
+Parametric sweep of the geometry built in Geometry/main.py.
+Design points are built concurrently on a process pool, every worker keeps one modeler alive.
+"""
+
+
+# --- Developer parameters, same as in Geometry/main.py --- #
+MAIN_FLUID_NAME = 'fluid-1'
+RING_NAME = 'fluid-2'
+INNER_CIRCLE_NAME = "fluid-3"
+NACA_NAME = "NACA"
+BOI_NAME = "boi"
+
+# gaps should hold the default prism layers on both walls and the smallest curvature cell
+_prism = PrismParams()
+MIN_GAP = mesh_min_gap(_prism.n_layers, _prism.first_height, _prism.growth_rate, CurvatureSizingParams().min)
+
+
+@dataclass
+class DesignPoint:
+    """
+    Parameters of a single design, as in Geometry/main.py.
+    Lengths are in meters, angles in degrees.
+    """
+    n_airfoils: int
+    radius: float
+    angle_of_attack_deg: float
+    spread: float
+    model_type: str = "2D"
+    naca_code: str = "0012"  # only if file_name is None
+    file_name: str | None = None  # airfoil model from file, e.g. 'airfoil6412.dsco'
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Get the artifact cache key of the design, the airfoil file is keyed by its content.
+
+        Return:
+            str: the key
+        """
+        params = asdict(self)
+        params["model_type"] = self.model_type.upper()
+        if self.file_name is not None:
+            path = AIRFOIL_MODEL_3D if self.model_type.upper() == "3D" else AIRFOIL_MODEL_2D
+            params["file_name"] = file_checksum(path / self.file_name)
+        return ArtifactCache.key("geometry", params)
+
+    @property
+    def label(self) -> str:
+        """
+        Get a unique name of the design, used as the save file name.
+
+        Return:
+            str: the name
+        """
+        airfoil = self.file_name.split(".")[0] if self.file_name is not None else f"naca{self.naca_code}"
+        return (f"model_{self.model_type.upper()}_{airfoil}_n{self.n_airfoils}_r{self.radius:g}"
+                f"_aoa{self.angle_of_attack_deg:g}_s{self.spread:g}")
+
+
+@dataclass
+class DesignResult:
+    point: DesignPoint
+    save_file_name: str | None = None
+    elapsed: float = 0.0  # seconds
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def grid(**values) -> list[DesignPoint]:
+    """
+    Create design points from all combinations of given values.
+    Parameters which are not given take DesignPoint defaults.
+
+    Example:
+        grid(n_airfoils=[2, 3], radius=[2.0], angle_of_attack_deg=[80, 90], spread=[0.7])
+
+    Args:
+        **values: DesignPoint field name and a list of its values
+    Return:
+        list[DesignPoint]: the design points
+    """
+    names = list(values)
+    return [DesignPoint(**dict(zip(names, combination))) for combination in product(*values.values())]
+
+
+def _layout_sketches(point: DesignPoint) -> dict[str, SketchController]:
+    """
+    Create sketches of components which depend on the radius and spread: the ring, the inner circle
+    and the env, whose hole is the outer circle of the ring.
+
+    """
+    return SketchController.fluid_regions(Point2D([0, 0]), Distance(point.radius), Distance(point.spread),
+                                          MAIN_FLUID_NAME, RING_NAME, INNER_CIRCLE_NAME)
+
+
+def _build(modeler: ModelerController, point: DesignPoint, airfoil_cache: AirfoilCache | None = None):
+    """
+    Build all components of a design, the same pipeline as Geometry/main.py without plotting and saving.
+
+    """
+    DEFAULT_UNITS.LENGTH = UNITS.meter
+    DEFAULT_UNITS.ANGLE = UNITS.degree
+
+    center = Point2D([0, 0])
+    radius = Distance(point.radius)
+    angle_of_attack_deg = Angle(point.angle_of_attack_deg)
+
+    # airfoils
+    if point.file_name is not None:
+        modeler.load_airfoils(point.file_name, center, radius, angle_of_attack_deg, point.n_airfoils)
+    else:
+        airfoil_sketch = SketchController(NACA_NAME)
+        airfoil_sketches = airfoil_sketch.add_airfoils_by_sketch(point.naca_code, point.n_airfoils, center,
+                                                                 radius, angle_of_attack_deg, cache=airfoil_cache)
+        modeler.add_component(NACA_NAME, airfoil_sketches)
+        modeler.record_layout(NACA_NAME, center, radius, angle_of_attack_deg, point.n_airfoils)
+
+    # ring without cuts, inner circle and env
+    for name, sketch in _layout_sketches(point).items():
+        modeler.add_component(name, sketch)
+        modeler.add_named_selection(name, name)
+
+    # wall, inlet, outlet (and symmetry in 3D)
+    modeler.add_wall(NACA_NAME, RING_NAME)
+    modeler.create_named_selections(modeler.boundary_rules(MAIN_FLUID_NAME))
+
+    # body of influence
+    boi_sketch = SketchController(BOI_NAME)
+    boi_sketch.add_boi(center)
+    modeler.add_component(BOI_NAME, boi_sketch)
+    modeler.add_named_selection(BOI_NAME, BOI_NAME)
+
+    modeler.delete_unnecessary_components()
+    modeler.share_topology()
+
+
+def build_design(point: DesignPoint,
+                 pool: ModelerPool | None = None,
+                 cache: ArtifactCache | None = None,
+                 airfoil_cache: AirfoilCache | None = None) -> str:
+    """
+    Build and save a single design.
+
+    Args:
+        point (DesignPoint): the design point
+        pool (ModelerPool | None): pool to lease the modeler from, a new modeler is launched if None
+        cache (ArtifactCache | None): artifact cache, the design is not built if its files are cached
+        airfoil_cache (AirfoilCache | None): cache of generated airfoil points
+    Return:
+        str: the save file name
+    """
+    if cache is not None and ModelerController.restore(cache, point.cache_key, point.label) is not None:
+        return point.label
+
+    modeler = ModelerController("Wind_Turbine", point.model_type, point.file_name is not None, pool)
+    try:
+        _build(modeler, point, airfoil_cache)
+        if cache is not None:
+            modeler.save(point.label, cache=cache, key=point.cache_key)
+        else:
+            modeler.save(point.label)
+    finally:
+        modeler.close()
+
+    return point.label
+
+
+def same_base(a: DesignPoint, b: DesignPoint) -> bool:
+    """
+    Check whether two designs differ only in the blade layout (radius, angle of attack, number of airfoils)
+    and spread, so one can be updated into the other.
+
+    """
+    return (a.model_type.upper(), a.file_name, a.naca_code) == (b.model_type.upper(), b.file_name, b.naca_code)
+
+
+def build_variants(points: list[DesignPoint],
+                   pool: ModelerPool | None = None,
+                   airfoil_cache: AirfoilCache | None = None,
+                   queue: ExportQueue | None = None) -> list[str]:
+    """
+    Build and save designs sharing the airfoil and model type in a single design.
+    The first design is built from scratch, the others move its blades and rebuild only the ring,
+    the inner circle and the env. Every variant is exported from its snapshot while the next one is built.
+
+    Args:
+        points (list[DesignPoint]): the design points, all with the same airfoil and model type
+        pool (ModelerPool | None): pool to lease the modeler from, a new modeler is launched if None
+        airfoil_cache (AirfoilCache | None): cache of generated airfoil points
+        queue (ExportQueue | None): export queue with a modeler pool shared by many calls,
+                                    a queue with one exporting modeler is launched if None
+    Return:
+        list[str]: the save file names, all exported
+
+    Raise:
+        ValueError: designs differ in the airfoil or model type
+    """
+    if not all(same_base(points[0], point) for point in points):
+        raise ValueError("all variants should have the same airfoil and model type")
+
+    own_queue = queue is None
+    if own_queue:
+        queue = ExportQueue(pool=ModelerPool(size=1, warm=False))
+
+    first = points[0]
+    futures = []
+    try:
+        modeler = ModelerController("Wind_Turbine", first.model_type, first.file_name is not None, pool,
+                                    incremental=True)
+        try:
+            _build(modeler, first, airfoil_cache)
+            futures.extend(modeler.save(first.label, queue=queue).values())
+
+            for point in points[1:]:
+                modeler.update_layout(RING_NAME, Distance(point.radius), Angle(point.angle_of_attack_deg),
+                                      point.n_airfoils, _layout_sketches(point))
+                futures.extend(modeler.save(point.label, queue=queue).values())
+        finally:
+            modeler.close()
+
+        queue.wait(futures)
+    finally:
+        if own_queue:
+            queue.shutdown()
+            queue.pool.close()
+
+    return [point.label for point in points]
+
+
+# --- Process pool worker state, one modeler per worker process --- #
+_worker_pool: ModelerPool | None = None
+_worker_cache: ArtifactCache | None = None
+_worker_airfoil_cache: AirfoilCache | None = None
+
+
+def _init_worker(max_designs: int, hidden: bool, cache: ArtifactCache | None):
+    """
+    Launch the modeler of a worker process and close it when the process exits.
+    Airfoil points are shared by all workers through the on-disk level of the airfoil cache.
+
+    """
+    global _worker_pool, _worker_cache, _worker_airfoil_cache
+    _worker_cache = cache
+    _worker_airfoil_cache = AirfoilCache()
+    _worker_pool = ModelerPool(size=1, max_designs=max_designs, hidden=hidden)
+    Finalize(_worker_pool, _worker_pool.close, exitpriority=10)
+
+
+def _run(point: DesignPoint) -> DesignResult:
+    """
+    Build a design in a worker process, failures are reported in the result.
+
+    """
+    start = perf_counter()
+    try:
+        save_file_name = build_design(point, _worker_pool, _worker_cache, _worker_airfoil_cache)
+        return DesignResult(point, save_file_name, perf_counter() - start)
+    except Exception as e:
+        return DesignResult(point, None, perf_counter() - start, f"{type(e).__name__}: {e}")
+
+
+class Sweep:
+    """
+    Sweep is a class for building many designs concurrently.
+    Every worker process leases designs from its own long-lived modeler,
+    so the number of workers is the number of running Discovery instances.
+    """
+    def __init__(self,
+                 points: list[DesignPoint],
+                 max_workers: int = 2,
+                 max_designs: int = 20,
+                 hidden: bool = True,
+                 min_gap: float | None = MIN_GAP,
+                 cache: ArtifactCache | None = None):
+        """
+        Sweep class constructor.
+
+        Args:
+            points (list[DesignPoint]): design points
+            max_workers (int): concurrency cap, the number of modelers running at once
+            max_designs (int): number of designs after which a worker relaunches its modeler
+            hidden (bool): whether to launch Discovery without GUI
+            min_gap (float | None): minimum gap checked by check_designs before building generated airfoils,
+                                    None to skip the check
+            cache (ArtifactCache | None): artifact cache, cached designs are restored instead of built
+        """
+        if not max_workers > 0:
+            raise ValueError(f"\'max_workers\' parameter should be positive, got {max_workers}")
+
+        self.points = list(points)
+        self.max_workers = max_workers
+        self.max_designs = max_designs
+        self.hidden = hidden
+        self.min_gap = min_gap
+        self.cache = cache
+        self.airfoil_cache = AirfoilCache()
+
+    def __precheck(self) -> list[str | None]:
+        """
+        Check the layouts of all generated designs at once without the modeler.
+
+        Return:
+            list[str | None]: the issues of every design, None if the design can be built
+        """
+        issues: list[str | None] = [None] * len(self.points)
+        if self.min_gap is None:
+            return issues
+
+        generated = [i for i, point in enumerate(self.points) if point.file_name is None]
+        designs = [dict(radius=self.points[i].radius, spread=self.points[i].spread,
+                        n_airfoils=self.points[i].n_airfoils, angle_of_attack_deg=self.points[i].angle_of_attack_deg,
+                        naca_code=self.points[i].naca_code) for i in generated]
+        for i, report in zip(generated, check_designs(designs, self.min_gap, self.airfoil_cache)):
+            if not report.valid:
+                issues[i] = "Invalid geometry parameters: " + "; ".join(report.issues)
+        return issues
+
+    def run(self) -> list[DesignResult]:
+        """
+        Build all design points.
+
+        Return:
+            list[DesignResult]: result of every design, in the order of points
+        """
+        results: list[DesignResult | None] = [None] * len(self.points)
+
+        # invalid layouts fail without occupying a modeler
+        to_build = []
+        for i, (point, issues) in enumerate(zip(self.points, self.__precheck())):
+            if issues is None:
+                to_build.append(i)
+            else:
+                results[i] = DesignResult(point, error=issues)
+
+        if to_build:
+            n_workers = min(self.max_workers, len(to_build))
+            with ProcessPoolExecutor(n_workers, initializer=_init_worker,
+                                     initargs=(self.max_designs, self.hidden, self.cache)) as executor:
+                futures = {executor.submit(_run, self.points[i]): i for i in to_build}
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    print(f"{'done' if result.ok else 'failed'}: {result.point.label} ({result.elapsed:.1f} s)")
+
+        return results
+
+    @staticmethod
+    def report(results: list[DesignResult]):
+        """
+        Print timing and failures of a sweep.
+
+        Args:
+            results (list[DesignResult]): results of Sweep.run
+        """
+        built = [result for result in results if result.ok]
+        failed = [result for result in results if not result.ok]
+
+        print(f"Built {len(built)} of {len(results)} designs.")
+        if built:
+            times = [result.elapsed for result in built]
+            print(f"Time per design: min {min(times):.1f} s, mean {sum(times) / len(times):.1f} s, "
+                  f"max {max(times):.1f} s")
+        for result in failed:
+            print(f"Failed {asdict(result.point)}: {result.error}")
@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from math import radians, cos, sin
+from numpy import ndarray, array, full, nan, isin, isnan, abs as abs_, zeros, maximum
+from numpy.linalg import norm
+from ansys.geometry.core.designer import Body
+from ansys.geometry.core.designer.face import Face
+from ansys.geometry.core.designer.edge import Edge
+
+
+@dataclass
+class SelectionRule:
+    """
+    Declarative rule of a named selection.
+    A face (3D) or edge (2D) is selected if it matches all given conditions.
+    """
+    name: str
+    components: tuple[str, ...] | None = None  # component names to search, None for all
+    exclude_bodies: tuple[str, ...] = ()  # body names to skip
+    normals: tuple[tuple[float, float, float], ...] = ()  # face normal equal to any of them
+    x_side: int = 0  # -1: entirely at x < 0, 1: entirely at x > 0, 0: any
+    ray_deg: float | None = None  # bounding box center on the ray from the origin at this angle (XY plane)
+    min_reach: float | None = None  # farthest bounding box corner at least this far from the origin (XY plane)
+    tolerance: float = 1e-9
+    distance_tolerance: float = 1e-6
+
+
+class TopologySnapshot:
+    """
+    TopologySnapshot is a local copy of topology of given bodies.
+    Faces (3D) or edges (2D) are queried once, in one pass, and kept as arrays,
+    so many named selections can be classified locally.
+    Only the properties the given rules need are queried, and only of elements the rules can select.
+    """
+    def __init__(self, bodies: list[Body], component_names: list[str], model_type: str, rules: list[SelectionRule]):
+        """
+        TopologySnapshot class constructor.
+
+        Args:
+            bodies (list[Body]): bodies to snapshot
+            component_names (list[str]): name of the parent component of every body
+            model_type (str): 2D (edges are used) or 3D (faces are used)
+            rules (list[SelectionRule]): rules which will be evaluated on the snapshot
+        """
+        self._model_type = model_type.upper()
+
+        self.entities: list[Face | Edge] = []
+        self.ids: list[str] = []
+        body_names, components = [], []
+        for body, component_name in zip(bodies, component_names):
+            elements = body.faces if self._model_type == "3D" else body.edges
+            self.entities.extend(elements)
+            self.ids.extend(element.id for element in elements)
+            body_names.extend([body.name] * len(elements))
+            components.extend([component_name] * len(elements))
+
+        self.body_names = array(body_names, dtype=object)
+        self.component_names = array(components, dtype=object)
+
+        # geometric properties, NaN if not available for an element
+        n = len(self.entities)
+        self.normals = full((n, 3), nan)
+        self.bbox_min = full((n, 3), nan)
+        self.bbox_max = full((n, 3), nan)
+        self.failures: dict[str, str] = dict()  # error of every element id which could not be queried
+
+        self.__query(rules)
+
+    @staticmethod
+    def __needs_bbox(rule: SelectionRule) -> bool:
+        return rule.x_side != 0 or rule.ray_deg is not None or rule.min_reach is not None
+
+    def __candidates(self, rule: SelectionRule) -> ndarray:
+        """
+        Get elements a rule can select by names only, without geometric properties.
+
+        """
+        selected = ~isin(self.body_names, list(rule.exclude_bodies))
+        if rule.components is not None:
+            selected &= isin(self.component_names, list(rule.components))
+        return selected
+
+    def __query(self, rules: list[SelectionRule]):
+        """
+        Query geometric properties the rules need, every property is a round trip per element.
+        Failures are kept in failures and reported, rules which need a missing property raise in mask.
+
+        """
+        need_normals = zeros(len(self), dtype=bool)
+        need_bbox = zeros(len(self), dtype=bool)
+        for rule in rules:
+            if rule.normals and self._model_type == "3D":
+                need_normals |= self.__candidates(rule)
+            if self.__needs_bbox(rule):
+                need_bbox |= self.__candidates(rule)
+
+        for i in (need_normals | need_bbox).nonzero()[0]:
+            element = self.entities[i]
+            try:
+                if need_normals[i]:
+                    normal = element.normal()
+                    self.normals[i] = [normal.x, normal.y, normal.z]
+                if need_bbox[i] and self._model_type == "3D":
+                    box = element.bounding_box
+                    self.bbox_min[i] = box.min_corner.position
+                    self.bbox_max[i] = box.max_corner.position
+                elif need_bbox[i]:
+                    start, end = element.start.position, element.end.position
+                    self.bbox_min[i] = [min(a, b) for a, b in zip(start, end)]
+                    self.bbox_max[i] = [max(a, b) for a, b in zip(start, end)]
+            except Exception as e:
+                self.failures[self.ids[i]] = f"{type(e).__name__}: {e}"
+
+        if self.failures:
+            print(f"Topology of {len(self.failures)} elements could not be queried: "
+                  + "; ".join(f"{element_id} ({error})" for element_id, error in self.failures.items()))
+
+    def __validate_queried(self, rule: SelectionRule, candidates: ndarray, values: ndarray, name: str):
+        """
+        Validate that a property needed by a rule is available for all its candidates.
+
+        Raise:
+            ValueError: property is missing
+        """
+        missing = candidates & isnan(values).any(axis=1)
+        if missing.any():
+            ids = [self.ids[i] for i in missing.nonzero()[0]]
+            raise ValueError(f"{name} of {len(ids)} elements are missing for rule \'{rule.name}\' ({', '.join(ids)}), "
+                             f"the query failed or the rule was not given to the snapshot")
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def mask(self, rule: SelectionRule) -> ndarray:
+        """
+        Evaluate a rule on all elements at once.
+
+        Args:
+            rule (SelectionRule): the rule
+        Return:
+            ndarray: boolean mask of selected elements
+        """
+        selected = self.__candidates(rule)
+        if rule.normals:
+            self.__validate_queried(rule, selected, self.normals, "normals")
+        if self.__needs_bbox(rule):
+            self.__validate_queried(rule, selected, self.bbox_min, "bounding boxes")
+
+        if rule.normals:
+            matches = zeros(len(self), dtype=bool)
+            for normal in rule.normals:
+                matches |= (abs_(self.normals - array(normal)) <= rule.tolerance).all(axis=1)
+            selected &= matches
+
+        if rule.x_side < 0:
+            selected &= self.bbox_max[:, 0] < 0
+        elif rule.x_side > 0:
+            selected &= self.bbox_min[:, 0] > 0
+
+        if rule.ray_deg is not None:
+            direction = array([cos(radians(rule.ray_deg)), sin(radians(rule.ray_deg))])
+            middle = (self.bbox_min[:, :2] + self.bbox_max[:, :2]) / 2
+            cross = direction[0] * middle[:, 1] - direction[1] * middle[:, 0]
+            selected &= (abs_(cross) <= rule.distance_tolerance) & (middle @ direction > 0)
+
+        if rule.min_reach is not None:
+            farthest = maximum(abs_(self.bbox_min[:, :2]), abs_(self.bbox_max[:, :2]))
+            selected &= norm(farthest, axis=1) >= rule.min_reach - rule.distance_tolerance
+
+        return selected
+
+    def select(self, rule: SelectionRule) -> list[Face | Edge]:
+        """
+        Select elements matching a rule.
+
+        Args:
+            rule (SelectionRule): the rule
+        Return:
+            list[Face | Edge]: selected faces (3D) or edges (2D)
+        """
+        return [self.entities[i] for i in self.mask(rule).nonzero()[0]]
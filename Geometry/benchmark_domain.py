@@ -0,0 +1,148 @@
+from time import perf_counter
+from Geometry.SketchController import SketchController
+from Geometry.ModelerController import ModelerController
+from Geometry.ModelerPool import ModelerPool
+from Mesh.meshing.Meshing import Meshing
+from Mesh.PrimePool import PrimePool
+from ansys.geometry.core.math import Point2D
+from ansys.geometry.core.misc import UNITS, Distance, Angle
+from ansys.geometry.core.misc.measurements import DEFAULT_UNITS
+
+"""
+Benchmark of the fluid domain construction: the baseline of Geometry/main.py (ring, inner circle and env
+joined by share_topology) against regions created with shared edges (ModelerController.add_fluid_domain),
+in 2D and 3D. The exported fmd of both is imported to Prime to check that the interfaces stay conformal.
+"""
+
+
+# --- DEFAULT UNITS --- #
+DEFAULT_UNITS.LENGTH = UNITS.meter
+DEFAULT_UNITS.ANGLE = UNITS.degree
+
+# --- USER PARAMETERS --- #
+n_airfoils = 3
+naca_code = "0012"
+center = Point2D([0, 0])
+radius = Distance(2)
+angle_of_attack_deg = Angle(90.0)
+spread = Distance(0.7)
+model_types = ("2D", "3D")
+repeats = 3
+
+main_fluid_name = 'fluid-1'
+ring_name = 'fluid-2'
+inner_circle_name = "fluid-3"
+naca_name = "NACA"
+boi_name = "boi"
+
+
+def build(modeler: ModelerController, pre_split: bool) -> dict[str, float]:
+    """
+    Build the fluid domain with blades as Geometry/main.py does and time every stage.
+
+    Args:
+        modeler (ModelerController): the modeler
+        pre_split (bool): whether to create the regions with shared edges instead of share_topology
+    Return:
+        dict[str, float]: wall time of every stage in seconds
+    """
+    timings = dict()
+
+    start = perf_counter()
+    airfoil_sketches = SketchController.add_airfoils_by_sketch(naca_code, n_airfoils, center, radius,
+                                                               angle_of_attack_deg)
+    modeler.add_component(naca_name, airfoil_sketches)
+    timings["airfoils"] = perf_counter() - start
+
+    start = perf_counter()
+    if pre_split:
+        modeler.add_fluid_domain(center, radius, spread, main_fluid_name, ring_name, inner_circle_name)
+    else:
+        # ring without cuts
+        ring_sketch = SketchController(ring_name)
+        ring_sketch.add_ring(center, radius, spread)
+        modeler.add_component(ring_name, ring_sketch)
+        modeler.add_named_selection(ring_name, ring_name)
+
+        # inner circle
+        inner_circle_sketch = SketchController(inner_circle_name)
+        inner_circle_sketch.add_circle_using_arc(center, Distance(radius.value.m - spread.value.m / 2.0))
+        modeler.add_component(inner_circle_name, inner_circle_sketch)
+        modeler.add_named_selection(inner_circle_name, inner_circle_name)
+
+        # env
+        env_sketch = SketchController(main_fluid_name)
+        env_sketch.add_env(center, Distance(radius.value.m + spread.value.m / 2.0))
+        modeler.add_component(main_fluid_name, env_sketch)
+        modeler.add_named_selection(main_fluid_name, main_fluid_name)
+    timings["domain"] = perf_counter() - start
+
+    start = perf_counter()
+    modeler.add_wall(naca_name, ring_name)
+    modeler.create_named_selections(modeler.boundary_rules(main_fluid_name))
+    timings["named selections"] = perf_counter() - start
+
+    start = perf_counter()
+    boi_sketch = SketchController(boi_name)
+    boi_sketch.add_boi(center)
+    modeler.add_component(boi_name, boi_sketch)
+    modeler.add_named_selection(boi_name, boi_name)
+    timings["boi"] = perf_counter() - start
+
+    start = perf_counter()
+    modeler.delete_unnecessary_components()
+    modeler.share_topology()
+    timings["share topology"] = perf_counter() - start
+
+    return timings
+
+
+def check_interfaces(model_type: str, file_name: str, pool: PrimePool) -> tuple[int, int]:
+    """
+    Import the exported design to Prime, as Mesh/main.py does, and diagnose the fluid regions.
+
+    Args:
+        model_type (str): 2D or 3D
+        file_name (str): name of the exported file (with extension)
+        pool (PrimePool): pool of Prime servers
+    Return:
+        tuple[int, int]: number of free edges and duplicate faces
+    """
+    meshing = Meshing(model_type, pool)
+    try:
+        meshing.read_geometry(file_name)
+        surf_report = meshing.check_interfaces()
+        return surf_report.n_free_edges, surf_report.n_duplicate_faces
+    finally:
+        meshing.exit()
+
+
+pool = ModelerPool(size=1)
+prime_pool = PrimePool(size=1)
+for model_type in model_types:
+    reference = None
+    # regions with shared edges first, their free edges are the reference of conformal interfaces in 2D
+    for pre_split in (True, False):
+        label = "pre-split" if pre_split else "share_topology"
+        totals: dict[str, float] = dict()
+        for repeat in range(repeats):
+            modeler = ModelerController(f"Benchmark_{label}", model_type, False, pool)
+            for stage, elapsed in build(modeler, pre_split).items():
+                totals[stage] = totals.get(stage, 0.0) + elapsed
+            if repeat == repeats - 1:
+                # export once, the mesh reads model files of the model type
+                exported = modeler.save(f"model_{model_type}", formats=("fmd",))["fmd"].result()
+            modeler.close()
+
+        stages = ", ".join(f"{stage} {elapsed / repeats:.2f} s" for stage, elapsed in totals.items())
+        print(f"{model_type} {label}: total {sum(totals.values()) / repeats:.2f} s ({stages})")
+
+        n_free_edges, n_duplicate_faces = check_interfaces(model_type, exported.name, prime_pool)
+        if reference is None:
+            reference = n_free_edges
+        # in 3D every region is closed, in 2D the outer boundary and the walls stay free
+        conformal = n_duplicate_faces == 0 and n_free_edges == (0 if model_type == "3D" else reference)
+        print(f"{model_type} {label}: interfaces {'conformal' if conformal else 'NOT conformal'} in Prime "
+              f"({n_free_edges} free edges, {n_duplicate_faces} duplicate faces)")
+pool.close()
+prime_pool.close()
@@ -1,5 +1,12 @@
 from Geometry.SketchController import SketchController
 from Geometry.ModelerController import ModelerController
+from Geometry.DomainModel import DomainModel, mesh_min_gap
+from Geometry.AirfoilCache import AirfoilCache
+from Geometry.ExportQueue import ExportQueue
+from Geometry.misc.PATHS import AIRFOIL_MODEL_2D, AIRFOIL_MODEL_3D
+from ArtifactCache import ArtifactCache, file_checksum
+from Mesh.default_params.PrismParams import PrismParams
+from Mesh.default_params.SizingParams import CurvatureSizingParams
 from ansys.geometry.core.math import Point2D
 from ansys.geometry.core.misc import UNITS, Distance, Angle
 from ansys.geometry.core.misc.measurements import DEFAULT_UNITS
@@ -17,6 +24,8 @@ DEFAULT_UNITS.ANGLE = UNITS.degree
 n_airfoils = 3
 launch_airfoil_from_file = True
 naca_code = "0012"  # only if launch_airfoil_from_file = False
+airfoil_tolerance = None  # only if launch_airfoil_from_file = False, chord-relative deviation, e.g. 1e-4
+spline_tolerance = None  # only if launch_airfoil_from_file = False, fit arcs instead of segments, e.g. 1e-4
 file_name = 'airfoil6412.dsco'  # only if launch_airfoil_from_file = True
 center = Point2D([0, 0])
 radius = Distance(2)
@@ -24,6 +33,9 @@ angle_of_attack_deg = Angle(90.0)
 spread = Distance(0.7)
 model_type = "2D"  # "2D" or "3D"
 save_file_name = f"model_{model_type}"
+pre_split_domain = False  # create fluid regions with shared edges at once, no share topology operation
+sector_mode = False  # one blade passage of a rotor-alone domain with periodic sides (1 / n_airfoils of the rotor)
+outer_radius = Distance(8)  # only if sector_mode = True, radius of the farfield
 
 # --- Developer parameters (we do not recommend changing) --- #
 main_fluid_name = 'fluid-1'
@@ -36,46 +48,82 @@ naca_name = "NACA"
 boi_name = "boi"
 boi_name_selection = "boi"
 
+# --- Skip the build if the same design was saved before --- #
+airfoil_path = (AIRFOIL_MODEL_3D if model_type.upper() == "3D" else AIRFOIL_MODEL_2D) / file_name
+cache = ArtifactCache()
+airfoil_cache = AirfoilCache()
+geometry_key = ArtifactCache.key("geometry", {
+    "airfoil_file": file_checksum(airfoil_path) if launch_airfoil_from_file else None,
+    "naca_code": None if launch_airfoil_from_file else naca_code,
+    "airfoil_tolerance": airfoil_tolerance, "spline_tolerance": spline_tolerance,
+    "n_airfoils": n_airfoils, "center": center, "radius": radius, "angle_of_attack_deg": angle_of_attack_deg,
+    "spread": spread, "model_type": model_type.upper(), "pre_split_domain": pre_split_domain,
+    "sector": outer_radius if sector_mode else None
+})
+if ModelerController.restore(cache, geometry_key, save_file_name) is not None:
+    raise SystemExit
+
+# --- Check the layout before launching the modeler (generated airfoils only) --- #
+# gaps should hold the default prism layers on both walls and the smallest curvature cell
+if not launch_airfoil_from_file:
+    prism = PrismParams()
+    min_gap = mesh_min_gap(prism.n_layers, prism.first_height, prism.growth_rate, CurvatureSizingParams().min)
+    DomainModel(radius.value.m, spread.value.m, n_airfoils, angle_of_attack_deg.value.m, naca_code,
+                cache=airfoil_cache).validate(min_gap)
+
 # --- Modeler (Discovery) initialize --- #
 modeler = ModelerController("Wind_Turbine", model_type, launch_airfoil_from_file)
 
-# --- Airfoils --- #
+# --- Airfoils (only the first one in sector mode) --- #
+n_blades = 1 if sector_mode else n_airfoils
 if launch_airfoil_from_file:
     # launch ready airfoil model from file
-    modeler.load_airfoils(file_name, center, radius, angle_of_attack_deg, n_airfoils)
+    modeler.load_airfoils(file_name, center, radius, angle_of_attack_deg, n_blades)
 else:
     # or generate automatically based on naca_name
     airfoil_sketch = SketchController(naca_name)
-    airfoil_sketches = airfoil_sketch.add_airfoils_by_sketch(naca_code, n_airfoils, center, radius, angle_of_attack_deg)
+    airfoil_sketches = airfoil_sketch.add_airfoils_by_sketch(naca_code, n_blades, center, radius, angle_of_attack_deg,
+                                                             airfoil_tolerance, spline_tolerance, cache=airfoil_cache)
     modeler.add_component(naca_name, airfoil_sketches)
 
-# --- Ring without cuts --- #
-ring_sketch = SketchController(ring_name)
-ring_sketch.add_ring(center, radius, spread)
+if sector_mode:
+    # --- Sectors of the ring, inner circle and env with shared edges --- #
+    modeler.add_sector_domain(center, radius, spread, n_airfoils, outer_radius, main_fluid_name, ring_name,
+                              inner_circle_name)
+elif pre_split_domain:
+    # --- Ring, inner circle and env with shared edges --- #
+    modeler.add_fluid_domain(center, radius, spread, main_fluid_name, ring_name, inner_circle_name)
+else:
+    # --- Ring without cuts --- #
+    ring_sketch = SketchController(ring_name)
+    ring_sketch.add_ring(center, radius, spread)
 
-modeler.add_component(ring_name, ring_sketch)
-modeler.add_named_selection(ring_name, ring_name_selection)
+    modeler.add_component(ring_name, ring_sketch)
+    modeler.add_named_selection(ring_name, ring_name_selection)
 
-# --- Inner circle --- #
-inner_radius = Distance(radius.value.m - spread.value.m / 2.0)
-inner_circle_sketch = SketchController(inner_circle_name)
-inner_circle_sketch.add_circle_using_arc(center, inner_radius)
+    # --- Inner circle --- #
+    inner_radius = Distance(radius.value.m - spread.value.m / 2.0)
+    inner_circle_sketch = SketchController(inner_circle_name)
+    inner_circle_sketch.add_circle_using_arc(center, inner_radius)
 
-modeler.add_component(inner_circle_name, inner_circle_sketch)
-modeler.add_named_selection(inner_circle_name, inner_circle_name_selection)
+    modeler.add_component(inner_circle_name, inner_circle_sketch)
+    modeler.add_named_selection(inner_circle_name, inner_circle_name_selection)
 
-# --- Env --- #
-env_sketch = SketchController(main_fluid_name)
-outer_radius = Distance(radius.value.m + spread.value.m / 2.0)
-env_sketch.add_env(center, outer_radius)
+    # --- Env --- #
+    env_sketch = SketchController(main_fluid_name)
+    outer_radius = Distance(radius.value.m + spread.value.m / 2.0)
+    env_sketch.add_env(center, outer_radius)
 
-modeler.add_component(main_fluid_name, env_sketch)
-modeler.add_named_selection(main_fluid_name, main_fluid_name_selection)
+    modeler.add_component(main_fluid_name, env_sketch)
+    modeler.add_named_selection(main_fluid_name, main_fluid_name_selection)
 
-# --- Create named selections: wall, inlet, outlet
-modeler.add_inlet_and_outlet(main_fluid_name)
+# --- Create named selections: wall, inlet, outlet (and symmetry in 3D) from one snapshot
+# --- or in sector mode: wall, periodic-1, periodic-2, farfield (and symmetry in 3D)
 modeler.add_wall(naca_name, ring_name)
-modeler.add_symmetry_named_selection() if model_type == "3D" else None
+if sector_mode:
+    modeler.add_sector_boundaries(main_fluid_name)
+else:
+    modeler.create_named_selections(modeler.boundary_rules(main_fluid_name))
 
 # --- Body of influence --- #
 boi_sketch = SketchController(boi_name)
@@ -90,7 +138,9 @@ modeler.delete_unnecessary_components()
 # --- Share Topology --- #
 modeler.share_topology()
 
-# -- Plot in Discovery  and save -- #
+# -- Save in the background and plot in Discovery meanwhile -- #
+export_queue = ExportQueue()
+modeler.save(save_file_name, queue=export_queue, cache=cache, key=geometry_key)
 modeler.plot()
-modeler.save(save_file_name)
-modeler.close()
+modeler.close()  # waits for the exports
+export_queue.shutdown()
@@ -0,0 +1,98 @@
+from numpy import ndarray, array, abs as abs_, sqrt
+from numpy.linalg import norm
+
+"""
+Functions for fitting a polyline with a chain of circular arcs (arc spline).
+"""
+
+
+def circumcircle(a: ndarray, b: ndarray, c: ndarray) -> tuple[ndarray, float] | None:
+    """
+    Compute the circle through three points.
+
+    Args:
+        a (ndarray): first point
+        b (ndarray): second point
+        c (ndarray): third point
+    Return:
+        tuple[ndarray, float] | None: center and radius, None if the points are collinear
+    """
+    d = 2 * (a[0] * (b[1] - c[1]) + b[0] * (c[1] - a[1]) + c[0] * (a[1] - b[1]))
+    scale = max(norm(c - a), norm(b - a)) ** 2
+    if abs(d) <= 1e-12 * scale:
+        return None
+
+    a2, b2, c2 = (a ** 2).sum(), (b ** 2).sum(), (c ** 2).sum()
+    center = array([
+        a2 * (b[1] - c[1]) + b2 * (c[1] - a[1]) + c2 * (a[1] - b[1]),
+        a2 * (c[0] - b[0]) + b2 * (a[0] - c[0]) + c2 * (b[0] - a[0])
+    ]) / d
+    return center, float(norm(a - center))
+
+
+def arc_deviation(points: ndarray, start: int, end: int) -> tuple[int | None, float]:
+    """
+    Compute the deviation of points from the arc through the first, middle and last of them.
+    Collinear points are measured against the segment instead.
+
+    Args:
+        points (ndarray): (n, 2) reference points
+        start (int): index of the first point of the arc
+        end (int): index of the last point of the arc
+    Return:
+        tuple[int | None, float]: index of the middle point (None for a segment) and maximum deviation
+    """
+    mid = (start + end) // 2
+    span = points[start:end + 1]
+
+    circle = circumcircle(points[start], points[mid], points[end])
+    if circle is None:
+        direction = points[end] - points[start]
+        offset = span - points[start]
+        cross = offset[:, 0] * direction[1] - offset[:, 1] * direction[0]
+        return None, float(abs_(cross).max() / sqrt((direction ** 2).sum()))
+
+    center, radius = circle
+    return mid, float(abs_(norm(span - center, axis=1) - radius).max())
+
+
+def fit_arc_spline(points: ndarray, tolerance: float) -> list[tuple[int, int | None, int]]:
+    """
+    Fit an open polyline with the fewest arcs, each arc as long as possible within tolerance.
+    Every arc goes through its first, middle and last reference point, so consecutive arcs share end points.
+
+    Args:
+        points (ndarray): (n, 2) reference points
+        tolerance (float): maximum distance between the reference points and the arcs
+    Return:
+        list[tuple[int, int | None, int]]: (start, middle, end) indices of every arc,
+                                           middle is None for a straight segment
+    """
+    if not tolerance > 0:
+        raise ValueError(f"\'tolerance\' parameter should be positive, got {tolerance}")
+
+    last = len(points) - 1
+    arcs = []
+    start = 0
+    while start < last:
+        # an arc over three points always fits
+        best = min(start + 2, last)
+
+        # grow the arc exponentially, then bisect its maximum length
+        step = 2
+        while best + step <= last and arc_deviation(points, start, best + step)[1] <= tolerance:
+            best += step
+            step *= 2
+        low, high = best, min(best + step, last + 1)
+        while high - low > 1:
+            mid = (low + high) // 2
+            if arc_deviation(points, start, mid)[1] <= tolerance:
+                low = mid
+            else:
+                high = mid
+
+        middle, _ = arc_deviation(points, start, low)
+        arcs.append((start, middle if low - start > 1 else None, low))
+        start = low
+
+    return arcs
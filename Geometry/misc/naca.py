@@ -0,0 +1,133 @@
+from numpy import ndarray, asarray, arctan, sin, cos, pi, linspace, zeros_like, where, concatenate, stack, errstate
+
+
+def cosine_stations(n_points: int) -> ndarray:
+    """
+    Compute cosine-spaced chord stations.
+    The stations are more concentrated near the leading and trailing edge.
+
+    Args:
+        n_points (int): number of stations
+    Return:
+        ndarray: (n_points,) array of x coordinates in [0, 1]
+    """
+    return (1 - cos(linspace(0.0, pi, n_points))) / 2
+
+
+def linear_stations(n_points: int) -> ndarray:
+    """
+    Compute uniformly spaced chord stations.
+
+    Args:
+        n_points (int): number of stations
+    Return:
+        ndarray: (n_points,) array of x coordinates in [0, 1]
+    """
+    return linspace(0.0, 1.0, n_points)
+
+
+SPACINGS = {
+    "cosine": cosine_stations,
+    "linear": linear_stations,
+}
+
+
+def stations(n_points: int, spacing: str = "cosine") -> ndarray:
+    """
+    Compute chord stations with given spacing law.
+
+    Args:
+        n_points (int): number of stations
+        spacing (str): spacing law, one of SPACINGS keys
+    Return:
+        ndarray: (n_points,) array of x coordinates in [0, 1]
+    """
+    return SPACINGS[spacing](n_points)
+
+
+def thickness_distribution(x: ndarray, t: float | ndarray) -> ndarray:
+    """
+    Compute the NACA 4-digit half thickness.
+
+    Args:
+        x (ndarray): chord stations
+        t (float | ndarray): maximum thickness as a fraction of the chord
+    Return:
+        ndarray: half thickness at every station
+    """
+    return 5 * t * (0.2969 * x ** 0.5
+                    - 0.1260 * x
+                    - 0.3516 * x ** 2
+                    + 0.2843 * x ** 3
+                    - 0.1015 * x ** 4)
+
+
+def camber_line(x: ndarray, m: float | ndarray, p: float | ndarray) -> tuple[ndarray, ndarray]:
+    """
+    Compute the NACA 4-digit camber line and its slope.
+
+    Args:
+        x (ndarray): chord stations
+        m (float | ndarray): maximum camber as a fraction of the chord
+        p (float | ndarray): position of the maximum camber as a fraction of the chord
+    Return:
+        tuple[ndarray, ndarray]: camber line and its derivative at every station
+    """
+    m, p = asarray(m, dtype=float), asarray(p, dtype=float)
+
+    # the front part is not defined for p == 0, so silence the division and mask it out
+    with errstate(divide="ignore", invalid="ignore"):
+        yc_front = m / p ** 2 * (2 * p * x - x ** 2)
+        dyc_front = 2 * m / p ** 2 * (p - x)
+    yc_back = m / (1 - p) ** 2 * ((1 - 2 * p) + 2 * p * x - x ** 2)
+    dyc_back = 2 * m / (1 - p) ** 2 * (p - x)
+
+    front = x < p
+    yc = where(front, yc_front, yc_back)
+    dyc_dx = where(front, dyc_front, dyc_back)
+
+    # camber line is zero for a symmetric airfoil
+    symmetric = (m == 0) & (p == 0)
+    yc = where(symmetric, zeros_like(yc), yc)
+    dyc_dx = where(symmetric, zeros_like(dyc_dx), dyc_dx)
+
+    return yc, dyc_dx
+
+
+def naca4_surfaces(x: ndarray,
+                   yt: ndarray,
+                   m: float | ndarray,
+                   p: float | ndarray) -> tuple[ndarray, ndarray]:
+    """
+    Compute upper and lower surfaces of a NACA 4-digit airfoil.
+
+    Args:
+        x (ndarray): chord stations
+        yt (ndarray): half thickness at every station
+        m (float | ndarray): maximum camber as a fraction of the chord
+        p (float | ndarray): position of the maximum camber as a fraction of the chord
+    Return:
+        tuple[ndarray, ndarray]: (..., n, 2) upper and lower surface, from leading to trailing edge
+    """
+    yc, dyc_dx = camber_line(x, m, p)
+    theta = arctan(dyc_dx)
+
+    upper = stack([x - yt * sin(theta), yc + yt * cos(theta)], axis=-1)
+    lower = stack([x + yt * sin(theta), yc - yt * cos(theta)], axis=-1)
+
+    return upper, lower
+
+
+def closed_contour(upper: ndarray, lower: ndarray) -> ndarray:
+    """
+    Join both surfaces into a single contour.
+    The contour goes from the lower trailing edge, through the leading edge, to the upper trailing edge.
+    The leading edge point is shared and appears only once.
+
+    Args:
+        upper (ndarray): (..., n, 2) upper surface, from leading to trailing edge
+        lower (ndarray): (..., n, 2) lower surface, from leading to trailing edge
+    Return:
+        ndarray: (..., 2n - 1, 2) contour
+    """
+    return concatenate([lower[..., :0:-1, :], upper], axis=-2)
@@ -1,45 +1,109 @@
 from ansys.geometry.core.math import Point2D
-from math import radians, cos, sin
+from math import radians
+from numpy import ndarray, asarray, cos, sin, arange, pi
 from ansys.geometry.core.misc import Distance, Angle
 from Geometry.Airfoil import Airfoil
+from Geometry.misc.transforms import translation, rotation, compose, apply
+
+
+def airfoil_placement_matrix(cx: float,
+                             cy: float,
+                             radius: float,
+                             angle_rad: float | ndarray,
+                             angle_of_attack_rad: float,
+                             px: float = 0.5,
+                             py: float = 0.0) -> ndarray:
+    """
+    Compose the placement of an airfoil on a circle into a single matrix:
+    chord recentering, pitch rotation, radial shift and azimuthal placement.
+
+    Args:
+        cx (float): x coordinate of the center of circle
+        cy (float): y coordinate of the center of circle
+        radius (float): radius of circle
+        angle_rad (float | ndarray): interior angle (radians), an array gives one matrix per angle
+        angle_of_attack_rad (float): angle of attack (radians)
+        px (float): x coordinate of the pitch axis in airfoil coordinates
+        py (float): y coordinate of the pitch axis in airfoil coordinates
+    Return:
+        ndarray: (3, 3) matrix, or (k, 3, 3) stack for k angles
+    """
+    angle_rad = asarray(angle_rad, dtype=float)
+    return compose(
+        translation(-px, -py),
+        rotation(angle_of_attack_rad),
+        rotation(angle_rad),
+        translation(cx + radius * cos(angle_rad), cy + radius * sin(angle_rad))
+    )
 
 
 def translate_airfoil_on_circle(foil: Airfoil,
                                 center: Point2D,
                                 radius: Distance,
                                 angle_deg: Angle,
-                                angle_of_attack_deg: Angle) -> Airfoil:
+                                angle_of_attack_deg: Angle,
+                                pivot: Point2D | None = None) -> Airfoil:
     """
     Place an Airfoil on a circle.
 
     Args:
-        foil (Airfoil): Airfoil with list of points
+        foil (Airfoil): Airfoil with generated points
         center (Point2D): center of circle
         radius (Distance): radius of circle
         angle_deg (Angle): interior angle (degrees)
         angle_of_attack_deg (Angle): angle of attack (degrees)
+        pivot (Point2D | None): point of the airfoil placed on the circle and used as pitch axis,
+                                default is the middle of the chord
     Return:
         Airfoil: Airfoil with set new points
     """
-    points = foil.points
-    cx = center.x + radius.value * cos(radians(angle_deg.value.m))
-    cy = center.y + radius.value * sin(radians(angle_deg.value.m))
-    new_center = Point2D([cx.m, cy.m])
+    # radius in the units of center
+    radius_m = radius.value.to(center.x.units).m
+    px, py = (0.5, 0.0) if pivot is None else (pivot.x.m, pivot.y.m)
 
-    translated = []
-    for p in points:
-        local = Point2D([p.x.m - 0.5, p.y.m])
+    matrix = airfoil_placement_matrix(
+        center.x.m, center.y.m, radius_m,
+        radians(angle_deg.value.m), radians(angle_of_attack_deg.value.m),
+        px, py
+    )
+    foil.coordinates = apply(matrix, foil.coordinates)
 
-        local_rotated = __points_rotation(local, Point2D([0, 0]), angle_of_attack_deg)
+    return foil
 
-        shifted = Point2D([local_rotated.x.m + new_center.x.m, local_rotated.y.m + new_center.y.m])
 
-        final = __points_rotation(shifted, new_center, angle_deg)
-        translated.append(final)
+def rotor_layout(coordinates: ndarray,
+                 n_blades: int,
+                 center: Point2D,
+                 radius: Distance,
+                 angle_of_attack_deg: Angle,
+                 pivot: Point2D | None = None) -> ndarray:
+    """
+    Place all blades of a rotor on a circle at once.
+    Blades are evenly spaced, the first one at zero angle, as in translate_airfoil_on_circle.
+
+    Args:
+        coordinates (ndarray): (n_points, 2) array of points of the base airfoil
+        n_blades (int): number of blades
+        center (Point2D): center of circle
+        radius (Distance): radius of circle
+        angle_of_attack_deg (Angle): angle of attack (degrees)
+        pivot (Point2D | None): point of the airfoil placed on the circle and used as pitch axis,
+                                default is the middle of the chord
+    Return:
+        ndarray: (n_blades, n_points, 2) array of points of all blades
+    """
+    if not n_blades > 0:
+        raise ValueError(f"\'n_blades\' parameter should be positive, got {n_blades}")
 
-    foil.points = translated
+    radius_m = radius.value.to(center.x.units).m
+    px, py = (0.5, 0.0) if pivot is None else (pivot.x.m, pivot.y.m)
 
-    return foil
+    # one placement matrix per blade, broadcast over all points
+    angles_rad = 2 * pi * arange(n_blades) / n_blades
+    matrices = airfoil_placement_matrix(
+        center.x.m, center.y.m, radius_m, angles_rad, radians(angle_of_attack_deg.value.m), px, py
+    )
+    return apply(matrices, coordinates)
 
 
 def __points_rotation(points: list[Point2D] | Point2D,
@@ -62,19 +126,9 @@ def __points_rotation(points: list[Point2D] | Point2D,
     else:
         list_return = True
 
-    new_points = []
-    angle_rad = radians(angle.value.m)
-    for point in points:
-        translated_x = point.x - center.x
-        translated_y = point.y - center.y
-
-        rotated_x = translated_x * cos(angle_rad) - translated_y * sin(angle_rad)
-        rotated_y = translated_x * sin(angle_rad) + translated_y * cos(angle_rad)
-
-        new_x = rotated_x + center.x
-        new_y = rotated_y + center.y
-
-        new_points.append(Point2D([new_x.m, new_y.m]))
+    matrix = rotation(radians(angle.value.m), center.x.m, center.y.m)
+    rotated = apply(matrix, [[point.x.m, point.y.m] for point in points])
+    new_points = [Point2D(xy) for xy in rotated.tolist()]
 
     if list_return:
         return new_points
@@ -0,0 +1,97 @@
+from numpy import ndarray, roll, clip, maximum, minimum, sqrt, where, any as any_
+
+"""
+Vectorized functions for closed polygons given as (n, 2) arrays of points.
+Leading dimensions are batch dimensions, e.g. (k, n, 2) arrays for k pairs of polygons at once.
+"""
+
+
+def point_segment_distances(points: ndarray, starts: ndarray, ends: ndarray) -> ndarray:
+    """
+    Compute the distance of every point to every segment.
+
+    Args:
+        points (ndarray): (..., n, 2) array of points
+        starts (ndarray): (..., m, 2) array of segment start points
+        ends (ndarray): (..., m, 2) array of segment end points
+    Return:
+        ndarray: (..., n, m) array of distances
+    """
+    direction = (ends - starts)[..., None, :, :]
+    length2 = maximum((direction ** 2).sum(axis=-1), 1e-300)
+    offset = points[..., :, None, :] - starts[..., None, :, :]
+    s = clip((offset * direction).sum(axis=-1) / length2, 0.0, 1.0)
+    return sqrt(((offset - s[..., None] * direction) ** 2).sum(axis=-1))
+
+
+def points_in_polygon(points: ndarray, polygon: ndarray) -> ndarray:
+    """
+    Check which points lie inside a polygon (even-odd rule).
+
+    Args:
+        points (ndarray): (..., n, 2) array of points
+        polygon (ndarray): (..., m, 2) array of polygon points, closed implicitly
+    Return:
+        ndarray: (..., n) boolean array
+    """
+    x, y = points[..., :, 0:1], points[..., :, 1:2]
+    x0, y0 = polygon[..., None, :, 0], polygon[..., None, :, 1]
+    x1, y1 = roll(x0, -1, axis=-1), roll(y0, -1, axis=-1)
+
+    # count crossings of a ray going in +x direction
+    straddles = (y0 > y) != (y1 > y)
+    dy = where(y1 == y0, 1.0, y1 - y0)  # horizontal edges never straddle
+    x_cross = x0 + (y - y0) * (x1 - x0) / dy
+    return ((straddles & (x < x_cross)).sum(axis=-1) % 2) == 1
+
+
+def segments_cross(a: ndarray, b: ndarray) -> ndarray:
+    """
+    Check whether any edge of polygon a properly crosses any edge of polygon b.
+
+    Args:
+        a (ndarray): (..., n, 2) array of polygon points, closed implicitly
+        b (ndarray): (..., m, 2) array of polygon points, closed implicitly
+    Return:
+        ndarray: (...) boolean array, True if edges cross
+    """
+    p, p2 = a[..., :, None, :], roll(a, -1, axis=-2)[..., :, None, :]
+    q, q2 = b[..., None, :, :], roll(b, -1, axis=-2)[..., None, :, :]
+
+    def orientation(o, u, v):
+        return (u[..., 0] - o[..., 0]) * (v[..., 1] - o[..., 1]) - (u[..., 1] - o[..., 1]) * (v[..., 0] - o[..., 0])
+
+    d1, d2 = orientation(q, q2, p), orientation(q, q2, p2)
+    d3, d4 = orientation(p, p2, q), orientation(p, p2, q2)
+    return any_((d1 * d2 < 0) & (d3 * d4 < 0), axis=(-2, -1))
+
+
+def polygon_distances(a: ndarray, b: ndarray) -> ndarray:
+    """
+    Compute the minimum distance between polygons, zero where they overlap.
+
+    Args:
+        a (ndarray): (..., n, 2) array of polygon points, closed implicitly
+        b (ndarray): (..., m, 2) array of polygon points, closed implicitly
+    Return:
+        ndarray: (...) array of distances
+    """
+    overlap = segments_cross(a, b) | points_in_polygon(a[..., :1, :], b)[..., 0] \
+        | points_in_polygon(b[..., :1, :], a)[..., 0]
+
+    a_to_b = point_segment_distances(a, b, roll(b, -1, axis=-2)).min(axis=(-2, -1))
+    b_to_a = point_segment_distances(b, a, roll(a, -1, axis=-2)).min(axis=(-2, -1))
+    return where(overlap, 0.0, minimum(a_to_b, b_to_a))
+
+
+def polygon_distance(a: ndarray, b: ndarray) -> float:
+    """
+    Compute the minimum distance between two polygons, zero if they overlap.
+
+    Args:
+        a (ndarray): (n, 2) array of polygon points, closed implicitly
+        b (ndarray): (m, 2) array of polygon points, closed implicitly
+    Return:
+        float: the distance
+    """
+    return float(polygon_distances(a, b))
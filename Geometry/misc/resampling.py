@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from numpy import ndarray, sqrt, zeros, diff, cumsum, linspace, searchsorted, unique, union1d, arange, clip, \
+    concatenate, abs as abs_, maximum, argmax, ceil
+from numpy.linalg import norm
+
+"""
+Functions for curvature-adaptive resampling of polylines.
+"""
+
+
+@dataclass
+class ResamplingReport:
+    n_points: int
+    max_deviation: float
+    tolerance: float
+
+
+def menger_curvature(points: ndarray) -> ndarray:
+    """
+    Compute discrete curvature of a polyline as the inverse radius of the circle through three neighbors.
+
+    Args:
+        points (ndarray): (n, 2) array of points
+    Return:
+        ndarray: (n,) curvature, zero at both ends
+    """
+    a = points[1:-1] - points[:-2]
+    b = points[2:] - points[1:-1]
+    c = points[2:] - points[:-2]
+    cross = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    lengths = norm(a, axis=1) * norm(b, axis=1) * norm(c, axis=1)
+
+    kappa = zeros(len(points))
+    kappa[1:-1] = 2 * abs_(cross) / maximum(lengths, 1e-300)
+    return kappa
+
+
+def segment_deviation(points: ndarray, indices: ndarray) -> ndarray:
+    """
+    Compute the distance of every point to the polyline made of the selected points.
+    Each point is measured against the chord between the selected points that enclose it.
+
+    Args:
+        points (ndarray): (n, 2) reference points
+        indices (ndarray): sorted indices of the selected points, including first and last
+    Return:
+        ndarray: (n,) distance of every reference point to the polyline
+    """
+    # chord enclosing every reference point
+    chord = clip(searchsorted(indices, arange(len(points)), side="right") - 1, 0, len(indices) - 2)
+    start = points[indices[chord]]
+    end = points[indices[chord + 1]]
+
+    # distance from point to segment
+    direction = end - start
+    length2 = maximum((direction ** 2).sum(axis=1), 1e-300)
+    s = clip(((points - start) * direction).sum(axis=1) / length2, 0.0, 1.0)
+    return norm(points - start - s[:, None] * direction, axis=1)
+
+
+def adaptive_indices(points: ndarray, tolerance: float, keep: list[int] | None = None) -> ndarray:
+    """
+    Select the points of a dense polyline so that the coarse polyline stays within tolerance.
+    Points are placed by local curvature, the sagitta of a circular arc of curvature k over a chord h
+    is h^2 k / 8, so the chord length is sqrt(8 tolerance / k). Chords still above the tolerance
+    are split at their worst point.
+
+    Args:
+        points (ndarray): (n, 2) dense reference points
+        tolerance (float): maximum distance between the reference and the coarse polyline
+        keep (list[int] | None): indices that always have to be selected, e.g. the leading edge
+    Return:
+        ndarray: sorted indices of the selected points
+    """
+    # number of chords needed per unit length
+    ds = norm(diff(points, axis=0), axis=1)
+    density = sqrt(menger_curvature(points) / (8 * tolerance))
+    n_chords = concatenate([[0.0], cumsum((density[1:] + density[:-1]) / 2 * ds)])
+
+    # place points at equal increments of the cumulative number of chords
+    levels = linspace(0.0, n_chords[-1], int(ceil(n_chords[-1])) + 1)
+    indices = clip(searchsorted(n_chords, levels), 0, len(points) - 1)
+    indices = unique(concatenate([indices, [0, len(points) - 1], keep or []]).astype(int))
+
+    # split the chords which are still above the tolerance
+    while True:
+        deviation = segment_deviation(points, indices)
+        if deviation.max() <= tolerance:
+            return indices
+
+        worst = [start + argmax(deviation[start:end + 1])
+                 for start, end in zip(indices[:-1], indices[1:])
+                 if deviation[start:end + 1].max() > tolerance]
+        indices = union1d(indices, worst)
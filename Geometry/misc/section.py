@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from numpy import ndarray, array, roll, arctan2, degrees
+from numpy.linalg import norm
+
+"""
+Functions for computing section properties of closed polygons (e.g. airfoils) from their points.
+"""
+
+
+@dataclass
+class SectionProperties:
+    area: float
+    centroid: ndarray
+    ixx: float  # second moments about the centroid
+    iyy: float
+    ixy: float
+    leading_edge: ndarray
+    trailing_edge: ndarray
+    chord: float
+    chord_angle_deg: float
+
+
+def section_properties(coordinates: ndarray) -> SectionProperties:
+    """
+    Compute exact area, centroid and second moments of a polygon using the shoelace formula (Green's theorem).
+    The polygon is closed implicitly and can be ordered in any direction.
+    The trailing edge is the midpoint between the first and last point, the leading edge is the point
+    farthest from it.
+
+    Args:
+        coordinates (ndarray): (n, 2) array of polygon points
+    Return:
+        SectionProperties: the section properties
+    """
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    x1, y1 = roll(x, -1), roll(y, -1)
+    cross = x * y1 - x1 * y
+
+    # signed integrals, negative for a clockwise polygon
+    area = cross.sum() / 2
+    sx = ((x + x1) * cross).sum() / 6
+    sy = ((y + y1) * cross).sum() / 6
+    ixx = ((y ** 2 + y * y1 + y1 ** 2) * cross).sum() / 12
+    iyy = ((x ** 2 + x * x1 + x1 ** 2) * cross).sum() / 12
+    ixy = ((x * y1 + 2 * x * y + 2 * x1 * y1 + x1 * y) * cross).sum() / 24
+
+    # centroid is independent of the orientation
+    cx, cy = sx / area, sy / area
+    sign = 1.0 if area > 0 else -1.0
+
+    # chord line
+    trailing_edge = (coordinates[0] + coordinates[-1]) / 2
+    leading_edge = coordinates[norm(coordinates - trailing_edge, axis=1).argmax()]
+    chord_vector = trailing_edge - leading_edge
+
+    return SectionProperties(
+        area=float(sign * area),
+        centroid=array([cx, cy]),
+        ixx=float(sign * (ixx - area * cy ** 2)),
+        iyy=float(sign * (iyy - area * cx ** 2)),
+        ixy=float(sign * (ixy - area * cx * cy)),
+        leading_edge=leading_edge.copy(),
+        trailing_edge=trailing_edge,
+        chord=float(norm(chord_vector)),
+        chord_angle_deg=float(degrees(arctan2(chord_vector[1], chord_vector[0])))
+    )
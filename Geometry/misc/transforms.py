@@ -0,0 +1,82 @@
+from numpy import ndarray, eye, cos, sin, asarray, stack, zeros, ones_like, zeros_like
+
+"""
+Functions for 2D affine transforms as 3x3 homogeneous matrices.
+Every function also accepts arrays of parameters and then returns a (..., 3, 3) stack of matrices.
+"""
+
+
+def translation(dx: float | ndarray, dy: float | ndarray) -> ndarray:
+    """
+    Create a translation matrix.
+
+    Args:
+        dx (float | ndarray): translation along x
+        dy (float | ndarray): translation along y
+    Return:
+        ndarray: (..., 3, 3) translation matrix
+    """
+    dx, dy = asarray(dx, dtype=float), asarray(dy, dtype=float)
+    shape = (dx + dy).shape
+
+    matrix = zeros(shape + (3, 3))
+    matrix[..., 0, 0] = matrix[..., 1, 1] = matrix[..., 2, 2] = 1.0
+    matrix[..., 0, 2] = dx
+    matrix[..., 1, 2] = dy
+    return matrix
+
+
+def rotation(angle_rad: float | ndarray, cx: float = 0.0, cy: float = 0.0) -> ndarray:
+    """
+    Create a counterclockwise rotation matrix around a center.
+
+    Args:
+        angle_rad (float | ndarray): angle of rotation (radians)
+        cx (float): x coordinate of the center of rotation
+        cy (float): y coordinate of the center of rotation
+    Return:
+        ndarray: (..., 3, 3) rotation matrix
+    """
+    angle_rad = asarray(angle_rad, dtype=float)
+    c, s = cos(angle_rad), sin(angle_rad)
+    o, i = zeros_like(c), ones_like(c)
+
+    matrix = stack([
+        stack([c, -s, o], axis=-1),
+        stack([s, c, o], axis=-1),
+        stack([o, o, i], axis=-1),
+    ], axis=-2)
+
+    if cx or cy:
+        matrix = compose(translation(-cx, -cy), matrix, translation(cx, cy))
+    return matrix
+
+
+def compose(*matrices: ndarray) -> ndarray:
+    """
+    Compose transforms into a single matrix.
+    Transforms are applied in the given order, the first one is applied first.
+
+    Args:
+        *matrices (ndarray): (..., 3, 3) matrices
+    Return:
+        ndarray: (..., 3, 3) composed matrix
+    """
+    result = eye(3)
+    for matrix in matrices:
+        result = matrix @ result
+    return result
+
+
+def apply(matrix: ndarray, points: ndarray) -> ndarray:
+    """
+    Apply a transform (or a stack of transforms) to an array of points with a single matmul.
+
+    Args:
+        matrix (ndarray): (3, 3) matrix or (k, 3, 3) stack of matrices
+        points (ndarray): (n, 2) array of points
+    Return:
+        ndarray: (n, 2) or (k, n, 2) array of transformed points
+    """
+    points = asarray(points, dtype=float)
+    return points @ matrix[..., :2, :2].swapaxes(-1, -2) + matrix[..., None, :2, 2]
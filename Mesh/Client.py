@@ -1,14 +1,35 @@
 from ansys.meshing.prime import launch_prime
 from Mesh.misc.PATHS import ANSYS_PRIME
 from ansys.meshing.prime.internals.client import Client
+from Mesh.PrimePool import PrimePool
+from Mesh.misc.processes import resolve_n_procs
 
 
 class PrimeClient:
     """
     Class for describe a prime client.
     """
-    def __init__(self):
-        self._client = self.__launch()
+    def __init__(self,
+                 pool: PrimePool | None = None,
+                 n_procs: int | str | None = None,
+                 memory_budget_gb: float | None = None):
+        """
+        PrimeClient class constructor.
+
+        Args:
+            pool (PrimePool | None): pool to lease the client from, a new server is launched if None
+            n_procs (int | str | None): number of Prime processes (distributed mode), "auto" for all available
+                                        cores within the memory budget, None for one process.
+                                        Ignored with a pool, the pool launches its servers with its own n_procs
+            memory_budget_gb (float | None): memory for all processes with "auto", None for no limit
+        """
+        self._pool = pool
+        if pool is not None:
+            self._n_procs = pool.n_procs
+            self._client = pool.lease()
+        else:
+            self._n_procs = resolve_n_procs(n_procs, memory_budget_gb)
+            self._client = self.__launch(self._n_procs)
 
         # print client status
         print(self._client)
@@ -23,22 +44,40 @@ class PrimeClient:
         """
         return self._client
 
+    @property
+    def n_procs(self) -> int:
+        """
+        Get number of Prime processes.
+
+        Return:
+            int: number of processes
+        """
+        return self._n_procs if self._n_procs is not None else 1
+
     @staticmethod
-    def __launch() -> Client:
+    def __launch(n_procs: int | None) -> Client:
         """
         Launch prime client.
 
+        Args:
+            n_procs (int | None): number of processes in distributed mode, None for normal mode
         Return:
             Client: prime client
         """
+        print(f"Launching Prime with {n_procs if n_procs is not None else 1} process(es)...")
         return launch_prime(
             prime_root=ANSYS_PRIME,
-            timeout=120
+            timeout=120,
+            n_procs=n_procs
         )
 
     def exit(self):
         """
         Exit prime client.
+        A client leased from a pool is returned to it instead.
 
         """
-        self._client.exit()
+        if self._pool is not None:
+            self._pool.release(self._client)
+        else:
+            self._client.exit()
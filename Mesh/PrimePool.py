@@ -0,0 +1,222 @@
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from time import time
+from ansys.meshing.prime import launch_prime
+from ansys.meshing.prime.internals.client import Client
+from Mesh.misc.PATHS import ANSYS_PRIME
+from Mesh.misc.processes import resolve_n_procs
+
+
+class PrimePool:
+    """
+    PrimePool is a class for keeping Prime servers alive between meshing jobs.
+    A job leases a client with a clean model instead of launching a new server and returns it afterwards.
+    """
+    def __init__(self,
+                 size: int = 1,
+                 max_jobs: int = 50,
+                 idle_timeout: float = 600.0,
+                 timeout: float = 120,
+                 warm: bool = False,
+                 n_procs: int | str | None = None,
+                 memory_budget_gb: float | None = None):
+        """
+        PrimePool class constructor.
+
+        Args:
+            size (int): maximum number of servers alive at once
+            max_jobs (int): number of jobs after which a server is relaunched to bound memory growth
+            idle_timeout (float): seconds after which an idle server is exited, checked on every lease and release
+            timeout (float): maximum time in seconds to wait for a launched server
+            warm (bool): whether to launch all servers now, otherwise they are launched on first lease
+            n_procs (int | str | None): number of processes of every server, "auto" for all available cores
+                                        shared by all servers within the memory budget, None for one process
+            memory_budget_gb (float | None): memory for all servers with "auto", None for no limit
+        """
+        self.__validate_positive(size, "size")
+        self.__validate_positive(max_jobs, "max_jobs")
+        self.__validate_positive(idle_timeout, "idle_timeout")
+
+        self.size = size
+        self.max_jobs = max_jobs
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.n_procs = resolve_n_procs(n_procs, memory_budget_gb)
+        if n_procs == "auto" and self.n_procs is not None:
+            # servers alive at once share the cores
+            self.n_procs = resolve_n_procs(max(self.n_procs // size, 1))
+
+        self._idle: deque[tuple[Client, float]] = deque()  # client and time of release
+        self._n_jobs: dict[int, int] = dict()
+        self._n_alive = 0
+        self._condition = Condition()
+
+        if warm:
+            for _ in range(size):
+                self._n_alive += 1
+                self._idle.append((self.__launch(), time()))
+
+    @staticmethod
+    def __validate_positive(value: int | float, name: str):
+        """
+        Validate positive parameter.
+
+        Raise:
+            ValueError: value is not positive
+        """
+        if not value > 0:
+            raise ValueError(f"\'{name}\' parameter should be positive, got {value}")
+
+    def __launch(self) -> Client:
+        """
+        Launch a new server.
+
+        Return:
+            Client: prime client
+        """
+        client = launch_prime(prime_root=ANSYS_PRIME, timeout=self.timeout, n_procs=self.n_procs)
+        print(client)
+
+        self._n_jobs[id(client)] = 0
+        return client
+
+    def __exit(self, client: Client):
+        """
+        Exit a server, errors are only reported.
+
+        """
+        self._n_jobs.pop(id(client), None)
+        try:
+            client.exit()
+        except Exception as e:
+            print(f"Prime client could not be exited: {e}")
+
+    def __reap(self):
+        """
+        Exit servers idle for longer than idle_timeout. Requires the condition to be held.
+
+        """
+        now = time()
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            client, _ = self._idle.popleft()
+            self._n_alive -= 1
+            self.__exit(client)
+
+    @staticmethod
+    def __is_healthy(client: Client) -> bool:
+        """
+        Check whether the server still responds.
+
+        """
+        try:
+            client.model.parts
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def reset(client: Client):
+        """
+        Clean the model: delete all parts, zones, controls and size fields.
+
+        Args:
+            client (Client): prime client
+        """
+        model = client.model
+        control_data = model.control_data
+
+        controls = [
+            *control_data.size_controls, *control_data.volume_controls, *control_data.prism_controls,
+            *control_data.thin_volume_controls, *control_data.shell_bl_controls, *control_data.wrapper_controls,
+            *control_data.multi_zone_controls, *control_data.periodic_controls
+        ]
+        if controls:
+            control_data.delete_controls([control.id for control in controls])
+
+        size_fields = model.get_volumetric_size_fields()
+        if size_fields:
+            model.delete_volumetric_size_fields(size_fields)
+
+        zones = {zone for part in model.parts
+                 for zone in (*part.get_face_zones(), *part.get_volume_zones(), *part.get_edge_zones())}
+        if model.parts:
+            model.delete_parts([part.id for part in model.parts])
+        for zone in zones:
+            model.delete_zone(zone)
+
+    def lease(self) -> Client:
+        """
+        Lease a client with a clean model.
+        Blocks until a client is free if all servers are leased.
+
+        Return:
+            Client: prime client
+        """
+        with self._condition:
+            self.__reap()
+            while not self._idle and self._n_alive >= self.size:
+                self._condition.wait()
+
+            # the most recently released client first, so the oldest ones can time out
+            if self._idle:
+                client, _ = self._idle.pop()
+            else:
+                client = None
+                self._n_alive += 1
+        try:
+            client = self.__launch() if client is None else client
+
+            # health check and recycle policy
+            if not self.__is_healthy(client) or self._n_jobs[id(client)] >= self.max_jobs:
+                self.__exit(client)
+                client = None
+                client = self.__launch()
+            else:
+                self.reset(client)
+        except Exception:
+            # the server slot is free again, a client which failed the reset or the health check is exited
+            if client is not None:
+                self.__exit(client)
+            with self._condition:
+                self._n_alive -= 1
+                self._condition.notify()
+            raise
+
+        self._n_jobs[id(client)] += 1
+        return client
+
+    def release(self, client: Client):
+        """
+        Return a leased client to the pool.
+
+        Args:
+            client (Client): the leased client
+        """
+        with self._condition:
+            self._idle.append((client, time()))
+            self.__reap()
+            self._condition.notify()
+
+    @contextmanager
+    def client(self):
+        """
+        Lease a client for the duration of a with block.
+
+        """
+        client = self.lease()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self):
+        """
+        Exit all idle servers.
+
+        """
+        with self._condition:
+            while self._idle:
+                client, _ = self._idle.pop()
+                self._n_alive -= 1
+                self.__exit(client)
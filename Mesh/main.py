@@ -1,57 +1,148 @@
 from Mesh.meshing.Meshing import Meshing
+from Mesh.meshing.MeshingParams import MeshingParams
+from ArtifactCache import ArtifactCache
 
 # --- User Params --- #
-model_type = "3D"
-airfoil_model = "airfoil6412.fmd"  # airfoil model (Geometry/results/model_3D)
+model_type = "3D"  # 2D for fast screening runs
+airfoil_model = "airfoil6412.fmd"  # airfoil model (Geometry/results/model_3D or Geometry/results/model_2D)
 save_file_name = "wind_turbine"
-
+n_procs = "auto"  # number of Prime processes, "auto" for all cores within the memory budget, None for one
+memory_budget_gb = None  # memory for all Prime processes with "auto", None for no limit
+baseline_timings = "wind_turbine_serial"  # timings of a previous run to compare with (see save_timings)
+sweep_mode = False  # 3D only, sweep the cap mesh through the span (MultiZone) instead of tet + prism
+sweep_params = dict(span=1000.0, n_layers=20)  # extrusion distance of the model and number of swept layers
+reuse_stator = False  # 3D tet only, reuse the cached stator mesh (all parts except the ring) of the same geometry
+morph_from = None  # 3D tet only, geometry file of a meshed design of other pitch, its mesh is morphed instead of remeshing
+n_sectors = 1  # number of airfoils of a sector model (Geometry sector_mode), 1 for the full rotor
+
+# --- Control params --- #
+global_curvature_params = dict(min_local=150.0, max_local=3000.0)
+ring_curvature_params = dict(min_local=20.0, max_local=200.0)
+
+# --- Skip meshing if the same mesh was saved before --- #
+cache = ArtifactCache()
+controls = {
+    "global_curvature": global_curvature_params, "ring_curvature": ring_curvature_params,
+    "sweep": sweep_params if sweep_mode and model_type == "3D" else None,
+    "n_sectors": n_sectors
+}
+# a full remesh, the key of the saved mesh tells a morphed mesh or a mesh on a restored stator apart
+mesh_key = Meshing.cache_key(airfoil_model, model_type, MeshingParams(),
+                             {**controls, "morph_from": None, "stator_restored": False})
+if Meshing.restore(cache, mesh_key, model_type) is not None:
+    raise SystemExit
 
 # --- Initialize Meshing class --- #
-meshing = Meshing(model_type)
+meshing = Meshing(model_type, n_procs=n_procs, memory_budget_gb=memory_budget_gb)
+
+# --- Morph the mesh of the base design, remesh if it is not cached or the quality degrades --- #
+morph = morph_from is not None and model_type == "3D" and not sweep_mode
+morphed = morph and meshing.morph_mesh(cache, Meshing.cache_key(morph_from, model_type, MeshingParams(), controls),
+                                       airfoil_model)
 
 # --- Read geometry and diagnose --- #
-meshing.read_geometry(airfoil_model)
-meshing.diagnostic()
+if morphed:
+    pass
+elif sweep_mode and model_type == "3D":
+    # the interfaces are shared already, nothing to connect
+    meshing.read_geometry(airfoil_model, topology=True)
+    meshing.diagnostic(connect=False)
+else:
+    meshing.read_geometry(airfoil_model)
+    meshing.diagnostic()
+
+# --- Replace the stator by its cached mesh, only the ring is meshed then --- #
+stator_reuse = reuse_stator and model_type == "3D" and not sweep_mode and not morphed
+stator_key = meshing.stator_key(controls=controls) if stator_reuse else None
+stator_restored = stator_reuse and meshing.restore_stator(cache, stator_key)
 
 
 # --- Create global curvature sizing control --- #
-global_curvature = meshing.create_curvature_sizing_control("global_curvature", min_local=150.0, max_local=3000.0)
+global_curvature = meshing.create_curvature_sizing_control("global_curvature", **global_curvature_params)
 meshing.set_scope(global_curvature, part_expression="* !boi", label_expression="*")
 
 # --- Create ring curvature sizing control --- #
-ring_curvature = meshing.create_curvature_sizing_control("ring_curvature", min_local=20.0, max_local=200.0)
-meshing.set_scope(ring_curvature, part_expression="*fluid-2*", label_expression="wall")
+ring_curvature = meshing.create_curvature_sizing_control("ring_curvature", **ring_curvature_params)
+# the fluid bodies are in one part in sweep mode, the wall label is on the ring only
+meshing.set_scope(ring_curvature, part_expression="*" if sweep_mode and model_type == "3D" else "*fluid-2*", label_expression="wall")
 
 # --- Create body of influence sizing control --- #
 boi_sizing = meshing.create_boi_sizing_control("boi_sizing")
 meshing.set_scope(boi_sizing, part_expression="boi")
 
-# --- Compute volumetric using curvature sizing controls --- #
-meshing.compute_volumetric([global_curvature, ring_curvature])
-
-# --- Create surface mesh with curvature sizing controls --- #
-meshing.create_surface_mesh_with_size_control(size_control_names="*")
-
-
-# --- Create zones from labels  --- #
-meshing.create_zones_from_all_labels()
-
-# --- Get a ring part --- #
-part = meshing.get_part_by_name("fluid-2")
-
-# --- Compute volume on ring --- #
-meshing.compute_volumes(part_expression=part.name)
-
-# --- Create volume and prism control --- #
-volume_control = meshing.create_volume_control_(zone_expression="*fluid-*")
-prism_control = meshing.create_prism_control_(zone_expression="fluid-2", label_expression="wall")
-
-# --- Generate prism mesh --- #
-meshing.generate_volume_mesh(part, prism_control=prism_control, volume_control=volume_control)
+if morphed:
+    # --- The morphed mesh keeps the topology of the base mesh, nothing to generate --- #
+    pass
+elif model_type == "2D":
+    # --- Create quad dominant surface mesh with sizing controls --- #
+    meshing.create_surface_mesh_with_size_control(size_control_names="*", generate_quads=True)
+
+    # --- Create quad boundary layers on the wall --- #
+    shell_bl_control = meshing.create_shell_bl_control_(label_expression="wall", part_expression="*fluid-2*")
+    meshing.generate_shell_bl(shell_bl_control, part_expression="*fluid-2*")
+
+    # --- Create zones from labels and of the interfaces, remove the body of influence --- #
+    meshing.create_zones_from_all_labels()
+    meshing.create_interface_zones()
+    meshing.delete_parts("boi")
+elif sweep_mode:
+    # --- Compute volumetric using curvature sizing controls --- #
+    meshing.compute_volumetric([global_curvature, ring_curvature])
+
+    # --- Create prism control on the blade walls and sweep all fluid regions --- #
+    meshing.create_zones_from_all_labels()
+    prism_control = meshing.create_prism_control_(zone_expression="fluid-2", label_expression="wall")
+    meshing.generate_sweep_mesh(**sweep_params, volume_expression="fluid-*", prism_control=prism_control)
+else:
+    # --- Create periodic control of a sector model --- #
+    periodic_control = meshing.create_periodic_control_(n_sectors) if n_sectors > 1 else None
+
+    # --- Compute volumetric using curvature sizing controls --- #
+    meshing.compute_volumetric([global_curvature, ring_curvature], periodic_control)
+
+    # --- Create surface mesh with curvature sizing controls (of the ring only with the restored stator) --- #
+    meshing.create_surface_mesh_with_size_control(part_expression="*fluid-2*" if stator_restored else "*",
+                                                  size_control_names="*")
+
+
+    # --- Create zones from labels and of the interfaces (of the ring only with the restored stator) --- #
+    if stator_restored:
+        meshing.create_zones_from_labels("fluid-2")
+        meshing.create_interface_zones(part_expression="fluid-2")
+    else:
+        meshing.create_zones_from_all_labels()
+        meshing.create_interface_zones()
+
+    # --- Get a ring part --- #
+    part = meshing.get_part_by_name("fluid-2")
+
+    # --- Compute volume on ring --- #
+    meshing.compute_volumes(part_expression=part.name)
+
+    # --- Mesh the other regions of a sector model with the periodic control, so all periodic faces match --- #
+    if periodic_control is not None and not stator_restored:
+        meshing.compute_volumes(part_expression="* !fluid-2 !boi")
+        meshing.generate_volume_control_rest("* !fluid-2 !boi", periodic_control)
+
+    # --- Create volume and prism control --- #
+    volume_control = meshing.create_volume_control_(zone_expression="*fluid-*")
+    prism_control = meshing.create_prism_control_(zone_expression="fluid-2", label_expression="wall")
+
+    # --- Generate prism mesh --- #
+    meshing.generate_volume_mesh(part, prism_control=prism_control, volume_control=volume_control,
+                                 periodic_control=periodic_control)
 
 # -- Display and save results --- #
 meshing.print_all_parts_summary()
 scope = meshing.construct_scope("* !boi")
 meshing.plot(scope=scope)
-meshing.save(save_file_name)
+mesh_key = Meshing.cache_key(airfoil_model, model_type, MeshingParams(),
+                             {**controls, "morph_from": morph_from if morphed else None,
+                              "stator_restored": bool(stator_restored)})
+meshing.save(save_file_name, cache, mesh_key)
+meshing.report_timings(Meshing.load_timings(baseline_timings, model_type))
+meshing.save_timings(save_file_name if meshing.n_procs > 1 else baseline_timings)
+if stator_reuse and not stator_restored:
+    # --- Store the meshed stator for the next designs (deletes the ring from the model) --- #
+    meshing.save_stator(cache, stator_key)
 meshing.exit()
@@ -1,6 +1,8 @@
 from Mesh.Client import PrimeClient
+from Mesh.PrimePool import PrimePool
 from Mesh.meshing.MeshingParams import MeshingParams
 import ansys.meshing.prime as prime
+from pathlib import Path
 from ansys.meshing.prime import Part
 from ansys.meshing.prime.graphics.plotter import PrimePlotter
 from ansys.meshing.prime.core.sizecontrol import SizeControl
@@ -9,15 +11,44 @@ from ansys.meshing.prime.lucid.mesh_util import Mesh
 from ansys.meshing.prime import ScopeDefinition
 from ansys.meshing.prime.core.volumecontrol import VolumeControl
 from ansys.meshing.prime.core.prismcontrol import PrismControl
+from ansys.meshing.prime.autogen.multizonecontrol import MultiZoneControl
+from ansys.meshing.prime.autogen.shellblcontrol import ShellBLControl
+from ansys.meshing.prime.core.periodiccontrol import PeriodicControl
 from Mesh.misc.PATHS import MESH_2D, MESH_3D
+from Mesh.misc.processes import timed, speedups
+from ArtifactCache import ArtifactCache, file_checksum
+from time import perf_counter
+from hashlib import sha256
+from numpy import array, round as round_, int64
+from fnmatch import fnmatch
+import json
 
 
 class Meshing(PrimeClient, MeshingParams):
-    def __init__(self, model_type: str):
+    def __init__(self,
+                 model_type: str,
+                 pool: PrimePool | None = None,
+                 n_procs: int | str | None = None,
+                 memory_budget_gb: float | None = None):
+        """
+        Meshing class constructor.
+
+        Args:
+            model_type (str): 2D or 3D
+            pool (PrimePool | None): pool to lease the Prime client from, a new server is launched if None
+            n_procs (int | str | None): number of Prime processes, "auto" for all available cores
+                                        within the memory budget, None for one process
+            memory_budget_gb (float | None): memory for all processes with "auto", None for no limit
+        """
         self.__validate_model_type(model_type)
 
+        # wall time of every stage in seconds
+        self.timings: dict[str, float] = dict()
+
         # initialize class inheritance
-        PrimeClient.__init__(self)
+        start = perf_counter()
+        PrimeClient.__init__(self, pool, n_procs, memory_budget_gb)
+        self.timings["launch"] = perf_counter() - start
         MeshingParams.__init__(self)
 
         self._model_type = model_type.upper()
@@ -28,8 +59,18 @@ class Meshing(PrimeClient, MeshingParams):
 
     @staticmethod
     def __validate_model_type(model_type):
-        if model_type.upper() != "3D":
-            raise NotImplementedError("Meshing for 2D model is not available.")
+        if model_type.upper() not in ("2D", "3D"):
+            raise ValueError(f"\'model_type\' parameter should be 2D or 3D, got {model_type}")
+
+    @property
+    def results(self) -> Path:
+        """
+        Get directory of results of the model type.
+
+        Return:
+            Path: Mesh/results/mesh_2d or Mesh/results/mesh_3d
+        """
+        return MESH_3D if self._model_type == "3D" else MESH_2D
 
     def __set_global_sizing_params(self):
         """
@@ -44,37 +85,74 @@ class Meshing(PrimeClient, MeshingParams):
             )
         )
 
-    def diagnostic(self):
+    @timed("diagnostic")
+    def diagnostic(self, connect: bool = True):
         """
         Diagnose mode by free edges and intersections.
 
+        Args:
+            connect (bool): whether to connect faces first, not needed by geometry read with topology=True
         """
         print("Diagnosing...")
-        self._mesh_util.connect_faces(tolerance=0.02)
+        if connect:
+            self._mesh_util.connect_faces(tolerance=0.02)
 
         # Diagnostics
+        surf_report = self.__surface_summary(self.construct_scope("*"))
+        print(f"Total number of free edges present is {surf_report.n_free_edges}")
+        print(f"Total number of multi edges present is {surf_report.n_multi_edges}")
+        print(f"Total number of duplicate faces present is {surf_report.n_duplicate_faces}")
+        print(f"Total number intersection present is {surf_report.n_self_intersections}")
+
+    def check_interfaces(self, part_expression: str = "* !boi") -> prime.SurfaceDiagnosticSummaryResults:
+        """
+        Diagnose the imported geometry as it is, without connecting faces first.
+        Interfaces shared in the modeler are imported conformal: without duplicate faces and,
+        in 3D, without free edges.
+
+        Args:
+            part_expression (str): parts to diagnose, the fluid regions by default
+        Return:
+            prime.SurfaceDiagnosticSummaryResults: the diagnostic summary
+        """
+        surf_report = self.__surface_summary(self.construct_scope(part_expression))
+        print(f"Interfaces of {part_expression}: {surf_report.n_free_edges} free edges, "
+              f"{surf_report.n_duplicate_faces} duplicate faces")
+        return surf_report
+
+    def __surface_summary(self, scope: ScopeDefinition) -> prime.SurfaceDiagnosticSummaryResults:
+        """
+        Get the surface diagnostic summary of a scope.
+
+        Args:
+            scope (ScopeDefinition): the scope to diagnose
+        Return:
+            prime.SurfaceDiagnosticSummaryResults: the diagnostic summary
+        """
         surf_diagnostic = prime.SurfaceSearch(self._model)
-        surf_report = surf_diagnostic.get_surface_diagnostic_summary(
+        return surf_diagnostic.get_surface_diagnostic_summary(
             prime.SurfaceDiagnosticSummaryParams(
                 model=self._model,
+                scope=scope,
                 compute_free_edges=True,
                 compute_self_intersections=True,
                 compute_multi_edges=True,
                 compute_duplicate_faces=True
             )
         )
-        print(f"Total number of free edges present is {surf_report.n_free_edges}")
-        print(f"Total number of multi edges present is {surf_report.n_multi_edges}")
-        print(f"Total number of duplicate faces present is {surf_report.n_duplicate_faces}")
-        print(f"Total number intersection present is {surf_report.n_self_intersections}")
 
+    @timed("read geometry")
     def read_geometry(self,
-                      file_name: str):
+                      file_name: str,
+                      topology: bool = False):
         """
         Read geometry from file.
 
         Args:
             file_name (str): name of your file (with extension)
+            topology (bool): whether to import the fluid bodies into one part ("fluid") with their shared topology,
+                             required by generate_sweep_mesh. The regions are kept as volume zones of their names,
+                             the body of influence is imported as a separate part as well
         """
         if not ("." in file_name):
             raise FileExistsError("Add extension to your Geometry name.")
@@ -84,7 +162,23 @@ class Meshing(PrimeClient, MeshingParams):
         path = GEOMETRY_MODEL_3D if self._model_type == "3D" else GEOMETRY_MODEL_2D
         path = path / file_name
 
-        if file_name.split(".")[1] == "dsco":
+        if topology:
+            # one part of all bodies, faces shared by bodies keep the interfaces conformal
+            part = self.__import_cad(path, prime.PartCreationType.MODEL)[0]
+            part.set_suggested_name("fluid")
+
+            # the regions (and the body of influence) as volume zones, their names are kept in the export
+            name_pattern_params = prime.NamePatternParams(self._model)
+            for label in part.get_labels():
+                volumes = part.get_topo_volumes_of_label_name_pattern(label, name_pattern_params)
+                if volumes:
+                    zone = self._model.create_zone(label, prime.ZoneType.VOLUME)
+                    part.add_topo_entities_to_zone(zone.zone_id, volumes)
+
+            # the body of influence as a part of its own, as in the default import, for the boi scopes
+            parts = self.__import_cad(path, prime.PartCreationType.BODY, append=True)
+            self._model.delete_parts([part.id for part in parts if not fnmatch(part.name, "*boi*")])
+        elif file_name.split(".")[1] == "dsco":
             params = prime.ImportCadParams(
                 model=self._model, cad_reader_route=prime.CadReaderRoute.DISCOVERY
             )
@@ -94,6 +188,33 @@ class Meshing(PrimeClient, MeshingParams):
                 file_name=str(path)
             )
 
+    def __import_cad(self,
+                     path: Path,
+                     part_creation_type: prime.PartCreationType,
+                     append: bool = False) -> list[Part]:
+        """
+        Import CAD with shared topology.
+
+        Args:
+            path (Path): the geometry file
+            part_creation_type (prime.PartCreationType): a part per CAD model or per body
+            append (bool): whether to append to the model
+        Return:
+            list[Part]: the imported parts
+        """
+        part_ids = {part.id for part in self._model.parts}
+        params = prime.ImportCadParams(
+            model=self._model,
+            append=append,
+            part_creation_type=part_creation_type,
+            validate_shared_topology=True
+        )
+        if path.suffix == ".dsco":
+            params.cad_reader_route = prime.CadReaderRoute.DISCOVERY
+        prime.FileIO(self._model).import_cad(file_name=str(path), params=params)
+        return [part for part in self._model.parts if part.id not in part_ids]
+
+    @timed("surface mesh")
     def create_surface_mesh_with_size_control(self,
                                               part_expression: str | None = "*",
                                               size_control_names: str = "*",
@@ -180,29 +301,108 @@ class Meshing(PrimeClient, MeshingParams):
 
         return size_control
 
-    def create_zones_from_labels(self, part_name: str = "*", label_name: str = "*"):
+    def create_zones_from_labels(self, part_name: str, label_name: str = "*"):
         """
-        Create zones from single label or whole part.
+        Create face zones from labels of a single part, zonelets of other parts keep their zones.
+        Overlapping labels give one zone of joined names, as in create_zones_from_all_labels,
+        a zone of the same name in other parts (e.g. wall of a restored stator) is reused.
 
         Args:
             part_name (str): part with at least one label
-            label_name (str): label name to create zone
+            label_name (str): label name pattern of the zones
         """
-        if label_name == "*":
-            # get all labels from part
-            part = self._model.get_part_by_name(part_name)
-            labels = [label for label in part.get_labels()]
-            label_expression = ", ".join(labels)
-        else:
-            # or simply use given label name
-            label_expression = label_name
+        part = self.get_part_by_name(part_name)
+        name_pattern_params = prime.NamePatternParams(self._model)
+
+        # labels of every face zonelet of the part
+        labels_of_zonelet: dict[int, list[str]] = dict()
+        for label in part.get_labels():
+            if fnmatch(label, label_name):
+                for zonelet in part.get_face_zonelets_of_label_name_pattern(label, name_pattern_params):
+                    labels_of_zonelet.setdefault(zonelet, []).append(label)
+
+        zonelets_of_zone: dict[str, list[int]] = dict()
+        for zonelet, labels in labels_of_zonelet.items():
+            zonelets_of_zone.setdefault("_".join(labels), []).append(zonelet)
 
         # create zones
-        self._mesh_util.create_zones_from_labels(label_expression=label_expression)
+        zone_names = {self._model.get_zone_name(zone) for other in self._model.parts for zone in other.get_face_zones()}
+        for zone_name, zonelets in zonelets_of_zone.items():
+            zone_id = self._model.get_zone_by_name(zone_name) if zone_name in zone_names \
+                else self._model.create_zone(zone_name, prime.ZoneType.FACE).zone_id
+            part.add_zonelets_to_zone(zone_id, zonelets)
 
     def create_zones_from_all_labels(self):
         self._mesh_util.create_zones_from_labels()
 
+    def create_interface_zones(self,
+                               ring_name: str = "fluid-2",
+                               part_expression: str = "*fluid-*",
+                               center: tuple[float, float] = (0.0, 0.0)):
+        """
+        Create zones of the circles between the ring and the other fluid regions: faces (3D) or edges (2D)
+        without a boundary label, on the outer or the inner circle of the ring.
+        The zones are named interface-outer-<part> and interface-inner-<part>, so Fluent finds them by name.
+        Call it after the zones from labels, the zonelets are moved to the new zones.
+
+        Args:
+            ring_name (str): name of the ring part
+            part_expression (str): part expression of the fluid regions, the ring is always included
+            center (tuple[float, float]): center of the circles
+        """
+        ring = self.get_part_by_name(ring_name)
+        ring_radii = self.__free_zonelet_radii(ring, center)
+        if not ring_radii:
+            print(f"No interfaces of {ring_name}")
+            return
+
+        outer, inner = max(ring_radii.values()), min(ring_radii.values())
+        tolerance = (outer - inner) / 4.0
+
+        zone_type = prime.ZoneType.FACE if self._model_type == "3D" else prime.ZoneType.EDGE
+        part_ids = set(self._model.control_data.get_scope_parts(self.construct_scope(part_expression)))
+        for part_id in part_ids | {ring.id}:
+            part = self._model.get_part(part_id)
+            radii = ring_radii if part_id == ring.id else self.__free_zonelet_radii(part, center)
+            for side, radius in (("outer", outer), ("inner", inner)):
+                zonelets = [zonelet for zonelet, extent in radii.items() if abs(extent - radius) <= tolerance]
+                if zonelets:
+                    zone = self._model.create_zone(f"interface-{side}-{part.name}", zone_type)
+                    part.add_zonelets_to_zone(zone.zone_id, zonelets)
+
+    def __free_zonelet_radii(self, part: Part, center: tuple[float, float]) -> dict[int, float]:
+        """
+        Get face (3D) or edge (2D) zonelets of a part without a boundary label (the region labels do not count)
+        and their extent from the center in the XY plane, the radius for arcs of a circle.
+
+        Args:
+            part (Part): the part
+            center (tuple[float, float]): center of the circles
+        Return:
+            dict[int, float]: extent of every zonelet
+        """
+        name_pattern_params = prime.NamePatternParams(self._model)
+        if self._model_type == "3D":
+            zonelets, of_label = part.get_face_zonelets(), part.get_face_zonelets_of_label_name_pattern
+        else:
+            zonelets, of_label = part.get_edge_zonelets(), part.get_edge_zonelets_of_label_name_pattern
+
+        labeled = set()
+        for label in part.get_labels():
+            if not fnmatch(label, "fluid-*"):
+                labeled.update(of_label(label, name_pattern_params))
+
+        surface_utilities = prime.SurfaceUtilities(self._model)
+        radii = dict()
+        for zonelet in zonelets:
+            if zonelet in labeled:
+                continue
+            box = surface_utilities.get_bounding_box_of_zonelets([zonelet])
+            radii[zonelet] = max(abs(box.xmin - center[0]), abs(box.xmax - center[0]),
+                                 abs(box.ymin - center[1]), abs(box.ymax - center[1]))
+        return radii
+
+    @timed("compute volumes")
     def compute_volumes(self, part_expression: str):
         """
         Compute volumes in parts.
@@ -215,18 +415,31 @@ class Meshing(PrimeClient, MeshingParams):
             create_zones_per_volume=False
         )
 
-    def compute_volumetric(self, size_controls: list[SizeControl]):
+    @timed("volumetric size field")
+    def compute_volumetric(self,
+                           size_controls: list[SizeControl],
+                           periodic_control: PeriodicControl | None = None):
         """
         Compute volumetric using size controls.
 
         Args:
             size_controls (list[SizeControl]): list of size controls to compute volumetric
+            periodic_control (PeriodicControl | None): periodic control of a sector model, the size field is periodic
         """
         # initialize size field
         compute_size = prime.SizeField(self._model)
 
         # initialize params
         vol_sf_params = prime.VolumetricSizeFieldComputeParams(self._model)
+        if periodic_control is not None:
+            params = periodic_control.get_params()
+            vol_sf_params.enable_periodicity = True
+            vol_sf_params.periodic_params = prime.SFPeriodicParams(
+                model=self._model,
+                center=params.center,
+                axis=params.axis,
+                angle=params.angle
+            )
 
         # compute volumetric using size controls
         compute_size.compute_volumetric(
@@ -235,12 +448,14 @@ class Meshing(PrimeClient, MeshingParams):
         )
 
     def create_volume_control_(self,
-                               zone_expression: str) -> VolumeControl:
+                               zone_expression: str,
+                               cell_zonelet_type: prime.CellZoneletType = prime.CellZoneletType.FLUID) -> VolumeControl:
         """
         Create volume control from zones.
 
         Args:
             zone_expression (str): zone expression
+            cell_zonelet_type (prime.CellZoneletType): type of the volumes, DEAD volumes are not meshed
         Return:
             VolumeControl: created volume control
         """
@@ -251,7 +466,7 @@ class Meshing(PrimeClient, MeshingParams):
         volume_control.set_params(
             prime.VolumeControlParams(
                 model=self._model,
-                cell_zonelet_type=prime.CellZoneletType.FLUID,
+                cell_zonelet_type=cell_zonelet_type,
             )
         )
 
@@ -323,10 +538,144 @@ class Meshing(PrimeClient, MeshingParams):
         # return prism control
         return prism_control
 
+    def create_periodic_control_(self,
+                                 n_sectors: int,
+                                 label_expression: str = "periodic-*",
+                                 center: tuple[float, float, float] = (0.0, 0.0, 0.0),
+                                 axis: tuple[float, float, float] = (0.0, 0.0, 1.0)) -> PeriodicControl:
+        """
+        Create rotational periodic control of a sector model (one blade passage).
+        Faces of the periodic-1 and periodic-2 named selections (Geometry sector mode) are meshed as matched pairs.
+
+        Args:
+            n_sectors (int): number of sectors of the full rotor, the periodic angle is 360 / n_sectors
+            label_expression (str): label expression of the periodic faces
+            center (tuple[float, float, float]): point on the rotation axis
+            axis (tuple[float, float, float]): rotation axis
+        Return:
+            PeriodicControl: created periodic control
+        """
+        if not (isinstance(n_sectors, int) and n_sectors > 1):
+            raise ValueError(f"\'n_sectors\' parameter should be int greater than 1, got {n_sectors}")
+
+        # create periodic control
+        periodic_control = self._model.control_data.create_periodic_control()
+
+        # set scope
+        periodic_control.set_scope(
+            prime.ScopeDefinition(
+                model=self._model,
+                evaluation_type=prime.ScopeEvaluationType.LABELS,
+                entity_type=prime.ScopeEntity.FACEZONELETS,
+                label_expression=label_expression
+            )
+        )
+
+        # set rotation params
+        periodic_control.set_params(
+            prime.PeriodicControlParams(
+                model=self._model,
+                center=list(center),
+                axis=list(axis),
+                angle=360.0 / n_sectors
+            )
+        )
+
+        # return periodic control
+        return periodic_control
+
+    def create_shell_bl_control_(self,
+                                 label_expression: str,
+                                 part_expression: str = "*",
+                                 n_layers_local: int | None = None,
+                                 first_height_local: float | None = None,
+                                 growth_rate_local: float | None = None) -> ShellBLControl:
+        """
+        Create shell boundary layer control, the 2D counterpart of the prism control.
+        The layers grow from the labeled edges into the surface mesh of the parts.
+
+        Args:
+            label_expression (str): label expression of the edges, e.g. the wall
+            part_expression (str): part expression of the surfaces with the layers
+            n_layers_local (int): local number of layers
+            first_height_local (float): local first height
+            growth_rate_local (float): local growth rate
+        Return:
+            ShellBLControl: created shell boundary layer control
+        """
+        # create shell boundary layer control
+        shell_bl_control = self._model.control_data.create_shell_bl_control()
+
+        # set edge scope
+        shell_bl_control.set_edge_scope(
+            prime.ScopeDefinition(
+                model=self._model,
+                evaluation_type=prime.ScopeEvaluationType.LABELS,
+                entity_type=prime.ScopeEntity.EDGEZONELETS,
+                part_expression=part_expression,
+                label_expression=label_expression
+            )
+        )
+
+        # set surface scope
+        shell_bl_control.set_surface_scope(
+            prime.ScopeDefinition(
+                model=self._model,
+                entity_type=prime.ScopeEntity.FACEZONELETS,
+                part_expression=part_expression
+            )
+        )
+
+        # set growth params
+        shell_bl_control.set_growth_params(
+            prime.ShellBLControlGrowthParams(
+                model=self._model,
+                offset_type=prime.ShellBLOffsetType.UNIFORM,
+                n_layers=n_layers_local if n_layers_local else self.prism_d_p.n_layers,
+                first_height=first_height_local if first_height_local else self.prism_d_p.first_height,
+                growth_rate=growth_rate_local if growth_rate_local else self.prism_d_p.growth_rate
+            )
+        )
+
+        # return shell boundary layer control
+        return shell_bl_control
+
+    @timed("boundary layers")
+    def generate_shell_bl(self, shell_bl_control: ShellBLControl, part_expression: str = "*"):
+        """
+        Generate shell boundary layers in the surface mesh, quad layers on a quad dominant surface mesh.
+        A failed part is reported and the others are still processed.
+
+        Args:
+            shell_bl_control (ShellBLControl): shell boundary layer control
+            part_expression (str): part expression of the parts with the layers
+        """
+        surfer = prime.Surfer(self._model)
+        for part_id in self._model.control_data.get_scope_parts(self.construct_scope(part_expression)):
+            try:
+                surfer.create_shell_bl_using_controls(
+                    part_id, [shell_bl_control.id], prime.ShellBLParams(model=self._model)
+                )
+            except prime.PrimeRuntimeError as e:
+                print(f"Boundary layers of part {self._model.get_part(part_id).name} failed: {e}")
+
+    def delete_parts(self, part_expression: str):
+        """
+        Delete parts, e.g. the body of influence before export of a 2D mesh.
+
+        Args:
+            part_expression (str): part expression of the deleted parts
+        """
+        part_ids = self._model.control_data.get_scope_parts(self.construct_scope(part_expression))
+        if len(part_ids):
+            self._model.delete_parts(list(part_ids))
+
+    @timed("volume mesh")
     def generate_volume_mesh(self,
                              part: Part,
                              prism_control: PrismControl = None,
-                             volume_control: VolumeControl = None):
+                             volume_control: VolumeControl = None,
+                             periodic_control: PeriodicControl = None):
         """
         Generate volume mesh.
 
@@ -334,6 +683,7 @@ class Meshing(PrimeClient, MeshingParams):
             prism_control (PrismControl): prism control to generate volume mesh
             volume_control (VolumeControl): volume control to generate volume mesh
             part (Part): part to generate volume mesh
+            periodic_control (PeriodicControl): periodic control of a sector model, the periodic faces get matched mesh
         """
         # create AutoMesh object
         volume_mesh = prime.AutoMesh(self._model)
@@ -345,26 +695,155 @@ class Meshing(PrimeClient, MeshingParams):
             size_field_type=prime.SizeFieldType.VOLUMETRIC,
             volume_fill_type=prime.VolumeFillType.TET,
             volume_control_ids=[volume_control.id] if volume_control else None,
+            periodic_control_ids=[periodic_control.id] if periodic_control else None
         )
 
         # generate mesh
         volume_mesh.mesh(part.id, auto_mesh_param)
 
-    def generate_volume_control_rest(self):
+    @timed("volume mesh")
+    def generate_sweep_mesh(self,
+                            span: float,
+                            n_layers: int,
+                            volume_expression: str = "fluid-*",
+                            part_expression: str = "* !boi",
+                            prism_control: PrismControl | None = None) -> MultiZoneControl:
+        """
+        Generate swept (hex/prism) volume mesh of an extruded model with MultiZone.
+        The cap surface is meshed with inflation from the prism control and swept through the span
+        in n_layers layers. Requires geometry read with topology=True, so interfaces between the regions are conformal.
+        Volumes which can not be swept are filled with tetrahedrons. The body of influence in the topology part
+        is not meshed. A failed part is reported and the others are still meshed.
+
+        Args:
+            span (float): extrusion distance of the model
+            n_layers (int): number of layers in the sweep direction
+            volume_expression (str): label expression of the swept volumes
+            part_expression (str): part expression of the meshed parts
+            prism_control (PrismControl | None): prism control of the inflation at the walls
+        Return:
+            MultiZoneControl: created MultiZone control
+        """
+        if not (isinstance(n_layers, int) and n_layers > 0):
+            raise ValueError(f"\'n_layers\' parameter should be positive int, got {n_layers}")
+        if not span > 0:
+            raise ValueError(f"\'span\' parameter should be positive, got {span}")
+
+        # create MultiZone control on volumes
+        multi_zone = self._model.control_data.create_multi_zone_control()
+        multi_zone.set_volume_scope(
+            prime.ScopeDefinition(
+                model=self._model,
+                evaluation_type=prime.ScopeEvaluationType.LABELS,
+                entity_type=prime.ScopeEntity.VOLUME,
+                label_expression=volume_expression
+            )
+        )
+
+        # set sweep params, the layer size gives n_layers over the span
+        multi_zone.set_sweep_mesh_params(
+            prime.MultiZoneSweepMeshParams(
+                model=self._model,
+                sweep_mesh_size=span / n_layers,
+                n_divisions=n_layers,
+                sweep_type=prime.SweepType.STANDARD
+            )
+        )
+
+        # respect the curvature sizing of the cap surface
+        multi_zone.set_multi_zone_sizing_params(
+            prime.MultiZoneSizingParams(
+                model=self._model,
+                min_size=self.global_s_d_p.min,
+                max_size=self.global_s_d_p.max,
+                growth_rate=self.global_s_d_p.growth_rate,
+                use_volumetric_size_field=True
+            )
+        )
+
+        # the body of influence only guides the sizes, its volume is dead
+        boi_volumes = self.create_volume_control_("boi", prime.CellZoneletType.DEAD)
+
+        # set volume mesh params
+        auto_mesh_param = prime.AutoMeshParams(
+            model=self._model,
+            prism_control_ids=[prism_control.id] if prism_control else None,
+            size_field_type=prime.SizeFieldType.VOLUMETRIC,
+            volume_fill_type=prime.VolumeFillType.TET,
+            multi_zone_control_ids=[multi_zone.id],
+            volume_control_ids=[boi_volumes.id]
+        )
+
+        # generate mesh
+        volume_mesh = prime.AutoMesh(self._model)
+        name_pattern_params = prime.NamePatternParams(self._model)
+        for part_id in self._model.control_data.get_scope_parts(self.construct_scope(part_expression)):
+            try:
+                volume_mesh.mesh(part_id, auto_mesh_param)
+            except prime.PrimeRuntimeError as e:
+                print(f"Sweep mesh of part {self._model.get_part(part_id).name} failed: {e}")
+
+            # remove the surface mesh of the body of influence, it is not a boundary of the fluid
+            boi_faces = self._model.get_part(part_id).get_topo_faces_of_label_name_pattern("boi", name_pattern_params)
+            if boi_faces:
+                self._model.topo_data.delete_mesh_on_topo_faces(boi_faces, prime.DeleteMeshParams(model=self._model))
+
+        return multi_zone
+
+    @timed("volume mesh")
+    def generate_volume_control_rest(self,
+                                     part_expression: str = "* !fluid-2 !boi",
+                                     periodic_control: PeriodicControl | None = None) -> dict[str, float]:
+        """
+        Generate tetrahedral volume mesh of all parts in the scope and print time of every part.
+        The parts are meshed in one sequence of calls with shared params, the largest surface mesh first,
+        so a failed small part does not delay the large ones. Prime serializes calls of one client,
+        so parts are not meshed concurrently, in distributed mode (n_procs) every part uses all processes.
+
+        Args:
+            part_expression (str): part expression of the parts to mesh
+            periodic_control (PeriodicControl | None): periodic control of a sector model, the periodic faces
+                                                       of every part get matched mesh
+        Return:
+            dict[str, float]: seconds of every meshed part
+        """
         volume_mesh = prime.AutoMesh(self._model)
 
         # set volume mesh params
         auto_mesh_param = prime.AutoMeshParams(
             model=self._model,
-            # prism_control_ids=[prism_control.id],
             size_field_type=prime.SizeFieldType.VOLUMETRIC,
             volume_fill_type=prime.VolumeFillType.TET,
-            # volume_control_ids=[volume_control.id],
+            periodic_control_ids=[periodic_control.id] if periodic_control else None
         )
 
+        # get parts in the scope
+        part_ids = self._model.control_data.get_scope_parts(self.construct_scope(part_expression))
+        parts = [self._model.get_part(part_id) for part_id in part_ids]
+        if not parts:
+            print(f"No parts match '{part_expression}'")
+            return dict()
+
+        # the largest parts first
+        summary_params = prime.PartSummaryParams(model=self._model, print_mesh=False)
+        parts.sort(key=lambda p: p.get_summary(summary_params).n_faces, reverse=True)
+
         # generate mesh
-        for part in self._model.parts:
-            volume_mesh.mesh(part.id, auto_mesh_param) if part.name not in ('fluid-2', 'boi') else None
+        part_timings = dict()
+        for part in parts:
+            start = perf_counter()
+            try:
+                volume_mesh.mesh(part.id, auto_mesh_param)
+            except prime.PrimeRuntimeError as e:
+                print(f"Volume mesh of part {part.name} failed: {e}")
+            part_timings[part.name] = perf_counter() - start
+
+        # print report
+        print(f"Volume mesh of {len(parts)} part(s):")
+        for name, elapsed in part_timings.items():
+            print(f"  {name}: {elapsed:.2f} s")
+
+        return part_timings
 
     def set_scope(self,
                   size_control: SizeControl,
@@ -423,14 +902,267 @@ class Meshing(PrimeClient, MeshingParams):
         """
         return self._model.get_part_by_name(part_name)
 
-    def save(self, file_name: str):
+    @staticmethod
+    def cache_key(geometry_file: str,
+                  model_type: str,
+                  params: MeshingParams,
+                  controls: dict | None = None) -> str:
+        """
+        Get the artifact cache key of a mesh: the geometry content, meshing params and controls.
+        It can be computed before the Prime client is launched.
+
+        Args:
+            geometry_file (str): name of your geometry file (with extension), as in read_geometry
+            model_type (str): 2D or 3D
+            params (MeshingParams): meshing params, e.g. MeshingParams() for defaults
+            controls (dict | None): params of all controls created in addition to the defaults
+        Return:
+            str: the key
+        """
+        path = GEOMETRY_MODEL_3D if model_type.upper() == "3D" else GEOMETRY_MODEL_2D
+        return ArtifactCache.key("mesh", {
+            "geometry": file_checksum(path / geometry_file),
+            "model_type": model_type.upper(),
+            "params": params.get_params(),
+            "controls": controls
+        })
+
+    @staticmethod
+    def restore(cache: ArtifactCache, key: str, model_type: str = "3D") -> Path | None:
+        """
+        Restore a saved mesh from the artifact cache, e.g. before the Prime client is launched.
+        Results will be restored in Mesh/results/mesh_2d or Mesh/results/mesh_3d under the saved name.
+
+        Args:
+            cache (ArtifactCache): the cache
+            key (str): key of the mesh, see cache_key
+            model_type (str): 2D or 3D
+        Return:
+            Path | None: the restored mesh file, None on a cache miss
+        """
+        restored = cache.fetch(key, ("msh.h5",), MESH_3D if model_type.upper() == "3D" else MESH_2D)
+        if restored is None:
+            return None
+
+        print(f"Mesh restored from cache: {restored['msh.h5']}")
+        return restored["msh.h5"]
+
+    def stator_key(self,
+                   stator_expression: str = "* !*fluid-2*",
+                   controls: dict | None = None) -> str:
+        """
+        Get the artifact cache key of the stator mesh: the faceted geometry of the stator parts
+        (all parts except the rotor ring), meshing params and controls.
+        Call it after read_geometry, before the parts are meshed.
+
+        Args:
+            stator_expression (str): part expression of the stator parts
+            controls (dict | None): params of all controls created in addition to the defaults
+        Return:
+            str: the key
+        """
+        part_ids = self._model.control_data.get_scope_parts(self.construct_scope(stator_expression))
+        results = prime.MeshInfo(self._model).get_face_and_edge_connectivity(
+            part_ids, prime.FaceAndEdgeConnectivityParams(model=self._model)
+        )
+
+        # hash node coordinates and connectivity of faces of every stator part
+        digest = sha256()
+        for part_id, faces in zip(results.part_ids, results.face_connectivity_result_per_part):
+            digest.update(self._model.get_part(part_id).name.encode())
+            digest.update((round_(array(faces.node_coords, dtype=float), 9) + 0.0).tobytes())
+            digest.update(array(faces.face_list, dtype=int64).tobytes())
+
+        return ArtifactCache.key("stator", {
+            "geometry": digest.hexdigest(),
+            "model_type": self._model_type,
+            "params": self.get_params(),
+            "controls": controls
+        })
+
+    @timed("restore stator")
+    def restore_stator(self,
+                       cache: ArtifactCache,
+                       key: str,
+                       stator_expression: str = "* !*fluid-2*") -> bool:
+        """
+        Replace the stator parts by their cached mesh, so only the rotor ring is meshed.
+        The ring and the stator meshes do not match at the circles, they are joined
+        by the non-conformal interfaces in Fluent.
+
+        Args:
+            cache (ArtifactCache): the cache
+            key (str): key of the stator mesh, see stator_key
+            stator_expression (str): part expression of the stator parts
+        Return:
+            bool: True if the stator mesh was restored, False on a cache miss
+        """
+        restored = cache.fetch(key, ("pmdat",), self.results / "stator")
+        if restored is None:
+            return False
+
+        self.delete_parts(stator_expression)
+        prime.FileIO(self._model).read_pmdat(
+            file_name=str(restored["pmdat"]),
+            file_read_params=prime.FileReadParams(model=self._model, append=True)
+        )
+
+        print(f"Stator mesh restored from cache: {restored['pmdat']}")
+        return True
+
+    def save_stator(self,
+                    cache: ArtifactCache,
+                    key: str,
+                    stator_expression: str = "* !*fluid-2*"):
+        """
+        Store the meshed stator parts in the artifact cache, for restore_stator of the next designs.
+        All other parts are deleted, so it should be the last step, after save.
+
+        Args:
+            cache (ArtifactCache): the cache
+            key (str): key of the stator mesh, see stator_key
+            stator_expression (str): part expression of the stator parts
+        """
+        stator_ids = set(self._model.control_data.get_scope_parts(self.construct_scope(stator_expression)))
+        other_ids = [part.id for part in self._model.parts if part.id not in stator_ids]
+        if other_ids:
+            self._model.delete_parts(other_ids)
+
+        directory = self.results / "stator"
+        directory.mkdir(exist_ok=True)
+        path = directory / "stator.pmdat"
+        prime.FileIO(self._model).write_pmdat(
+            file_name=str(path),
+            file_write_params=prime.FileWriteParams(model=self._model)
+        )
+        cache.put(key, {"pmdat": path})
+
+    def __skewness(self, part: Part, quality_limit: float) -> prime.VolumeQualityResultsPart:
+        """
+        Get the skewness summary of the cells of a part.
+
+        Return:
+            VolumeQualityResultsPart: number of cells above the limit and the maximum skewness
+        """
+        params = prime.VolumeQualitySummaryParams(
+            model=self._model,
+            scope=self.construct_scope(part.name),
+            cell_quality_measures=[prime.CellQualityMeasure.SKEWNESS],
+            quality_limit=[quality_limit]
+        )
+        results = prime.VolumeSearch(self._model).get_volume_quality_summary(params)
+        return results.quality_results_part[0]
+
+    @timed("morph")
+    def morph_mesh(self,
+                   cache: ArtifactCache,
+                   base_key: str,
+                   file_name: str,
+                   ring_name: str = "fluid-2",
+                   label_expression: str = "wall",
+                   quality_limit: float = 0.95,
+                   morphable_layers: int | None = None) -> bool:
+        """
+        Morph the ring mesh of a base design (e.g. a few degrees of other pitch) to the blades of a new geometry,
+        instead of meshing it again. The wall faces are matched to the new blades and the interior nodes
+        follow a smooth displacement field, so the prism layers move with the wall and the mesh topology
+        is kept. The ring is checked for skewness afterwards.
+        Call it before read_geometry, on a failure the model is reset (parts, zones, controls and size fields)
+        for a full remesh.
+
+        Args:
+            cache (ArtifactCache): the cache
+            base_key (str): key of the saved base mesh, see cache_key
+            file_name (str): name of the new geometry file (with extension), as in read_geometry
+            ring_name (str): name of the morphed part
+            label_expression (str): label expression of the matched blade faces
+            quality_limit (float): maximum skewness of the morphed cells
+            morphable_layers (int | None): number of cell layers around the blades which are morphed,
+                                           None for the Prime default
+        Return:
+            bool: True if the mesh was morphed, False if the base mesh is not cached or the quality degraded
+        """
+        restored = cache.fetch(base_key, ("pmdat",), self.results / "morph")
+        if restored is None:
+            print("Base mesh is not cached, remeshing...")
+            return False
+
+        print("Morphing...")
+        morphed = False
+        try:
+            prime.FileIO(self._model).read_pmdat(
+                file_name=str(restored["pmdat"]),
+                file_read_params=prime.FileReadParams(model=self._model, append=False)
+            )
+            ring = self.get_part_by_name(ring_name)
+            before = self.__skewness(ring, quality_limit)
+
+            # read the new geometry next to the mesh, its blade faces are the targets
+            part_ids = {part.id for part in self._model.parts}
+            path = (GEOMETRY_MODEL_3D if self._model_type == "3D" else GEOMETRY_MODEL_2D) / file_name
+            self._mesh_util.read(file_name=str(path), append=True)
+            target_parts = [part for part in self._model.parts if part.id not in part_ids]
+            target_ring = next((part for part in target_parts if fnmatch(part.name, f"*{ring_name}*")), None)
+
+            if target_ring is None:
+                print(f"No part of {ring_name} in {file_name}, remeshing...")
+            else:
+                name_params = prime.NamePatternParams(model=self._model)
+                match_pair = prime.MatchPair(
+                    model=self._model,
+                    source_surfaces=ring.get_face_zonelets_of_label_name_pattern(label_expression, name_params),
+                    target_surfaces=target_ring.get_face_zonelets_of_label_name_pattern(label_expression,
+                                                                                        name_params),
+                    target_type=prime.MatchPairTargetType.FACEZONELET
+                )
+                bc_params = prime.MorphBCParams(
+                    model=self._model,
+                    morph_region_method=prime.BCsVolumetricModality.ALL
+                )
+                if morphable_layers is not None:
+                    bc_params.morphable_layers = morphable_layers
+
+                prime.Morpher(self._model).match_morph(
+                    ring.id, [match_pair], prime.MatchMorphParams(model=self._model), bc_params,
+                    prime.MorphSolveParams(model=self._model)
+                )
+                self._model.delete_parts([part.id for part in target_parts])
+
+                # fall back to remeshing if the morphed cells are worse than the base ones
+                after = self.__skewness(ring, quality_limit)
+                if after.n_found > before.n_found:
+                    print(f"Morphing degraded quality: {after.n_found} cells above skewness {quality_limit} "
+                          f"(base mesh {before.n_found}), max skewness {after.max_quality:.3f}, remeshing...")
+                else:
+                    print(f"Mesh morphed, max skewness {before.max_quality:.3f} -> {after.max_quality:.3f}")
+                    morphed = True
+        except prime.PrimeRuntimeError as e:
+            print(f"Morphing failed: {e}, remeshing...")
+
+        if not morphed:
+            # nothing of the base mesh is left for the full remesh
+            PrimePool.reset(self.client)
+        return morphed
+
+    @timed("save")
+    def save(self,
+             file_name: str,
+             cache: ArtifactCache | None = None,
+             key: str | None = None):
         """
         Save mesh into .msh and .cas files.
-        Results will be saved in Mesh/results/mesh_3d.
+        Results will be saved in Mesh/results/mesh_2d or Mesh/results/mesh_3d.
+        A 2D model is exported as a planar mesh, which Fluent reads in 2D mode.
+        With an artifact cache the mesh is stored in it after export.
 
         Args:
             file_name (str): raw file name (without extension)
+            cache (ArtifactCache | None): the artifact cache
+            key (str | None): key of the mesh, see cache_key, required with the cache
         """
+        if cache is not None and key is None:
+            raise ValueError("'key' parameter is required with the cache")
+
         # set export mesh fluent params
         params = prime.ExportFluentMeshingMeshParams(
             model=self._model,
@@ -439,10 +1171,19 @@ class Meshing(PrimeClient, MeshingParams):
 
         # export to mesh
         print("Exporting to msh.h5 file...")
+        path = self.results / f"{file_name}.msh.h5"
         prime.FileIO(self._model).export_fluent_meshing_mesh(
-            file_name=str(MESH_3D / f"{file_name}.msh.h5"),
+            file_name=str(path),
             export_fluent_mesh_params=params
         )
+        if cache is not None:
+            # the Prime model is stored too, it is the base mesh of morph_mesh
+            model_path = self.results / f"{file_name}.pmdat"
+            prime.FileIO(self._model).write_pmdat(
+                file_name=str(model_path),
+                file_write_params=prime.FileWriteParams(model=self._model)
+            )
+            cache.put(key, {"msh.h5": path, "pmdat": model_path})
 
         # set export case fluent params
         params = prime.ExportFluentCaseParams(
@@ -458,3 +1199,52 @@ class Meshing(PrimeClient, MeshingParams):
                     print_mesh=True
                 )
                 print(part.get_summary(params=params))
+
+    def report_timings(self, baseline: dict[str, float] | None = None) -> dict[str, float]:
+        """
+        Print wall time of every stage and its speedup against a baseline, e.g. a single process run.
+
+        Args:
+            baseline (dict[str, float] | None): seconds of every stage of the baseline, see load_timings
+        Return:
+            dict[str, float]: speedup of every stage present in the baseline
+        """
+        stage_speedups = speedups(self.timings, baseline) if baseline is not None else dict()
+
+        print(f"Meshing stages with {self.n_procs} Prime process(es):")
+        for stage, elapsed in self.timings.items():
+            speedup = f" (speedup {stage_speedups[stage]:.2f}x)" if stage in stage_speedups else ""
+            print(f"  {stage}: {elapsed:.2f} s{speedup}")
+        print(f"  total: {sum(self.timings.values()):.2f} s")
+
+        return stage_speedups
+
+    def save_timings(self, file_name: str) -> Path:
+        """
+        Save wall time of every stage, so it can be used as a baseline of another run.
+        Results will be saved in Mesh/results/mesh_2d or Mesh/results/mesh_3d.
+
+        Args:
+            file_name (str): raw file name (without extension)
+        Return:
+            Path: the saved file
+        """
+        path = self.results / f"{file_name}.timings.json"
+        path.write_text(json.dumps({"n_procs": self.n_procs, "timings": self.timings}, indent=1))
+        return path
+
+    @staticmethod
+    def load_timings(file_name: str, model_type: str = "3D") -> dict[str, float] | None:
+        """
+        Load wall time of every stage saved by save_timings.
+
+        Args:
+            file_name (str): raw file name (without extension)
+            model_type (str): 2D or 3D
+        Return:
+            dict[str, float] | None: seconds of every stage, None if not saved
+        """
+        path = (MESH_3D if model_type.upper() == "3D" else MESH_2D) / f"{file_name}.timings.json"
+        if not path.is_file():
+            return None
+        return json.loads(path.read_text())["timings"]
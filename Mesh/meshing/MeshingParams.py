@@ -73,6 +73,21 @@ class MeshingParams:
         """
         return self._prism_d_p
 
+    def get_params(self) -> dict:
+        """
+        Get all default params, e.g. to hash them.
+
+        Return:
+            dict: the params dataclasses by name
+        """
+        return {
+            "mesh_util": self._mesh_util_d_p,
+            "global_sizing": self._global_s_d_p,
+            "curvature_sizing": self._curvature_s_d_p,
+            "boi_sizing": self._boi_s_d_p,
+            "prism": self._prism_d_p
+        }
+
     def set_mesh_util_d_p(self,
                           min_size: float | None = None,
                           max_size: float | None = None):
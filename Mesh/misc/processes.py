@@ -0,0 +1,84 @@
+import os
+from functools import wraps
+from time import perf_counter
+
+"""
+Functions for choosing the number of Prime processes and timing meshing stages.
+"""
+
+
+def available_cores() -> int:
+    """
+    Get the number of cores available to this process.
+
+    Return:
+        int: number of cores
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def resolve_n_procs(n_procs: int | str | None,
+                    memory_budget_gb: float | None = None,
+                    memory_per_process_gb: float = 4.0) -> int | None:
+    """
+    Resolve the requested number of Prime processes.
+
+    Args:
+        n_procs (int | str | None): number of processes, "auto" to use all available cores
+                                    within the memory budget, None for a single process (normal mode)
+        memory_budget_gb (float | None): memory for all processes, None for no limit
+        memory_per_process_gb (float): expected memory of one process
+    Return:
+        int | None: number of processes, None for normal mode
+
+    Raise:
+        ValueError: n_procs is not positive or "auto"
+    """
+    if n_procs is None:
+        return None
+    if n_procs == "auto":
+        n_procs = available_cores()
+        if memory_budget_gb is not None:
+            n_procs = min(n_procs, int(memory_budget_gb // memory_per_process_gb))
+        n_procs = max(n_procs, 1)
+    elif not isinstance(n_procs, int) or not n_procs > 0:
+        raise ValueError(f"\'n_procs\' parameter should be positive int or \"auto\", got {n_procs}")
+
+    # one process runs in normal mode
+    return n_procs if n_procs > 1 else None
+
+
+def timed(stage: str):
+    """
+    Decorator recording the wall time of a method in its instance 'timings' dictionary.
+    Calls of the same stage are summed.
+
+    Args:
+        stage (str): name of the stage
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.timings[stage] = self.timings.get(stage, 0.0) + perf_counter() - start
+        return wrapper
+    return decorator
+
+
+def speedups(timings: dict[str, float], baseline: dict[str, float]) -> dict[str, float]:
+    """
+    Compute speedup of every stage against a baseline, e.g. a single process run.
+
+    Args:
+        timings (dict[str, float]): seconds of every stage
+        baseline (dict[str, float]): seconds of every stage of the baseline
+    Return:
+        dict[str, float]: speedup of every stage present in both
+    """
+    return {stage: baseline[stage] / elapsed for stage, elapsed in timings.items()
+            if stage in baseline and elapsed > 0}